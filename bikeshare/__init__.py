@@ -0,0 +1 @@
+"""Lapisan data untuk Bike Sharing Dashboard."""
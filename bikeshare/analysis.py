@@ -0,0 +1,87 @@
+"""API analisis tanpa Streamlit: memuat kubus, metrik overview, dan tabel grafik.
+
+Dipakai bersama oleh dashboard dan ekspor laporan headless
+(``bikeshare.report``) sehingga keduanya menghasilkan angka yang sama.
+Ringkasan kecil (rentang tanggal dan metrik tanpa filter) disimpan di
+direktori cache agar dashboard bisa menampilkan metrik pertama sebelum
+kubus dimuat.
+"""
+import datetime
+import json
+import os
+
+from .charts import CHARTS
+from .cube import DAY_DIMENSIONS, HOUR_DIMENSIONS, build_cube, mean, total
+from .filters import select, sort_by_date
+from .ingest import load_cube
+from .loader import CACHE_DIR, load_table
+from .parallel import query_charts
+
+SUMMARY_PATH = CACHE_DIR / "summary.json"
+
+
+def load_cubes(allow_remote=False):
+    """Kubus harian dan per jam dari data lokal (cache kolumnar)."""
+    # Data per jam di-ingest per potongan sehingga tabel penuhnya tidak
+    # pernah dimuat ke memori
+    day_cube = sort_by_date(build_cube(load_table("day", allow_remote=allow_remote), DAY_DIMENSIONS))
+    hour_cube = load_cube("hour", HOUR_DIMENSIONS, allow_remote=allow_remote)
+    return day_cube, hour_cube
+
+
+def filter_cubes(day_cube, hour_cube, filter_state):
+    """Potongan kedua kubus menurut ``FilterState``."""
+    return select(day_cube, *filter_state), select(hour_cube, *filter_state)
+
+
+def overview(day_cube):
+    """Metrik overview dari kubus harian (yang sudah difilter)."""
+    return {
+        "cnt": total(day_cube, 'cnt'),
+        "mean": mean(day_cube, 'cnt'),
+        "casual": total(day_cube, 'casual'),
+        "registered": total(day_cube, 'registered'),
+    }
+
+
+def analyze(day_cube, hour_cube, filter_state, chart_ids=None, executor=None):
+    """Metrik overview dan tabel hasil query setiap grafik untuk satu konfigurasi filter."""
+    filtered_day, filtered_hour = filter_cubes(day_cube, hour_cube, filter_state)
+    tables = query_charts(list(CHARTS) if chart_ids is None else chart_ids, filtered_day, filtered_hour, executor)
+    return overview(filtered_day), tables
+
+
+def summarize(day_cube):
+    """Ringkasan untuk paint pertama: rentang tanggal dan metrik overview tanpa filter."""
+    return {
+        "start": day_cube["dteday"].min().date(),
+        "end": day_cube["dteday"].max().date(),
+        "overview": overview(day_cube),
+    }
+
+
+def write_summary(version, summary, path=SUMMARY_PATH):
+    """Menyimpan ``summary`` untuk versi data ``version`` secara atomik; mengembalikan ``summary``."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.tmp-{os.getpid()}")
+        with open(tmp, "w") as f:
+            json.dump({"version": version, **summary}, f, default=str)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+    return summary
+
+
+def read_summary(version, path=SUMMARY_PATH):
+    """Ringkasan tersimpan, atau ``None`` jika tidak ada atau dibuat dari versi data lain."""
+    try:
+        with open(path) as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if stored.pop("version", None) != json.loads(json.dumps(version)):
+        return None
+    stored["start"] = datetime.date.fromisoformat(stored["start"])
+    stored["end"] = datetime.date.fromisoformat(stored["end"])
+    return stored
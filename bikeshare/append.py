@@ -0,0 +1,214 @@
+"""Mode append: menambahkan hari/jam baru tanpa menghitung ulang semuanya.
+
+Record baru divalidasi harus melanjutkan ``instant`` dan ``dteday`` dari
+data yang ada, lalu ditambahkan ke CSV, ke cache kolumnar (file biner per
+kolom cukup di-append), ke cache kubus per jam, ke sampel mode perkiraan,
+ke artefak model prakiraan, dan ke laporan kualitas data. Semua langkah bekerja sebanding dengan jumlah
+baris baru.
+
+Penggunaan dari command line::
+
+    python -m bikeshare.append --day hari_baru.csv --hour jam_baru.csv
+"""
+import argparse
+import io
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from . import forecast, quality
+from .approx import DAY_STRATA, HOUR_STRATA, extend_sample
+from .cube import DAY_DIMENSIONS, HOUR_DIMENSIONS, MEASURES, build_cube, merge_cubes
+from .loader import (CACHE_DIR, DTYPES, file_signature, load_columns, read_meta, source_path, write_columns,
+                     write_meta)
+
+
+class AppendError(ValueError):
+    """Record baru tidak melanjutkan data yang sudah ada."""
+
+
+def _normalize(name, records):
+    """Menyamakan kolom dan dtype record baru dengan skema CSV."""
+    columns = list(pd.read_csv(source_path(name), nrows=0).columns)
+    missing = [col for col in columns if col not in records.columns]
+    if missing:
+        raise AppendError(f"{name}: kolom tidak ada: {', '.join(missing)}")
+    records = records[columns].copy()
+    records["dteday"] = pd.to_datetime(records["dteday"]).astype("datetime64[ns]")
+    return records.astype(DTYPES[name])
+
+
+def last_record(name, block=4096):
+    """Baris terakhir CSV ``name`` (dtype seperti record baru), atau ``None`` jika belum ada data.
+
+    Hanya ekor file yang dibaca sehingga biayanya tidak bergantung pada
+    ukuran dataset.
+    """
+    with open(source_path(name), "rb") as f:
+        header = f.readline()
+        end = start = f.seek(0, os.SEEK_END)
+        # Mundur per blok sampai ekor memuat satu baris utuh setelah header
+        while True:
+            start = max(len(header), start - block)
+            f.seek(start)
+            lines = f.read(end - start).strip().splitlines()
+            if len(lines) > 1 or start == len(header):
+                break
+    if not lines:
+        return None
+    return _normalize(name, pd.read_csv(io.BytesIO(header + lines[-1]))).iloc[-1]
+
+
+def validate(name, last, records):
+    """Memastikan ``records`` melanjutkan record terakhir ``last`` tanpa celah maupun tumpang tindih."""
+    if records.empty:
+        return
+    instant = records["instant"].to_numpy()
+    if (np.diff(instant) != 1).any():
+        raise AppendError(f"{name}: instant baru harus berurutan tanpa celah")
+
+    keys = ["dteday", "hr"] if name == "hour" else ["dteday"]
+    order = records[keys].apply(tuple, axis=1)
+    if not order.is_monotonic_increasing or order.duplicated().any():
+        raise AppendError(f"{name}: {'/'.join(keys)} baru harus naik tegas")
+
+    if last is None:
+        return
+    if instant[0] != last["instant"] + 1:
+        raise AppendError(f"{name}: instant baru harus dimulai dari {last['instant'] + 1}, bukan {instant[0]}")
+    if order.iloc[0] <= tuple(last[key] for key in keys):
+        raise AppendError(f"{name}: {'/'.join(keys)} baru harus setelah record terakhir")
+
+
+def _append_csv(name, records):
+    path = source_path(name)
+    with open(path, "rb") as f:
+        f.seek(max(0, path.stat().st_size - 2))
+        tail = f.read()
+    newline = "\r\n" if tail.endswith(b"\r\n") else "\n"
+    text = records.to_csv(header=False, index=False, date_format="%Y-%m-%d", lineterminator=newline)
+    with open(path, "a", newline="") as f:
+        if tail and not tail.endswith(b"\n"):
+            f.write(newline)
+        f.write(text)
+
+
+def _drop_cache(cache_name):
+    """Menghapus cache agar dibangun ulang dari CSV saat dibutuhkan."""
+    shutil.rmtree(CACHE_DIR / cache_name, ignore_errors=True)
+
+
+def _append_columns(cache_name, meta, records, expected, source):
+    """Menambahkan baris ke cache kolumnar; file biner cukup di-append.
+
+    Hanya jika cache dibangun dari CSV sebelum append (``meta["source"] ==
+    expected``); jika tidak, cache dihapus dan ``None`` dikembalikan.
+    """
+    if meta["source"] != expected:
+        _drop_cache(cache_name)
+        return None
+    directory = CACHE_DIR / cache_name
+    for col, dtype in meta["columns"]:
+        values = np.ascontiguousarray(records[col].to_numpy(dtype=np.dtype(dtype)))
+        with open(directory / f"{col}.bin", "ab") as f:
+            f.write(values.tobytes())
+    meta = dict(meta, rows=meta["rows"] + len(records), source=source)
+    write_meta(cache_name, meta)
+    return meta
+
+
+def _update_cube(records, previous, csv_signature):
+    """Memperbarui cache kubus per jam dengan kubus parsial dari baris baru.
+
+    ``previous`` adalah signature CSV sebelum append; kubus yang dibangun
+    dari isi CSV lain (mis. CSV diubah di luar mode append) dihapus.
+    """
+    cache_name = "hour_cube"
+    meta = read_meta(cache_name)
+    if meta is None or meta["source"]["dimensions"] != HOUR_DIMENSIONS:
+        # Belum ada cache kubus; akan dibangun saat pertama dibutuhkan
+        return
+    expected = dict(meta["source"], csv=previous)
+    if meta["source"] != expected:
+        _drop_cache(cache_name)
+        return
+    source = dict(meta["source"], csv=csv_signature)
+    part = build_cube(records, HOUR_DIMENSIONS)
+
+    cube = load_columns(cache_name, meta)
+    lo = int(np.searchsorted(cube["dteday"].to_numpy(), part["dteday"].to_numpy()[0], side="left"))
+    tail = cube.iloc[lo:]
+    overlap = tail.merge(part[HOUR_DIMENSIONS], on=HOUR_DIMENSIONS, how="inner")
+    if overlap.empty:
+        _append_columns(cache_name, meta, part, expected, source)
+    else:
+        # Sel terakhir ikut berubah: tulis ulang kubus secara atomik
+        merged = merge_cubes([cube, part], HOUR_DIMENSIONS)
+        write_columns(cache_name, merged[HOUR_DIMENSIONS + MEASURES + ["n"]], source)
+
+
+def _update_sample(name, records, previous, csv_signature):
+    """Memperbarui sampel mode perkiraan dengan sel kubus dari baris baru (reservoir per strata).
+
+    Seperti ``_update_cube``, sampel dari isi CSV lain dihapus dan akan
+    ditarik ulang saat dibutuhkan.
+    """
+    cache_name = f"{name}_sample"
+    meta = read_meta(cache_name)
+    if meta is None:
+        return
+    if meta["source"] != dict(meta["source"], csv=previous):
+        _drop_cache(cache_name)
+        return
+    dimensions, strata = (HOUR_DIMENSIONS, HOUR_STRATA) if name == "hour" else (DAY_DIMENSIONS, DAY_STRATA)
+    sample = extend_sample(load_columns(cache_name, meta), build_cube(records, dimensions), strata)
+    write_columns(cache_name, sample, dict(meta["source"], csv=csv_signature))
+
+
+def append_records(name, records):
+    """Menambahkan ``records`` (DataFrame) ke dataset ``day`` atau ``hour``.
+
+    Mengembalikan jumlah baris yang ditambahkan. Melempar ``AppendError``
+    jika record tidak melanjutkan ``instant``/``dteday`` data yang ada.
+    """
+    records = _normalize(name, records)
+    validate(name, last_record(name), records)
+    if records.empty:
+        return 0
+
+    previous = file_signature(source_path(name))
+    _append_csv(name, records)
+    signature = file_signature(source_path(name))
+
+    meta = read_meta(name)
+    if meta is not None:
+        _append_columns(name, meta, records, previous, signature)
+    if name == "hour":
+        _update_cube(records, previous, signature)
+        forecast.update_artifact(records, previous, signature)
+    _update_sample(name, records, previous, signature)
+    quality.update_report(name, previous, signature)
+    return len(records)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Menambahkan record harian/per jam baru ke dataset.")
+    parser.add_argument("--day", help="CSV berisi record harian baru")
+    parser.add_argument("--hour", help="CSV berisi record per jam baru")
+    args = parser.parse_args(argv)
+    if not args.day and not args.hour:
+        parser.error("minimal salah satu dari --day atau --hour harus diisi")
+
+    for name, path in (("day", args.day), ("hour", args.hour)):
+        if path:
+            try:
+                added = append_records(name, pd.read_csv(path))
+            except AppendError as exc:
+                parser.exit(1, f"error: {exc}\n")
+            print(f"{name}: {added} baris ditambahkan")
+
+
+if __name__ == "__main__":
+    main()
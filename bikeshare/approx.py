@@ -0,0 +1,192 @@
+"""Mode perkiraan: sampel berstrata dari kubus untuk rentang yang sangat besar.
+
+Sampel ditarik per strata (kombinasi dimensi yang dipakai grafik): setiap
+strata mendapat minimal beberapa baris dan sisa anggaran dibagi proporsional
+dengan ukuran strata. Di dalam strata, sel yang terpilih adalah ``k`` sel
+dengan prioritas terkecil, dan prioritas adalah hash kunci sel. Karena itu
+sampel bisa dipelihara seperti reservoir: saat sel baru di-append cukup
+disaring ulang bersama sampel lama (``extend_sample``), hasilnya sama dengan
+menarik ulang dari kubus lengkap dengan kuota yang sama. Sampel mentah
+(``draw_sample``) disimpan di cache oleh ``ingest`` di samping kubusnya.
+
+Setiap baris sampel berbobot (``weigh``) membawa bobot ``w`` = N/k
+strata-nya; measure dan ``n`` sudah dikalikan bobot tersebut. Dengan begitu
+``rollup``/``total`` pada sampel langsung menghasilkan estimator rasio
+(rata-rata) dan Horvitz-Thompson (jumlah) tanpa mengubah query grafik.
+Kolom ``stratum`` dan ``k`` (ukuran sampel strata sebelum difilter) dipakai
+untuk menghitung batas galat.
+
+Ukuran sampel dibatasi ``BIKESHARE_APPROX_SAMPLE_ROWS`` sehingga biaya query
+tetap walaupun data tumbuh. Minimum per strata diperkecil bila perlu agar
+batas itu tetap berlaku; hanya jika jumlah strata melebihi separuh batas,
+sampel memuat dua baris per strata (minimum untuk menaksir varians). Potongan yang kecil (di bawah
+``BIKESHARE_APPROX_MIN_ROWS`` baris kubus) selalu dihitung eksak.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from .cube import DERIVED_DIMENSIONS, MEASURES, rollup
+
+SAMPLE_ROWS = int(os.environ.get("BIKESHARE_APPROX_SAMPLE_ROWS", "50000"))
+MIN_ROWS = int(os.environ.get("BIKESHARE_APPROX_MIN_ROWS", "200000"))
+# Galat relatif terbesar yang diterima; di atasnya potongan dihitung eksak
+MAX_ERROR = float(os.environ.get("BIKESHARE_APPROX_MAX_ERROR", "0.10"))
+MIN_PER_STRATUM = 20
+Z_95 = 1.96
+
+# Strata per kubus: mencakup semua dimensi yang dikelompokkan oleh grafik
+HOUR_STRATA = ["season", "weathersit", "weekday", "hr"]
+DAY_STRATA = ["season", "weathersit", "weekday", "workingday", "month"]
+
+
+def _keys(cube, names):
+    return [DERIVED_DIMENSIONS[name](cube) if name in DERIVED_DIMENSIONS else cube[name] for name in names]
+
+
+def _strata(frame, strata):
+    """Kode strata (0..S-1) setiap baris ``frame`` dan ukuran setiap strata."""
+    codes = pd.MultiIndex.from_arrays(_keys(frame, strata)).codes
+    flat = np.ravel_multi_index(codes, [int(code.max()) + 1 for code in codes])
+    _, stratum, sizes = np.unique(flat, return_inverse=True, return_counts=True)
+    return stratum.reshape(-1), sizes
+
+
+def _dimensions(cube):
+    return [col for col in cube.columns if col not in MEASURES + ["n", "priority", "N", "k"]]
+
+
+def _priority(cube, seed=0):
+    """Prioritas acak yang tetap per sel kubus: hash kunci sel (dimensi)."""
+    return pd.util.hash_pandas_object(cube[_dimensions(cube)], index=False,
+                                      hash_key=f"bikeshare{seed:07d}").to_numpy()
+
+
+def _lowest(priority, stratum, quota):
+    """Posisi (terurut) ``quota[s]`` baris berprioritas terkecil di setiap strata ``s``."""
+    order = np.lexsort((priority, stratum))
+    counts = np.bincount(stratum, minlength=len(quota))
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    rank = np.empty(len(stratum), dtype=np.int64)
+    rank[order] = np.arange(len(stratum)) - starts[stratum[order]]
+    return np.flatnonzero(rank < quota[stratum])
+
+
+def draw_sample(cube, strata, rows=SAMPLE_ROWS, seed=0):
+    """Sampel mentah dari ``cube`` (tetap terurut ``dteday``), atau ``None`` jika kubus sudah kecil.
+
+    Selain kolom kubus, setiap baris membawa ``priority`` serta ukuran
+    (``N``) dan kuota (``k``) strata-nya.
+    """
+    if len(cube) <= rows:
+        return None
+    stratum, sizes = _strata(cube, strata)
+
+    # Setiap strata mendapat minimum (diperkecil jika strata terlalu banyak untuk ``rows``),
+    # sisa anggaran dibagi proporsional dengan ukuran strata sehingga total tidak melebihi ``rows``
+    minimum = max(2, min(MIN_PER_STRATUM, rows // len(sizes)))
+    quota = np.minimum(sizes, minimum)
+    rest = sizes - quota
+    if rest.sum():
+        quota += np.floor(rest * max(rows - quota.sum(), 0) / rest.sum()).astype(np.int64)
+
+    priority = _priority(cube, seed)
+    keep = _lowest(priority, stratum, quota)
+    sample = cube.iloc[keep].reset_index(drop=True)
+    sample["priority"] = priority[keep]
+    sample["N"] = sizes[stratum[keep]]
+    sample["k"] = quota[stratum[keep]]
+    return sample
+
+
+def extend_sample(sample, part, strata, seed=0):
+    """Sampel mentah setelah sel kubus baru ``part`` ditambahkan ke kubusnya.
+
+    ``part`` hanya boleh berisi sel yang belum ada di kubus (dijamin mode
+    append, yang hanya menerima waktu setelah record terakhir). Kuota strata
+    lama tetap; strata yang baru muncul mendapat ``MIN_PER_STRATUM`` sampai
+    sampel ditarik ulang.
+    """
+    part = part.assign(priority=_priority(part, seed))
+    pool = pd.concat([sample.drop(columns=["N", "k"]), part], ignore_index=True)
+    stratum, _ = _strata(pool, strata)
+    old = stratum[:len(sample)]
+    sizes = np.zeros(int(stratum.max()) + 1, dtype=np.int64)
+    quota = np.zeros_like(sizes)
+    sizes[old] = sample["N"].to_numpy()
+    quota[old] = sample["k"].to_numpy()
+    fresh = sizes == 0
+    sizes += np.bincount(stratum[len(sample):], minlength=len(sizes))
+    quota[fresh] = np.minimum(sizes[fresh], MIN_PER_STRATUM)
+
+    keep = _lowest(pool["priority"].to_numpy(), stratum, quota)
+    extended = pool.iloc[keep].reset_index(drop=True)
+    extended["N"] = sizes[stratum[keep]]
+    extended["k"] = quota[stratum[keep]]
+    return extended
+
+
+def weigh(sample, strata):
+    """Sampel berbobot dari sampel mentah: measure dan ``n`` dikalikan ``w`` = N/k."""
+    weight = sample["N"].to_numpy() / sample["k"].to_numpy()
+    weighted = sample[_dimensions(sample)].copy()
+    for col in MEASURES + ["n"]:
+        weighted[col] = sample[col].to_numpy() * weight
+    weighted["w"] = weight
+    weighted["stratum"] = _strata(sample, strata)[0].astype(np.int32)
+    weighted["k"] = sample["k"].to_numpy().astype(np.int32)
+    return weighted
+
+
+def stratified_sample(cube, strata, rows=SAMPLE_ROWS, seed=0):
+    """Sampel berbobot dari ``cube`` (tetap terurut ``dteday``), atau ``None`` jika kubus sudah kecil."""
+    sample = draw_sample(cube, strata, rows, seed)
+    return None if sample is None else weigh(sample, strata)
+
+
+def use_sample(filtered_cube, min_rows=MIN_ROWS):
+    """Apakah potongan ``filtered_cube`` cukup besar untuk dijawab dari sampel."""
+    return len(filtered_cube) > min_rows
+
+
+def mean_error(sample, by, measure="cnt", z=Z_95):
+    """Rata-rata ``measure`` per ``by`` dari sampel beserta setengah lebar interval ``z`` (kolom ``error``).
+
+    ``by`` harus bagian dari strata sampel sehingga setiap strata berada di
+    satu kelompok. Varians estimator rasio dihitung dengan linearisasi per
+    strata, termasuk koreksi populasi hingga. Sampel yang sudah difilter
+    diperlakukan sebagai domain: baris strata yang tersaring keluar dihitung
+    sebagai nol terhadap ukuran sampel strata semula (``k``), sehingga
+    ketidakpastian jumlah baris yang lolos filter ikut masuk ke varians.
+    """
+    means = rollup(sample, by, [measure])
+    weight = sample["w"].to_numpy()
+    y = sample[measure].to_numpy() / weight
+    n = sample["n"].to_numpy() / weight
+
+    keys = pd.DataFrame({name: key.to_numpy() for name, key in zip(by, _keys(sample, by))})
+    ratio = keys.merge(means, on=by, how="left")[measure].to_numpy()
+    residual = y - ratio * n
+    rows = keys.assign(z=residual, z2=residual * residual, w=weight, wn=weight * n, k=sample["k"].to_numpy(),
+                       stratum=sample["stratum"].to_numpy())
+
+    per_stratum = rows.groupby("stratum", sort=False).agg(
+        **{name: (name, "first") for name in by}, w=("w", "first"), k=("k", "first"), z=("z", "sum"), z2=("z2", "sum"))
+    w, k = per_stratum["w"].to_numpy(), per_stratum["k"].to_numpy(np.float64)
+    # Varians sampel z atas seluruh ``k`` baris strata (baris di luar filter bernilai nol)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        var = np.where(k > 1, (per_stratum["z2"].to_numpy() - per_stratum["z"].to_numpy() ** 2 / k) / (k - 1), 0.0)
+    per_stratum["variance"] = (w * k) ** 2 * (1 - 1 / w) / k * var
+
+    variance = per_stratum.groupby(list(by))["variance"].sum()
+    denominator = rows.groupby(list(by))["wn"].sum()
+    error = (z * np.sqrt(variance) / denominator).rename("error").reset_index()
+    return means.merge(error, on=by, how="left")
+
+
+def max_relative_error(sample, by, measure="cnt"):
+    """Galat relatif terbesar (``error / mean``) di antara kelompok ``by``."""
+    result = mean_error(sample, by, measure)
+    relative = result["error"] / result[measure].abs()
+    return float(relative.replace(np.inf, np.nan).max()) if len(result) else 0.0
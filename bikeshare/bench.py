@@ -0,0 +1,290 @@
+"""Benchmark headless untuk jalur data dashboard (tanpa browser/server Streamlit).
+
+Setiap skala dijalankan dalam subprocess terpisah dengan direktori data dan
+cache sementara, sehingga ukuran memori per skala tidak saling memengaruhi.
+Tahap yang diukur: load (cold & warm), pembangunan kubus dan sampel, filter
+sidebar, query setiap grafik, semua query sekaligus (berurutan, paralel, dan
+dari sampel mode perkiraan), dan (opsional) rendering figure. Hasilnya
+berupa JSON Lines: satu objek per tahap berisi waktu dan puncak memori.
+
+``--startup N`` mengukur waktu sampai metrik pertama dashboard: setiap run
+adalah proses Python baru yang menjalankan ``dashboard.py`` headless
+(``streamlit.testing``) dengan cache yang sudah hangat. Modul ini sengaja
+tidak meng-import numpy/pandas di tingkat modul agar import berat itu
+terjadi di dalam dashboard dan ikut terukur; profiler dashboard dijalankan
+dengan ``BIKESHARE_PROFILE=timing`` (mark tanpa tracemalloc). Median ``N`` run
+dibandingkan dengan target ``STARTUP_TARGET``; dengan ``--check`` benchmark
+keluar dengan status 1 jika target terlampaui.
+
+Contoh::
+
+    python -m bikeshare.bench --scales 1 10 100 --render > bench_output.txt
+    python -m bikeshare.bench --startup 5 --check
+"""
+import argparse
+import datetime
+import json
+import logging
+import os
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+BUNDLED_DIR = Path(__file__).resolve().parent.parent
+
+# Target waktu sampai metrik pertama (detik, median), termasuk import numpy/pandas di proses baru
+STARTUP_TARGET = float(os.environ.get("BIKESHARE_STARTUP_TARGET", "2.0"))
+
+# Pergeseran tanggal antar salinan: 105 minggu (> 731 hari) agar tidak tumpang
+# tindih dan hari dalam seminggu tetap sejajar
+SHIFT_DAYS = 7 * 105
+
+# Kombinasi filter yang diukur: tampilan default dan potongan yang umum
+FILTERS = {
+    "default": dict(start=None, end=None, seasons=None, weathers=None),
+    "subset": dict(start=datetime.date(2011, 4, 1), end=datetime.date(2012, 9, 30),
+                   seasons=frozenset({2, 3}), weathers=frozenset({1, 2})),
+}
+
+
+def write_scaled(name, scale, out_dir):
+    """Menulis ``name``.csv yang diperbesar ``scale`` kali; mengembalikan jumlah baris."""
+    import pandas as pd
+
+    base = pd.read_csv(BUNDLED_DIR / f"{name}.csv", parse_dates=["dteday"])
+    path = Path(out_dir) / f"{name}.csv"
+    for i in range(scale):
+        copy = base.copy()
+        copy["instant"] = base["instant"] + i * len(base)
+        copy["dteday"] = base["dteday"] + pd.Timedelta(days=i * SHIFT_DAYS)
+        copy.to_csv(path, mode="w" if i == 0 else "a", header=i == 0, index=False, date_format="%Y-%m-%d")
+    return len(base) * scale
+
+
+class Recorder:
+    def __init__(self, scale, repeat, memory):
+        self.scale = scale
+        self.repeat = repeat
+        self.memory = memory
+        self.results = []
+
+    def measure(self, stage, fn, repeat=None, **extra):
+        """Menjalankan ``fn`` beberapa kali; mencatat waktu terbaik dan puncak memori."""
+        timings = []
+        for _ in range(repeat or self.repeat):
+            start = time.perf_counter()
+            result = fn()
+            timings.append(time.perf_counter() - start)
+
+        peak = None
+        if self.memory:
+            tracemalloc.start()
+            fn()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        self.results.append({
+            "scale": self.scale,
+            "stage": stage,
+            "seconds": min(timings),
+            "median_seconds": float(statistics.median(timings)),
+            "peak_bytes": peak,
+            **extra,
+        })
+        return result
+
+
+def run_stages(scale, repeat=3, memory=True, render=False):
+    """Menjalankan semua tahap pada data di ``BIKESHARE_DATA_DIR`` saat ini."""
+    from . import loader
+    from .approx import HOUR_STRATA, max_relative_error, stratified_sample, use_sample
+    from .charts import CHARTS, make_figure
+    from .charts import render as render_figure
+    from .cube import DAY_DIMENSIONS, HOUR_DIMENSIONS, build_cube
+    from .filters import select
+    from .ingest import load_cube
+    from .parallel import make_executor, query_charts
+
+    recorder = Recorder(scale, repeat, memory)
+    executor = make_executor()
+
+    def load_cold():
+        for name in ("day", "hour_cube"):
+            shutil.rmtree(loader.CACHE_DIR / name, ignore_errors=True)
+        return loader.load_table("day"), load_cube("hour", HOUR_DIMENSIONS)
+
+    def load_warm():
+        return loader.load_table("day"), load_cube("hour", HOUR_DIMENSIONS)
+
+    # Load cold hanya sekali agar memori tahap ini juga terukur tanpa cache
+    recorder.measure("load_cold", load_cold, repeat=1)
+    day_df, hour_cube = recorder.measure("load_warm", load_warm)
+    recorder.results[-1]["hour_cube_rows"] = len(hour_cube)
+    day_cube = recorder.measure("build_day_cube", lambda: build_cube(day_df, DAY_DIMENSIONS))
+    hour_sample = recorder.measure("build_hour_sample", lambda: stratified_sample(hour_cube, HOUR_STRATA), repeat=1)
+
+    for filter_name, spec in FILTERS.items():
+        filtered = recorder.measure(
+            f"filter:{filter_name}",
+            lambda: (select(day_cube, **spec), select(hour_cube, **spec)),
+        )
+        for chart_id, chart in CHARTS.items():
+            data = recorder.measure(f"query:{filter_name}:{chart_id}", lambda: chart.query(*filtered))
+            if render:
+                recorder.measure(f"render:{filter_name}:{chart_id}",
+                                 lambda: render_figure(make_figure(chart_id, data)), repeat=1)
+        # Semua query sekaligus: berurutan vs thread pool atas kubus terfilter yang sama
+        recorder.measure(f"query_all:{filter_name}:sequential", lambda: query_charts(CHARTS, *filtered))
+        if executor is not None:
+            recorder.measure(f"query_all:{filter_name}:parallel",
+                             lambda: query_charts(CHARTS, *filtered, executor=executor),
+                             workers=executor._max_workers)
+        if hour_sample is not None and use_sample(filtered[1]):
+            # Mode perkiraan (seperti dashboard, hanya untuk potongan besar): sampel berukuran tetap
+            sampled = (filtered[0], select(hour_sample, **spec))
+            recorder.measure(f"query_all:{filter_name}:approx", lambda: query_charts(CHARTS, *sampled),
+                             sample_rows=len(sampled[1]),
+                             max_relative_error=max_relative_error(sampled[1], ["hr", "weekday"]))
+
+    if executor is not None:
+        executor.shutdown()
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    for result in recorder.results:
+        result["max_rss_bytes"] = max_rss
+    return recorder.results
+
+
+def run_scale(scale, args):
+    """Menyiapkan data skala ``scale`` lalu menjalankan worker di subprocess."""
+    with tempfile.TemporaryDirectory(prefix=f"bikeshare-bench-{scale}x-") as tmp:
+        start = time.perf_counter()
+        write_scaled("day", scale, tmp)
+        rows = write_scaled("hour", scale, tmp)
+        prepare = time.perf_counter() - start
+
+        env = dict(os.environ, BIKESHARE_DATA_DIR=tmp, BIKESHARE_CACHE_DIR=os.path.join(tmp, ".cache"))
+        command = [sys.executable, "-m", "bikeshare.bench", "--worker", "--scales", str(scale),
+                   "--repeat", str(args.repeat)]
+        if args.render:
+            command.append("--render")
+        if not args.memory:
+            command.append("--no-memory")
+        output = subprocess.run(command, env=env, cwd=BUNDLED_DIR, check=True,
+                                capture_output=True, text=True).stdout
+
+    results = [json.loads(line) for line in output.splitlines() if line.strip()]
+    for result in results:
+        result["hour_rows"] = rows
+        result["prepare_seconds"] = prepare
+    return results
+
+
+class _RecordCapture(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.INFO)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(json.loads(record.getMessage()))
+
+
+def startup_probe():
+    """Menjalankan dashboard sekali di proses ini; mengembalikan waktu sampai metrik pertama."""
+    from streamlit.testing.v1 import AppTest
+
+    # Jika sudah ter-import di sini, waktu import-nya tidak ikut terukur oleh dashboard
+    preloaded = [name for name in ("numpy", "pandas") if name in sys.modules]
+    if preloaded:
+        raise RuntimeError(f"{', '.join(preloaded)} sudah ter-import sebelum dashboard dijalankan")
+
+    capture = _RecordCapture()
+    metrics_logger = logging.getLogger("bikeshare.metrics")
+    metrics_logger.setLevel(logging.INFO)
+    metrics_logger.addHandler(capture)
+
+    start = time.perf_counter()
+    app = AppTest.from_file(str(BUNDLED_DIR / "dashboard.py"), default_timeout=600).run()
+    run_seconds = time.perf_counter() - start
+    if app.exception:
+        raise RuntimeError(f"dashboard gagal: {app.exception[0].message}")
+    record = capture.records[-1]
+    return {"first_metric_seconds": record["marks"]["first_metric"], "run_seconds": run_seconds}
+
+
+def run_startup(runs, target=STARTUP_TARGET):
+    """Satu run pemanasan (cache dingin) lalu ``runs`` run terukur, masing-masing di proses baru."""
+    with tempfile.TemporaryDirectory(prefix="bikeshare-bench-startup-") as tmp:
+        env = dict(os.environ, BIKESHARE_CACHE_DIR=tmp, BIKESHARE_PROFILE="timing")
+        command = [sys.executable, "-m", "bikeshare.bench", "--startup-worker"]
+        probes = []
+        for _ in range(runs + 1):
+            output = subprocess.run(command, env=env, cwd=BUNDLED_DIR, check=True,
+                                    capture_output=True, text=True).stdout
+            probes.append(json.loads(output.splitlines()[-1]))
+
+    cold, warm = probes[0], probes[1:]
+    first_metric = [probe["first_metric_seconds"] for probe in warm]
+    median = float(statistics.median(first_metric))
+    return [
+        {"stage": "startup:first_metric:cold", "seconds": cold["first_metric_seconds"],
+         "run_seconds": cold["run_seconds"]},
+        {"stage": "startup:first_metric", "seconds": min(first_metric), "median_seconds": median,
+         "run_seconds": float(statistics.median([probe["run_seconds"] for probe in warm])),
+         "runs": runs, "target_seconds": target, "passed": median <= target},
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark headless jalur data Bike Sharing Dashboard.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1],
+                        help="faktor perbesaran hour.csv/day.csv (mis. 1 10 100 1000)")
+    parser.add_argument("--repeat", type=int, default=3, help="jumlah pengulangan per tahap")
+    parser.add_argument("--render", action="store_true", help="ikut mengukur rendering figure")
+    parser.add_argument("--no-memory", dest="memory", action="store_false",
+                        help="lewati pengukuran puncak memori (tracemalloc)")
+    parser.add_argument("--out", help="file JSON Lines keluaran (default: stdout)")
+    parser.add_argument("--startup", type=int, metavar="N",
+                        help="ukur waktu sampai metrik pertama dashboard sebanyak N run (menggantikan --scales)")
+    parser.add_argument("--startup-target", type=float, default=STARTUP_TARGET,
+                        help=f"target median waktu sampai metrik pertama, detik (default: {STARTUP_TARGET})")
+    parser.add_argument("--check", action="store_true", help="keluar dengan status 1 jika target startup terlampaui")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--startup-worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        for result in run_stages(args.scales[0], args.repeat, args.memory, args.render):
+            print(json.dumps(result))
+        return
+    if args.startup_worker:
+        print(json.dumps(startup_probe()))
+        return
+
+    failed = False
+    out = open(args.out, "w") if args.out else sys.stdout
+    try:
+        if args.startup:
+            for result in run_startup(args.startup, args.startup_target):
+                out.write(json.dumps(result) + "\n")
+                failed = failed or result.get("passed") is False
+        else:
+            for scale in args.scales:
+                for result in run_scale(scale, args):
+                    out.write(json.dumps(result) + "\n")
+                out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if args.check and failed:
+        sys.exit(f"waktu sampai metrik pertama melampaui target {args.startup_target:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
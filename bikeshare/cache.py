@@ -0,0 +1,139 @@
+"""Cache hasil bersama untuk seluruh sesi dalam satu proses.
+
+``ResultCache`` adalah LRU thread-safe dengan anggaran bytes. Kunci yang
+dipakai dashboard adalah versi data ditambah state filter yang sudah
+dinormalisasi, sehingga pengunjung dengan filter yang sama (terutama
+tampilan default) memakai hasil yang sama. Hasil dihitung sekali per kunci
+walaupun diminta banyak sesi secara bersamaan. DataFrame disimpan dengan
+array read-only dan dibagikan tanpa salinan per sesi; penulisan nilai
+in-place ke hasil tersebut akan gagal.
+"""
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+_MISSING = object()
+
+
+def freeze(value):
+    """Membuat kolom numerik DataFrame menjadi read-only (tanpa salinan jika sudah read-only)."""
+    if not isinstance(value, pd.DataFrame):
+        return value
+    data = {}
+    for i in range(value.shape[1]):
+        series = value.iloc[:, i]
+        if isinstance(series.dtype, np.dtype):
+            array = series.to_numpy()
+            if array.flags.writeable:
+                array = array.copy()
+                array.flags.writeable = False
+            data[i] = array
+        else:
+            data[i] = series.array
+    frozen = pd.DataFrame(data, index=value.index, copy=False)
+    frozen.columns = value.columns
+    return frozen
+
+
+def sizeof(value):
+    """Perkiraan ukuran bytes sebuah nilai cache."""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(sizeof(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sizeof(item) for item in value.values())
+    return sys.getsizeof(value)
+
+
+class ResultCache:
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def _lookup(self, key, count):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if count:
+                    self.misses += 1
+                return _MISSING
+            self._entries.move_to_end(key)
+            if count:
+                self.hits += 1
+            return entry[0]
+
+    def get(self, key, default=None):
+        value = self._lookup(key, count=True)
+        return default if value is _MISSING else value
+
+    def put(self, key, value):
+        size = sizeof(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            self._entries[key] = (value, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute):
+        """Nilai dari cache, atau ``compute()`` yang dijalankan sekali per kunci."""
+        value = self._lookup(key, count=True)
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            key_lock = self._inflight.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                # Sesi lain mungkin sudah menghitungnya selama kita menunggu
+                value = self._lookup(key, count=False)
+                if value is _MISSING:
+                    value = freeze(compute())
+                    self.put(key, value)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+        return value
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
@@ -0,0 +1,298 @@
+"""Definisi ke-13 grafik dashboard: agregasi (query) dan plot.
+
+Setiap grafik terdiri dari ``query(day_cube, hour_cube)`` yang melakukan
+roll-up atas kubus yang sudah difilter, dan ``plot(data)`` yang
+menggambar hasilnya. Figure dibuat langsung dari ``matplotlib.figure``
+(bukan ``pyplot``) sehingga tidak tercatat di figure manager global dan
+langsung bebas setelah di-render.
+
+Matplotlib dan seaborn baru diimpor saat figure pertama dibuat, sehingga
+query (dan metrik dashboard) tidak menanggung biaya impor stack plotting.
+"""
+import importlib
+import io
+from typing import Callable, NamedTuple
+
+import pandas as pd
+
+from .cube import rollup, total
+from .labels import (month_names, season_mapping, season_order, weathersit_mapping, weekday_mapping,
+                     weekday_order, with_names, workingday_mapping)
+
+
+class _LazyModule:
+    """Modul yang baru diimpor saat atributnya pertama kali dipakai."""
+
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(importlib.import_module(self._name), attr)
+
+
+sns = _LazyModule("seaborn")
+
+
+class Chart(NamedTuple):
+    title: str
+    query: Callable
+    plot: Callable
+    figsize: tuple = (12, 6)
+
+
+def _melt_users(df, id_vars):
+    return df.melt(
+        id_vars=id_vars,
+        value_vars=['casual', 'registered'],
+        var_name='Tipe Pengguna',
+        value_name='Rata-rata Peminjaman'
+    )
+
+
+# Query: roll-up atas kubus yang sudah difilter
+
+def query_season(day_cube, hour_cube):
+    return with_names(rollup(day_cube, ["season"]))
+
+
+def query_weather(day_cube, hour_cube):
+    return with_names(rollup(day_cube, ["weathersit"]))
+
+
+def query_season_weather(day_cube, hour_cube):
+    return with_names(rollup(day_cube, ["season", "weathersit"]))
+
+
+def query_monthly_season(day_cube, hour_cube):
+    return with_names(rollup(day_cube, ['month', 'season']))
+
+
+def query_monthly_weather(day_cube, hour_cube):
+    return with_names(rollup(day_cube, ['month', 'weathersit']))
+
+
+def query_hourly(day_cube, hour_cube):
+    return rollup(hour_cube, ['hr'])
+
+
+def query_hour_weekday(day_cube, hour_cube):
+    hour_weekday_data = rollup(hour_cube, ['hr', 'weekday'])
+    return hour_weekday_data.pivot(index='hr', columns='weekday', values='cnt')
+
+
+def query_user_share(day_cube, hour_cube):
+    return pd.DataFrame({
+        'Tipe Pengguna': ['Casual', 'Registered'],
+        'Jumlah Peminjaman': [total(day_cube, 'casual'), total(day_cube, 'registered')]
+    })
+
+
+def query_season_user(day_cube, hour_cube):
+    seasonal_user_data = with_names(rollup(day_cube, ['season'], ['casual', 'registered']))
+    return _melt_users(seasonal_user_data, 'season_name')
+
+
+def query_weekday_user(day_cube, hour_cube):
+    weekday_data = with_names(rollup(day_cube, ['weekday'], ['casual', 'registered']))
+    weekday_data_melted = _melt_users(weekday_data, 'weekday_name')
+    weekday_data_melted['weekday_name'] = pd.Categorical(
+        weekday_data_melted['weekday_name'],
+        categories=weekday_order,
+        ordered=True
+    )
+    return weekday_data_melted.sort_values('weekday_name')
+
+
+def query_hourly_user(day_cube, hour_cube):
+    return _melt_users(rollup(hour_cube, ['hr'], ['casual', 'registered']), 'hr')
+
+
+def query_workingday_user(day_cube, hour_cube):
+    workingday_data = rollup(day_cube, ['workingday'], ['casual', 'registered'])
+    workingday_data['workingday'] = workingday_data['workingday'].map(workingday_mapping)
+    return _melt_users(workingday_data, 'workingday')
+
+
+def query_weather_user(day_cube, hour_cube):
+    weather_user_data = with_names(rollup(day_cube, ['weathersit'], ['casual', 'registered']))
+    return _melt_users(weather_user_data, 'weathersit_name')
+
+
+# Plot: menggambar hasil query pada sebuah axes
+
+def plot_season(data, ax):
+    sns.barplot(x="season_name", y="cnt", data=data, ax=ax, order=season_order)
+    ax.set_title("Rata-rata Peminjaman Sepeda per Musim")
+    ax.set_xlabel("Musim")
+    ax.set_ylabel("Rata-rata Jumlah Peminjaman")
+
+
+def plot_weather(data, ax):
+    sns.barplot(x="weathersit_name", y="cnt", data=data, ax=ax)
+    ax.set_title("Rata-rata Peminjaman Sepeda per Kondisi Cuaca")
+    ax.set_xlabel("Kondisi Cuaca")
+    ax.set_ylabel("Rata-rata Jumlah Peminjaman")
+
+
+def plot_season_weather(data, ax):
+    sns.barplot(x="season_name", y="cnt", hue="weathersit_name", data=data, ax=ax, order=season_order)
+    ax.set_title("Interaksi Musim dan Kondisi Cuaca terhadap Peminjaman Sepeda")
+    ax.set_xlabel("Musim")
+    ax.set_ylabel("Rata-rata Jumlah Peminjaman")
+
+
+def _plot_monthly(data, ax, name_col, names, title):
+    for name in names:
+        series = data[data[name_col] == name]
+        ax.plot(series['month'], series['cnt'], marker='o', label=name)
+
+    ax.set_xticks(range(1, 13))
+    ax.set_xticklabels(month_names)
+    ax.set_xlabel('Bulan')
+    ax.set_ylabel('Rata-rata Jumlah Peminjaman')
+    ax.set_title(title)
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+
+def plot_monthly_season(data, ax):
+    _plot_monthly(data, ax, 'season_name', season_mapping.values(),
+                  'Tren Peminjaman Sepeda Bulanan berdasarkan Musim')
+
+
+def plot_monthly_weather(data, ax):
+    _plot_monthly(data, ax, 'weathersit_name', weathersit_mapping.values(),
+                  'Tren Peminjaman Sepeda Bulanan berdasarkan Kondisi Cuaca')
+
+
+def plot_hourly(data, ax):
+    sns.lineplot(x='hr', y='cnt', data=data, marker='o', ax=ax)
+    ax.set_title("Pola Peminjaman Sepeda Berdasarkan Jam")
+    ax.set_xlabel("Jam")
+    ax.set_ylabel("Rata-rata Jumlah Peminjaman")
+    ax.grid(True, alpha=0.3)
+
+
+def plot_hour_weekday(data, ax):
+    if data.empty:
+        # Potongan tanpa peminjaman: heatmap tanpa sel tidak bisa menentukan skala warna
+        ax.text(0.5, 0.5, 'Tidak ada peminjaman', ha='center', va='center')
+        ax.axis('off')
+        return
+    sns.heatmap(
+        data,
+        cmap="viridis",
+        ax=ax,
+        cbar_kws={'label': 'Jumlah Peminjaman'}
+    )
+    ax.set_title("Heatmap Peminjaman Sepeda berdasarkan Jam dan Hari")
+    ax.set_xlabel("Hari")
+    ax.set_ylabel("Jam")
+    ax.set_xticklabels([weekday_mapping[i] for i in data.columns])
+
+
+def plot_user_share(data, ax):
+    if not data['Jumlah Peminjaman'].sum():
+        # Potongan tanpa peminjaman: pie dengan semua nilai nol tidak bisa digambar
+        ax.text(0.5, 0.5, 'Tidak ada peminjaman', ha='center', va='center')
+        ax.axis('off')
+    else:
+        ax.pie(
+            data['Jumlah Peminjaman'],
+            labels=data['Tipe Pengguna'],
+            autopct='%1.1f%%',
+            startangle=90,
+            colors=['#1f77b4', '#ff7f0e']
+        )
+        ax.axis('equal')
+    ax.set_title('Perbandingan Total Peminjaman Berdasarkan Tipe Pengguna')
+
+
+def _plot_user_bars(data, ax, x, title, xlabel, order=None):
+    sns.barplot(
+        x=x,
+        y='Rata-rata Peminjaman',
+        hue='Tipe Pengguna',
+        data=data,
+        ax=ax,
+        order=order
+    )
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel('Rata-rata Jumlah Peminjaman')
+
+
+def plot_season_user(data, ax):
+    _plot_user_bars(data, ax, 'season_name', 'Perbandingan Peminjaman berdasarkan Musim dan Tipe Pengguna',
+                    'Musim', order=season_order)
+
+
+def plot_weekday_user(data, ax):
+    _plot_user_bars(data, ax, 'weekday_name', 'Pola Peminjaman Berdasarkan Hari dalam Seminggu', 'Hari')
+
+
+def plot_hourly_user(data, ax):
+    sns.lineplot(
+        x='hr',
+        y='Rata-rata Peminjaman',
+        hue='Tipe Pengguna',
+        data=data,
+        marker='o',
+        ax=ax
+    )
+    ax.set_title('Pola Peminjaman Berdasarkan Jam dan Tipe Pengguna')
+    ax.set_xlabel('Jam')
+    ax.set_ylabel('Rata-rata Jumlah Peminjaman')
+    ax.grid(True, alpha=0.3)
+
+
+def plot_workingday_user(data, ax):
+    _plot_user_bars(data, ax, 'workingday', 'Peminjaman Berdasarkan Tipe Hari dan Tipe Pengguna', 'Tipe Hari')
+
+
+def plot_weather_user(data, ax):
+    _plot_user_bars(data, ax, 'weathersit_name', 'Pengaruh Kondisi Cuaca terhadap Tipe Pengguna', 'Kondisi Cuaca')
+
+
+CHARTS = {
+    "season": Chart("Rata-rata Peminjaman per Musim", query_season, plot_season, (10, 6)),
+    "weather": Chart("Rata-rata Peminjaman per Kondisi Cuaca", query_weather, plot_weather, (10, 6)),
+    "season_weather": Chart("Interaksi Musim dan Kondisi Cuaca", query_season_weather, plot_season_weather),
+    "monthly_season": Chart("Tren Peminjaman Sepeda Bulanan berdasarkan Musim",
+                            query_monthly_season, plot_monthly_season),
+    "monthly_weather": Chart("Tren Peminjaman Sepeda Bulanan berdasarkan Kondisi Cuaca",
+                             query_monthly_weather, plot_monthly_weather),
+    "hourly": Chart("Pola Peminjaman Sepeda Berdasarkan Jam", query_hourly, plot_hourly),
+    "hour_weekday": Chart("Heatmap Peminjaman Sepeda berdasarkan Jam dan Hari",
+                          query_hour_weekday, plot_hour_weekday, (12, 8)),
+    "user_share": Chart("Perbandingan Total Peminjaman Berdasarkan Tipe Pengguna",
+                        query_user_share, plot_user_share, (10, 6)),
+    "season_user": Chart("Perbandingan Peminjaman berdasarkan Musim dan Tipe Pengguna",
+                         query_season_user, plot_season_user),
+    "weekday_user": Chart("Pola Peminjaman Berdasarkan Hari dalam Seminggu", query_weekday_user, plot_weekday_user),
+    "hourly_user": Chart("Pola Peminjaman Berdasarkan Jam dan Tipe Pengguna", query_hourly_user, plot_hourly_user),
+    "workingday_user": Chart("Peminjaman Berdasarkan Tipe Hari dan Tipe Pengguna",
+                             query_workingday_user, plot_workingday_user, (10, 6)),
+    "weather_user": Chart("Pengaruh Kondisi Cuaca terhadap Tipe Pengguna", query_weather_user, plot_weather_user),
+}
+
+
+def make_figure(chart_id, data):
+    """Membuat Figure untuk ``chart_id`` dari hasil query-nya."""
+    from matplotlib.figure import Figure
+
+    chart = CHARTS[chart_id]
+    fig = Figure(figsize=chart.figsize)
+    ax = fig.add_subplot()
+    chart.plot(data, ax)
+    return fig
+
+
+def render(fig, fmt="png", dpi=100):
+    """Merender Figure ke bytes lalu melepasnya."""
+    buffer = io.BytesIO()
+    try:
+        fig.savefig(buffer, format=fmt, dpi=dpi, bbox_inches="tight")
+    finally:
+        fig.clear()
+    return buffer.getvalue()
@@ -0,0 +1,116 @@
+"""Mesin filter tervektorisasi untuk data/kubus yang terurut menurut ``dteday``.
+
+Rentang tanggal dicari dengan binary search (``np.searchsorted``) menjadi
+sebuah slice posisi, sehingga hasilnya view tanpa salinan. Musim dan cuaca
+difilter dengan bitmask atas kode integer asli (``season``/``weathersit``),
+bukan dengan ``isin`` pada label string. Tidak bergantung pada Streamlit.
+"""
+import datetime
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+SEASON_CODES = (1, 2, 3, 4)
+WEATHER_CODES = (1, 2, 3, 4)
+
+
+def sort_by_date(df):
+    """Mengurutkan ``df`` menurut ``dteday`` (sekali, saat kubus dimuat atau digabung).
+
+    ``select`` dan ``date_bounds`` memakai binary search sehingga urutan ini
+    wajib; data yang sudah terurut dikembalikan apa adanya tanpa salinan.
+    """
+    if df["dteday"].is_monotonic_increasing:
+        return df
+    return df.sort_values("dteday", kind="stable", ignore_index=True)
+
+
+def code_bitmask(codes):
+    """Bitmask dengan bit ke-``c`` menyala untuk setiap kode ``c``."""
+    bits = 0
+    for code in codes:
+        bits |= 1 << int(code)
+    return bits
+
+
+def normalize_codes(codes, universe):
+    """``None`` jika ``codes`` mencakup semua kode (filter tidak diperlukan)."""
+    codes = frozenset(int(code) for code in codes)
+    if codes.issuperset(universe):
+        return None
+    return codes
+
+
+class FilterState(NamedTuple):
+    """State filter ternormalisasi; ``None`` berarti tidak dibatasi."""
+    start: Optional[datetime.date] = None
+    end: Optional[datetime.date] = None
+    seasons: Optional[tuple] = None
+    weathers: Optional[tuple] = None
+
+
+def normalize_filter(start=None, end=None, seasons=None, weathers=None, min_date=None, max_date=None):
+    """Menormalisasi input sidebar menjadi ``FilterState`` yang bisa dipakai sebagai kunci cache.
+
+    Tanggal di luar rentang data dan pilihan "semua kategori" dipetakan ke
+    ``None`` sehingga filter yang setara menghasilkan kunci yang sama.
+    """
+    if start is not None and min_date is not None and start <= min_date:
+        start = None
+    if end is not None and max_date is not None and end >= max_date:
+        end = None
+    if seasons is not None:
+        seasons = normalize_codes(seasons, SEASON_CODES)
+    if weathers is not None:
+        weathers = normalize_codes(weathers, WEATHER_CODES)
+    return FilterState(
+        start,
+        end,
+        None if seasons is None else tuple(sorted(seasons)),
+        None if weathers is None else tuple(sorted(weathers)),
+    )
+
+
+def _as_datetime64(value):
+    if isinstance(value, datetime.datetime):
+        value = value.date()
+    return np.datetime64(value, "ns")
+
+
+def date_bounds(dates, start=None, end=None):
+    """Posisi ``[lo, hi)`` baris dengan ``start <= dteday <= end`` (inklusif)."""
+    lo = 0 if start is None else int(np.searchsorted(dates, _as_datetime64(start), side="left"))
+    if end is None:
+        hi = len(dates)
+    else:
+        next_day = _as_datetime64(end) + np.timedelta64(1, "D")
+        hi = int(np.searchsorted(dates, next_day, side="left"))
+    return lo, max(lo, hi)
+
+
+def code_mask(values, codes):
+    """Mask boolean ``values in codes`` lewat satu operasi shift/and."""
+    bits = np.uint16(code_bitmask(codes))
+    return (np.right_shift(bits, values.astype(np.uint16)) & 1).astype(bool)
+
+
+def select(df, start=None, end=None, seasons=None, weathers=None):
+    """Memotong ``df`` (terurut ``dteday``) menurut tanggal, musim, dan cuaca.
+
+    ``seasons``/``weathers`` berisi kode integer; ``None`` berarti semua.
+    Jika tidak ada filter kategori aktif, hasilnya view slice dari ``df``
+    tanpa salinan data.
+    """
+    lo, hi = date_bounds(df["dteday"].to_numpy(), start, end)
+    view = df.iloc[lo:hi]
+
+    mask = None
+    for col, codes in (("season", seasons), ("weathersit", weathers)):
+        if codes is None:
+            continue
+        col_mask = code_mask(view[col].to_numpy(), codes)
+        mask = col_mask if mask is None else mask & col_mask
+
+    if mask is None or mask.all():
+        return view
+    return view[mask]
@@ -0,0 +1,352 @@
+"""Prakiraan permintaan per jam untuk perencanaan rebalancing.
+
+Model regresi ridge multi-output pada ``log1p`` jumlah peminjaman, dilatih
+dari fitur ``hour.csv``: pola jam per jenis hari (``hr`` × ``workingday``),
+``season``, ``weekday``, ``weathersit``, ``temp``, ``atemp``, ``hum``, dan
+``windspeed``, ditambah tren waktu agar pertumbuhan antar tahun ikut
+terbawa. ``casual`` dan ``registered`` diprediksi terpisah; ``cnt`` adalah
+jumlah keduanya. Bias transformasi log dikoreksi dengan faktor smearing.
+
+Pelatihan membaca ``hour.csv`` per potongan (``ingest.iter_chunks``) dan
+hanya mengakumulasi statistik cukup: persamaan normal ridge (XᵀX, XᵀY) dan
+jumlah cuaca per (bulan, jam) untuk klimatologi. Memori pelatihan sebanding
+dengan ukuran potongan, bukan dengan jumlah baris. Statistik itu ikut
+disimpan di artefak ``.npz`` sehingga record baru dari mode append cukup
+ditambahkan (``update_artifact``) tanpa membaca ulang seluruh CSV; faktor
+smearing pada pembaruan inkremental memakai residual lama apa adanya sampai
+dilatih ulang penuh dengan ``--retrain``.
+
+Pelatihan dijalankan dari command line atau hook append, tidak pernah dari
+rerun dashboard; dashboard hanya memuat artefaknya. Inferensi sepenuhnya
+tervektorisasi dan berjalan per batch, sehingga ribuan jam-stasiun dinilai
+dalam hitungan milidetik.
+
+Untuk jam mendatang, cuaca diambil dari klimatologi data historis (rata-rata
+per bulan dan jam) kecuali prakiraan cuaca diberikan. Hari libur tidak
+diketahui sehingga ``workingday`` mengikuti Senin-Jumat.
+
+Contoh::
+
+    python -m bikeshare.forecast --train
+    python -m bikeshare.forecast --hours 168 --out prakiraan.csv
+"""
+import argparse
+import datetime
+import json
+import os
+import sys
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from .ingest import DEFAULT_CHUNKSIZE, iter_chunks
+from .loader import CACHE_DIR, REMOTE_URL, file_signature, source_path
+
+FEATURES = ["season", "hr", "weekday", "workingday", "weathersit", "temp", "atemp", "hum", "windspeed"]
+TARGETS = ["casual", "registered"]
+WEATHER = ["weathersit", "temp", "atemp", "hum", "windspeed"]
+CLIMATE = ["temp", "atemp", "hum", "windspeed"]
+COLUMNS = ["dteday", *FEATURES, *TARGETS]
+
+# Naikkan jika susunan fitur atau artefak berubah agar artefak lama dilatih ulang
+MODEL_VERSION = 2
+MODEL_PATH = CACHE_DIR / "forecast_model.npz"
+BATCH_SIZE = 65_536
+RIDGE_ALPHA = 1.0
+
+# Awal musim (bulan, tanggal) seperti pada dataset: 1 dimulai 21 Desember
+SEASON_STARTS = ((3, 21, 2), (6, 21, 3), (9, 23, 4), (12, 21, 1))
+
+
+class Model(NamedTuple):
+    weights: np.ndarray
+    smearing: np.ndarray
+    origin: np.datetime64
+    signature: object = None
+    # Statistik cukup (lihat ``Accumulator``) untuk pembaruan inkremental dan klimatologi
+    stats: dict = None
+
+
+def _one_hot(codes, size, drop_first=False):
+    matrix = np.eye(size, dtype=np.float32)[np.asarray(codes, dtype=np.intp)]
+    return matrix[:, 1:] if drop_first else matrix
+
+
+def design_matrix(df, origin):
+    """Matriks fitur (float32) untuk ``df`` berisi kolom ``FEATURES`` dan ``dteday``."""
+    temp = df["temp"].to_numpy(np.float32)
+    hum = df["hum"].to_numpy(np.float32)
+    years = (df["dteday"].to_numpy("datetime64[ns]") - origin) / np.timedelta64(365, "D")
+    return np.hstack([
+        # Profil jam terpisah untuk hari kerja dan akhir pekan/libur (juga berperan sebagai intercept)
+        _one_hot(df["hr"].to_numpy() * 2 + df["workingday"].to_numpy(), 48),
+        _one_hot(df["season"].to_numpy() - 1, 4, drop_first=True),
+        _one_hot(df["weathersit"].to_numpy() - 1, 4, drop_first=True),
+        _one_hot(df["weekday"].to_numpy(), 7, drop_first=True),
+        np.column_stack([
+            temp,
+            df["atemp"].to_numpy(np.float32),
+            hum,
+            df["windspeed"].to_numpy(np.float32),
+            temp * temp,
+            temp * hum,
+            years.astype(np.float32),
+        ]),
+    ])
+
+
+class Accumulator:
+    """Statistik cukup dari potongan data per jam: persamaan normal ridge dan cuaca per (bulan, jam)."""
+
+    def __init__(self, origin=None, stats=None):
+        self.origin = origin
+        self.stats = {name: np.array(value) for name, value in (stats or {}).items()}
+
+    def _add(self, name, value):
+        self.stats[name] = self.stats[name] + value if name in self.stats else value
+
+    def _matrices(self, chunk):
+        X = design_matrix(chunk, self.origin).astype(np.float64)
+        Y = np.log1p(chunk[TARGETS].to_numpy(np.float64))
+        return X, Y
+
+    def update(self, chunk):
+        if not len(chunk):
+            return
+        dates = chunk["dteday"].to_numpy("datetime64[ns]")
+        if self.origin is None:
+            self.origin = dates.min()
+        X, Y = self._matrices(chunk)
+        self._add("gram", X.T @ X)
+        self._add("xty", X.T @ Y)
+        self._add("rows", np.int64(len(chunk)))
+        self.stats["end"] = max(self.stats.get("end", dates.max()), dates.max())
+
+        # Klimatologi: jumlah nilai cuaca dan frekuensi weathersit per sel (bulan, jam)
+        cell = (chunk["dteday"].dt.month.to_numpy(np.int64) - 1) * 24 + chunk["hr"].to_numpy(np.int64)
+        self._add("weather_rows", np.bincount(cell, minlength=12 * 24))
+        self._add("weather_sums", np.column_stack([
+            np.bincount(cell, weights=chunk[col].to_numpy(np.float64), minlength=12 * 24) for col in CLIMATE
+        ]))
+        weathersit = chunk["weathersit"].to_numpy(np.int64) - 1
+        self._add("weathersit_rows", np.bincount(cell * 4 + weathersit, minlength=12 * 24 * 4).reshape(-1, 4))
+
+    def solve(self, alpha=RIDGE_ALPHA):
+        gram = self.stats["gram"].copy()
+        gram[np.diag_indices_from(gram)] += alpha
+        return np.linalg.solve(gram, self.stats["xty"])
+
+    def add_residuals(self, chunk, weights):
+        """Menambahkan ``exp(residual)`` potongan ke jumlah untuk faktor smearing."""
+        if len(chunk):
+            X, Y = self._matrices(chunk)
+            self._add("smearing_sum", np.exp(Y - X @ weights).sum(axis=0))
+
+    def model(self, weights, signature=None):
+        smearing = self.stats["smearing_sum"] / self.stats["rows"]
+        return Model(weights.astype(np.float32), smearing.astype(np.float32), self.origin, signature, self.stats)
+
+
+def fit(chunks, alpha=RIDGE_ALPHA, signature=None):
+    """Melatih model dari ``chunks()``, fungsi yang mengembalikan iterable potongan data per jam.
+
+    Data dibaca dua kali: sekali untuk persamaan normal, sekali untuk
+    residual (faktor smearing) dengan bobot akhir.
+    """
+    accumulator = Accumulator()
+    for chunk in chunks():
+        accumulator.update(chunk)
+    if "gram" not in accumulator.stats:
+        raise ValueError("tidak ada data per jam untuk melatih model")
+    weights = accumulator.solve(alpha)
+    for chunk in chunks():
+        accumulator.add_residuals(chunk, weights)
+    return accumulator.model(weights, signature)
+
+
+def update(model, records, signature=None, alpha=RIDGE_ALPHA):
+    """Model yang diperbarui dengan ``records`` baru tanpa membaca ulang data lama."""
+    accumulator = Accumulator(model.origin, model.stats)
+    accumulator.update(records)
+    weights = accumulator.solve(alpha)
+    accumulator.add_residuals(records, weights)
+    return accumulator.model(weights, signature)
+
+
+def predict(model, df, batch_size=BATCH_SIZE):
+    """Prediksi ``casual``, ``registered``, dan ``cnt`` untuk setiap baris ``df``."""
+    out = np.empty((len(df), len(TARGETS)), dtype=np.float32)
+    for lo in range(0, len(df), batch_size):
+        batch = df.iloc[lo:lo + batch_size]
+        out[lo:lo + len(batch)] = design_matrix(batch, model.origin) @ model.weights
+    out = np.maximum(np.expm1(out) * model.smearing, 0)
+    result = pd.DataFrame(out, columns=TARGETS, index=df.index)
+    result["cnt"] = result["casual"] + result["registered"]
+    return result
+
+
+def save(model, path=MODEL_PATH):
+    """Menyimpan artefak model secara atomik."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp-{os.getpid()}.npz")
+    np.savez(tmp, weights=model.weights, smearing=model.smearing, origin=model.origin,
+             meta=json.dumps({"version": MODEL_VERSION, "signature": model.signature}),
+             **{f"stats_{name}": value for name, value in (model.stats or {}).items()})
+    os.replace(tmp, path)
+
+
+def load(path=MODEL_PATH):
+    """Artefak model, atau ``None`` jika tidak ada atau formatnya usang."""
+    try:
+        with np.load(path) as artifact:
+            meta = json.loads(str(artifact["meta"]))
+            if meta.get("version") != MODEL_VERSION:
+                return None
+            stats = {name[len("stats_"):]: artifact[name] for name in artifact.files if name.startswith("stats_")}
+            return Model(artifact["weights"], artifact["smearing"], artifact["origin"], meta["signature"], stats)
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def artifact_version(path=MODEL_PATH):
+    """Token versi artefak (berubah setiap kali artefak ditulis ulang), atau ``None`` jika tidak ada."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _source(allow_remote=False):
+    source = source_path("hour")
+    if source.exists():
+        return source, file_signature(source)
+    if not allow_remote:
+        raise FileNotFoundError(f"{source} tidak ditemukan dan fetch remote dinonaktifkan")
+    return REMOTE_URL.format(name="hour"), "remote"
+
+
+def train(allow_remote=False, chunksize=DEFAULT_CHUNKSIZE):
+    """Melatih model dari ``hour.csv`` per potongan lalu menyimpan artefaknya."""
+    source, signature = _source(allow_remote)
+    model = fit(lambda: iter_chunks(source, "hour", chunksize, usecols=COLUMNS), signature=signature)
+    save(model)
+    return model
+
+
+def load_or_train(allow_remote=False):
+    """Model dari artefak selama ``hour.csv`` tidak berubah; jika berubah, dilatih ulang dan disimpan.
+
+    Mengembalikan ``(model, trained)``; ``trained`` bernilai ``True`` jika artefak ditulis ulang.
+    """
+    source = source_path("hour")
+    signature = file_signature(source) if source.exists() else None
+    model = load()
+    if model is not None and (signature is None or model.signature == signature):
+        return model, False
+    return train(allow_remote), True
+
+
+def update_artifact(records, previous, signature):
+    """Hook append: memperbarui artefak dengan ``records`` jika artefak dibuat dari CSV ``previous``.
+
+    Artefak yang tidak ada atau dibuat dari isi CSV lain dibiarkan; latih
+    ulang dengan ``python -m bikeshare.forecast --retrain``.
+    """
+    model = load()
+    if model is None or model.signature != previous or not model.stats:
+        return None
+    model = update(model, records, signature)
+    save(model)
+    return model
+
+
+def last_date(model):
+    """Tanggal terakhir data latih model."""
+    return pd.Timestamp(np.asarray(model.stats["end"])[()]).date()
+
+
+def season_of(dates):
+    """Kode musim per tanggal dengan batas yang sama seperti dataset."""
+    dates = pd.DatetimeIndex(dates)
+    key = dates.month * 100 + dates.day
+    season = np.ones(len(dates), dtype=np.int8)
+    for month, day, code in SEASON_STARTS:
+        season[key >= month * 100 + day] = code
+    return season
+
+
+def climatology(model):
+    """Cuaca tipikal per (bulan, jam) dari statistik model: rata-rata nilai kontinu dan ``weathersit`` tersering.
+
+    Sel (bulan, jam) tanpa data memakai jam yang sama dari semua bulan.
+    """
+    rows = model.stats["weather_rows"].astype(np.float64)
+    sums = model.stats["weather_sums"]
+    weathersit = model.stats["weathersit_rows"]
+    hourly = lambda values: np.tile(values.reshape(12, 24, -1).sum(axis=0), (12, 1))
+    empty = rows == 0
+    rows = np.where(empty, hourly(rows[:, None])[:, 0], rows)
+    sums = np.where(empty[:, None], hourly(sums), sums)
+    weathersit = np.where(empty[:, None], hourly(weathersit), weathersit)
+
+    cells = np.arange(12 * 24)
+    typical = pd.DataFrame({"month": cells // 24 + 1, "hr": cells % 24})
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for j, col in enumerate(CLIMATE):
+            typical[col] = sums[:, j] / rows
+    typical["weathersit"] = weathersit.argmax(axis=1) + 1
+    return typical
+
+
+def future_hours(start, hours, weather):
+    """Fitur untuk ``hours`` jam mulai ``start``; ``weather`` per (``month``, ``hr``) atau per jam."""
+    stamps = pd.date_range(pd.Timestamp(start), periods=hours, freq="h")
+    weekday = ((stamps.dayofweek + 1) % 7).to_numpy(np.int8)
+    frame = pd.DataFrame({
+        "timestamp": stamps,
+        "dteday": stamps.normalize().astype("datetime64[ns]"),
+        "month": stamps.month.to_numpy(np.int8),
+        "hr": stamps.hour.to_numpy(np.int8),
+        "season": season_of(stamps),
+        "weekday": weekday,
+        "workingday": ((weekday >= 1) & (weekday <= 5)).astype(np.int8),
+    })
+    on = ["month", "hr"] if "month" in weather.columns else ["timestamp"]
+    return frame.merge(weather[on + WEATHER], on=on, how="left")
+
+
+def forecast(model, start, hours, weather):
+    """Prakiraan per jam (``timestamp``, ``casual``, ``registered``, ``cnt``) untuk ``hours`` jam."""
+    frame = future_hours(start, hours, weather)
+    return pd.concat([frame[["timestamp"]], predict(model, frame)], axis=1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Prakiraan permintaan per jam dari model hour.csv.")
+    parser.add_argument("--hours", type=int, default=24, help="jumlah jam ke depan (mis. 24 atau 168)")
+    parser.add_argument("--start", type=datetime.date.fromisoformat,
+                        help="tanggal mulai (default: sehari setelah data terakhir)")
+    parser.add_argument("--retrain", action="store_true", help="latih ulang walaupun artefak masih berlaku")
+    parser.add_argument("--train", action="store_true", help="hanya latih/perbarui artefak lalu keluar")
+    parser.add_argument("--out", help="CSV keluaran (default: stdout)")
+    args = parser.parse_args(argv)
+
+    if args.retrain:
+        model, trained = train(), True
+    else:
+        model, trained = load_or_train()
+    if args.train:
+        if trained:
+            print(f"artefak model ditulis ke {MODEL_PATH} (data sampai {last_date(model)})")
+        else:
+            print(f"artefak model di {MODEL_PATH} masih berlaku (data sampai {last_date(model)}); tidak ada yang ditulis")
+        return
+    start = args.start or last_date(model) + datetime.timedelta(days=1)
+    result = forecast(model, start, args.hours, climatology(model))
+    result.to_csv(args.out or sys.stdout, index=False, float_format="%.1f")
+
+
+if __name__ == "__main__":
+    main()
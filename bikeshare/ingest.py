@@ -0,0 +1,102 @@
+"""Ingest bertahap (chunked) untuk data per jam yang lebih besar dari memori.
+
+CSV dibaca per potongan ``chunksize`` baris dan hanya kolom yang dibutuhkan
+kubus. Setiap potongan langsung diringkas menjadi kubus parsial lalu
+dibuang, sehingga memori sebanding dengan jumlah sel kubus, bukan dengan
+jumlah baris input.
+
+Sampel berstrata untuk mode perkiraan (``load_sample``) juga disimpan di
+cache di samping kubusnya, sehingga start dingin tidak menarik sampel dari
+kubus penuh; mode append memeliharanya secara inkremental.
+"""
+import pandas as pd
+
+from .approx import SAMPLE_ROWS, draw_sample, use_sample, weigh
+from .cube import MEASURES, build_cube, merge_cubes
+from .filters import sort_by_date
+from .loader import DTYPES, REMOTE_URL, cached, file_signature, load_columns, read_meta, source_path
+
+DEFAULT_CHUNKSIZE = 100_000
+
+
+def iter_chunks(source, name, chunksize=DEFAULT_CHUNKSIZE, usecols=None):
+    """Membaca CSV ``source`` per potongan dengan dtype sempit."""
+    dtypes = DTYPES[name]
+    if usecols is not None:
+        dtypes = {col: dtype for col, dtype in dtypes.items() if col in usecols}
+    reader = pd.read_csv(source, dtype=dtypes, parse_dates=["dteday"], usecols=usecols, chunksize=chunksize)
+    with reader:
+        for chunk in reader:
+            chunk["dteday"] = chunk["dteday"].astype("datetime64[ns]")
+            yield chunk
+
+
+class CubeAccumulator:
+    """Memperbarui kubus secara inkremental dari potongan-potongan data."""
+
+    def __init__(self, dimensions, compact_rows=1_000_000):
+        self.dimensions = list(dimensions)
+        self.compact_rows = compact_rows
+        self.rows = 0
+        self._parts = []
+        self._pending = 0
+
+    def update(self, chunk):
+        part = build_cube(chunk, self.dimensions)
+        self._parts.append(part)
+        self.rows += len(chunk)
+        self._pending += len(part)
+        # Gabungkan kubus parsial secara berkala agar memori tetap terbatas
+        if self._pending > self.compact_rows:
+            self._compact()
+
+    def _compact(self):
+        if len(self._parts) > 1:
+            self._parts = [merge_cubes(self._parts, self.dimensions)]
+        self._pending = len(self._parts[0]) if self._parts else 0
+
+    def result(self):
+        if not self._parts:
+            return pd.DataFrame(columns=self.dimensions + MEASURES + ["n"])
+        self._compact()
+        return self._parts[0]
+
+
+def stream_cube(source, name, dimensions, chunksize=DEFAULT_CHUNKSIZE):
+    """Membangun kubus dari CSV tanpa pernah memuat seluruh tabel."""
+    accumulator = CubeAccumulator(dimensions)
+    for chunk in iter_chunks(source, name, chunksize, usecols=list(dimensions) + MEASURES):
+        accumulator.update(chunk)
+    return accumulator.result()
+
+
+def load_cube(name, dimensions, allow_remote=False, chunksize=DEFAULT_CHUNKSIZE):
+    """Memuat kubus ``name`` dari cache kolumnar, atau membangunnya secara streaming."""
+    cache_name = f"{name}_cube"
+    source = source_path(name)
+    if source.exists():
+        signature = {"csv": file_signature(source), "dimensions": list(dimensions)}
+    else:
+        # Tanpa CSV lokal, cache yang ada tetap dipakai (start offline)
+        meta = read_meta(cache_name)
+        if meta is not None and meta["source"]["dimensions"] == list(dimensions):
+            return sort_by_date(load_columns(cache_name, meta))
+        if not allow_remote:
+            raise FileNotFoundError(f"{source} tidak ditemukan dan fetch remote dinonaktifkan")
+        source = REMOTE_URL.format(name=name)
+        signature = {"csv": "remote", "dimensions": list(dimensions)}
+
+    return sort_by_date(cached(cache_name, signature, lambda: stream_cube(source, name, dimensions, chunksize)))
+
+
+def sample_signature(strata, csv_signature, rows=SAMPLE_ROWS):
+    return {"csv": csv_signature, "strata": list(strata), "rows": rows}
+
+
+def load_sample(name, cube, strata, rows=SAMPLE_ROWS):
+    """Sampel berbobot mode perkiraan untuk kubus ``name`` dari cache, atau ``None`` jika kubus kecil."""
+    if not use_sample(cube) or len(cube) <= rows:
+        return None
+    source = source_path(name)
+    signature = sample_signature(strata, file_signature(source) if source.exists() else "remote", rows)
+    return weigh(cached(f"{name}_sample", signature, lambda: draw_sample(cube, strata, rows)), strata)
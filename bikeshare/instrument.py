@@ -0,0 +1,232 @@
+"""Instrumentasi opsional: span waktu per tahap/grafik, counter, dan memori puncak.
+
+Saat tidak aktif dipakai ``NULL_PROFILER`` yang ``span()``-nya mengembalikan
+context manager kosong yang sama setiap kali, sehingga biaya pada jalur
+panas hanya satu pemanggilan method. Saat aktif, setiap rerun menghasilkan
+satu record yang dapat ditampilkan di sidebar, ditulis sebagai log JSON
+(logger ``bikeshare.metrics``), dan diagregasi untuk endpoint metrik lokal.
+
+``tracemalloc`` berlaku untuk seluruh proses dan memperlambat semua sesi,
+jadi hanya dipakai jika diminta (``trace_memory``). Tracing dibagi antar
+profiler yang aktif bersamaan dan baru dihentikan oleh yang terakhir selesai.
+Puncaknya direset setiap kali profiler baru dimulai, sehingga mencakup
+alokasi sejak awal rerun (termasuk alokasi sesi lain selama rerun), bukan
+puncak sepanjang umur proses. Profiler yang tidak sempat ``finish()`` (rerun
+terputus oleh ``st.rerun``, ``st.stop`` atau exception) melepas tracing lewat
+``close()`` atau paling lambat saat objeknya dibuang. Tanpa tracing, memori
+per rerun dilaporkan sebagai selisih RSS proses (``rss_delta_bytes``).
+"""
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+import weakref
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger("bikeshare.metrics")
+
+_NULL_SPAN = contextlib.nullcontext()
+
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+_tracing_owned = False
+
+
+def _start_tracing():
+    global _tracing_users, _tracing_owned
+    with _tracing_lock:
+        if _tracing_users == 0:
+            # Tracing yang sudah dimulai pihak lain tidak dihentikan di sini
+            _tracing_owned = not tracemalloc.is_tracing()
+            if _tracing_owned:
+                tracemalloc.start()
+        tracemalloc.reset_peak()
+        _tracing_users += 1
+
+
+def _stop_tracing():
+    """Puncak memori sejak tracing dimulai; tracing berhenti saat pengguna terakhir selesai."""
+    global _tracing_users
+    with _tracing_lock:
+        peak = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else None
+        _tracing_users -= 1
+        if _tracing_users == 0 and _tracing_owned:
+            tracemalloc.stop()
+    return peak
+
+
+def rss_bytes():
+    """RSS proses saat ini, atau ``None`` di luar Linux."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+class NullProfiler:
+    enabled = False
+
+    def span(self, name):
+        return _NULL_SPAN
+
+    def count(self, name, value=1):
+        pass
+
+    def mark(self, name):
+        pass
+
+    def close(self):
+        return None
+
+    def finish(self):
+        return None
+
+
+NULL_PROFILER = NullProfiler()
+
+
+class Profiler:
+    enabled = True
+
+    def __init__(self, trace_memory=True, start=None):
+        self.spans = []
+        self.counters = defaultdict(int)
+        self.marks = {}
+        self._start = time.perf_counter() if start is None else start
+        self._start_rss = rss_bytes()
+        self._release = None
+        if trace_memory:
+            _start_tracing()
+            # Dipanggil sekali saja: oleh close()/finish(), atau saat profiler dibuang
+            self._release = weakref.finalize(self, _stop_tracing)
+
+    @contextlib.contextmanager
+    def span(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans.append((name, time.perf_counter() - start))
+
+    def count(self, name, value=1):
+        self.counters[name] += value
+
+    def mark(self, name):
+        """Mencatat waktu sejak awal rerun saat sebuah titik tercapai (mis. metrik pertama)."""
+        self.marks.setdefault(name, time.perf_counter() - self._start)
+
+    def close(self):
+        """Melepas tracing tanpa membuat record; aman dipanggil berulang kali.
+
+        Mengembalikan puncak memori pada pemanggilan pertama, ``None`` setelahnya.
+        """
+        return self._release() if self._release is not None else None
+
+    def finish(self):
+        """Menutup rerun dan mengembalikan record metriknya."""
+        peak = self.close()
+        rss = rss_bytes()
+        record = {
+            "timestamp": time.time(),
+            "total_seconds": time.perf_counter() - self._start,
+            "spans": [{"name": name, "seconds": seconds} for name, seconds in self.spans],
+            "counters": dict(self.counters),
+            "marks": dict(self.marks),
+            "rss_delta_bytes": None if rss is None or self._start_rss is None else rss - self._start_rss,
+            "peak_bytes": peak,
+        }
+        logger.info(json.dumps(record))
+        return record
+
+
+def make_profiler(enabled, start=None, trace_memory=False):
+    return Profiler(trace_memory=trace_memory, start=start) if enabled else NULL_PROFILER
+
+
+class MetricsStore:
+    """Agregat metrik lintas rerun untuk satu proses (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reruns = 0
+        self.last = None
+        self.spans = defaultdict(lambda: {"count": 0, "seconds": 0.0, "max_seconds": 0.0})
+        self.counters = defaultdict(int)
+        self.max_peak_bytes = 0
+
+    def add(self, record):
+        if record is None:
+            return
+        with self._lock:
+            self.reruns += 1
+            self.last = record
+            for span in record["spans"]:
+                self._add_span(span["name"], span["seconds"])
+            # Mark diagregasi seperti span (waktu sejak awal rerun)
+            for name, seconds in record.get("marks", {}).items():
+                self._add_span(f"mark:{name}", seconds)
+            for name, value in record["counters"].items():
+                self.counters[name] += value
+            self.max_peak_bytes = max(self.max_peak_bytes, record["peak_bytes"] or 0)
+
+    def _add_span(self, name, seconds):
+        total = self.spans[name]
+        total["count"] += 1
+        total["seconds"] += seconds
+        total["max_seconds"] = max(total["max_seconds"], seconds)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "reruns": self.reruns,
+                "spans": {name: dict(total) for name, total in self.spans.items()},
+                "counters": dict(self.counters),
+                "max_peak_bytes": self.max_peak_bytes,
+                "last": self.last,
+            }
+
+    def prometheus(self):
+        """Snapshot dalam format teks Prometheus."""
+        snapshot = self.snapshot()
+        lines = [f"bikeshare_reruns_total {snapshot['reruns']}",
+                 f"bikeshare_peak_bytes_max {snapshot['max_peak_bytes']}"]
+        for name, total in sorted(snapshot["spans"].items()):
+            label = json.dumps(name)
+            lines.append(f"bikeshare_span_seconds_sum{{span={label}}} {total['seconds']}")
+            lines.append(f"bikeshare_span_seconds_count{{span={label}}} {total['count']}")
+            lines.append(f"bikeshare_span_seconds_max{{span={label}}} {total['max_seconds']}")
+        for name, value in sorted(snapshot["counters"].items()):
+            lines.append(f"bikeshare_counter_total{{name={json.dumps(name)}}} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def serve_metrics(store, port, host="127.0.0.1"):
+    """Menjalankan endpoint metrik lokal (``/metrics`` dan ``/metrics.json``) di thread daemon."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/metrics":
+                body, content_type = store.prometheus(), "text/plain; version=0.0.4"
+            elif self.path == "/metrics.json":
+                body, content_type = json.dumps(store.snapshot()), "application/json"
+            else:
+                self.send_error(404)
+                return
+            payload = body.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="bikeshare-metrics", daemon=True).start()
+    return server
@@ -0,0 +1,69 @@
+"""Join day↔hour on-demand lewat indeks tanggal, pengganti ``main_data.csv``.
+
+Tabel harian dan per jam disimpan terpisah. Atribut harian untuk baris per
+jam diambil dengan lookup terindeks pada ``dteday`` saat dibutuhkan, tanpa
+file lebar yang mengulang 16 kolom harian pada setiap jam. Join bersifat
+left join: semua baris per jam dipertahankan.
+
+Untuk analis yang tetap membutuhkan file gabungan::
+
+    python -m bikeshare.join --out gabungan.csv
+"""
+import argparse
+
+import numpy as np
+
+from .loader import load_table
+
+DAY_SUFFIX = "_day"
+
+
+def day_positions(hour_df, day_df):
+    """Posisi baris harian untuk setiap baris per jam (-1 jika tanggal tidak ada)."""
+    dates = day_df["dteday"].to_numpy()
+    hour_dates = hour_df["dteday"].to_numpy()
+    positions = np.searchsorted(dates, hour_dates)
+    positions = np.minimum(positions, len(dates) - 1) if len(dates) else np.zeros_like(positions)
+    found = (dates[positions] == hour_dates) if len(dates) else np.zeros(len(hour_dates), dtype=bool)
+    return np.where(found, positions, -1)
+
+
+def day_attribute(hour_df, day_df, column, positions=None):
+    """Satu kolom harian yang disejajarkan dengan baris-baris ``hour_df``."""
+    if positions is None:
+        positions = day_positions(hour_df, day_df)
+    values = day_df[column].take(np.maximum(positions, 0)).to_numpy()
+    missing = positions < 0
+    if missing.any():
+        values = values.astype("float64" if values.dtype.kind in "iuf" else "object")
+        values[missing] = np.nan
+    return values
+
+
+def join_day(hour_df, day_df, columns=None, suffix=DAY_SUFFIX):
+    """Baris per jam dengan atribut harian ``columns`` (default: semua kolom harian).
+
+    ``day_df`` harus terurut menurut ``dteday`` dengan satu baris per tanggal.
+    """
+    if columns is None:
+        columns = [col for col in day_df.columns if col != "dteday"]
+    positions = day_positions(hour_df, day_df)
+    joined = hour_df.copy()
+    for col in columns:
+        joined[f"{col}{suffix}"] = day_attribute(hour_df, day_df, col, positions)
+    return joined
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Membuat file gabungan day↔hour secara on-demand.")
+    parser.add_argument("--out", required=True, help="path CSV keluaran")
+    parser.add_argument("--columns", nargs="+", help="kolom harian yang disertakan (default: semua)")
+    args = parser.parse_args(argv)
+
+    joined = join_day(load_table("hour"), load_table("day"), args.columns)
+    joined.to_csv(args.out, index=False, date_format="%Y-%m-%d")
+    print(f"{len(joined)} baris ditulis ke {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""Label tampilan untuk kode kategorik dataset."""
+
+season_mapping = {1: "Spring", 2: "Summer", 3: "Fall", 4: "Winter"}
+weathersit_mapping = {1: "Clear", 2: "Misty", 3: "Light Rain/Snow", 4: "Heavy Rain/Snow"}
+weekday_mapping = {0: 'Minggu', 1: 'Senin', 2: 'Selasa', 3: 'Rabu', 4: 'Kamis', 5: 'Jumat', 6: 'Sabtu'}
+workingday_mapping = {0: 'Libur/Akhir Pekan', 1: 'Hari Kerja'}
+
+season_order = ["Spring", "Summer", "Fall", "Winter"]
+weekday_order = ['Senin', 'Selasa', 'Rabu', 'Kamis', 'Jumat', 'Sabtu', 'Minggu']
+month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+# Kolom kode -> (kolom label, mapping)
+name_mappings = {
+    "season": ("season_name", season_mapping),
+    "weathersit": ("weathersit_name", weathersit_mapping),
+    "weekday": ("weekday_name", weekday_mapping),
+}
+
+
+def with_names(df):
+    """Menambahkan kolom label untuk setiap kolom kode yang ada di ``df``."""
+    for col, (name_col, mapping) in name_mappings.items():
+        if col in df.columns:
+            df[name_col] = df[col].map(mapping)
+    return df
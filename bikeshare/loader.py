@@ -0,0 +1,173 @@
+"""Loader data lokal dengan cache kolumnar yang di-memory-map.
+
+CSV bawaan (day.csv/hour.csv) hanya di-parse sekali. Hasilnya disimpan per
+kolom sebagai file biner mentah dengan dtype sempit, lalu pada start
+berikutnya dibuka dengan ``np.memmap`` tanpa parsing ulang.
+"""
+import json
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DATA_DIR = Path(os.environ.get("BIKESHARE_DATA_DIR", Path(__file__).resolve().parent.parent))
+CACHE_DIR = Path(os.environ.get("BIKESHARE_CACHE_DIR", DATA_DIR / ".cache"))
+REMOTE_URL = "https://raw.githubusercontent.com/fenia-k/Bike-Sharing-Dataset/refs/heads/main/{name}.csv"
+
+# Naikkan jika format cache berubah agar cache lama dibangun ulang
+CACHE_VERSION = 1
+
+# Dtype sempit per kolom; dteday di-parse menjadi datetime64[ns]
+_COMMON_DTYPES = {
+    "instant": "int32",
+    "season": "int8",
+    "yr": "int8",
+    "mnth": "int8",
+    "holiday": "int8",
+    "weekday": "int8",
+    "workingday": "int8",
+    "weathersit": "int8",
+    "temp": "float32",
+    "atemp": "float32",
+    "hum": "float32",
+    "windspeed": "float32",
+    "casual": "int32",
+    "registered": "int32",
+    "cnt": "int32",
+}
+DTYPES = {
+    "day": dict(_COMMON_DTYPES),
+    "hour": {**_COMMON_DTYPES, "hr": "int8"},
+}
+
+
+def source_path(name):
+    return DATA_DIR / f"{name}.csv"
+
+
+def read_csv(source, name):
+    """Membaca CSV mentah dengan dtype sempit."""
+    df = pd.read_csv(source, dtype=DTYPES[name], parse_dates=["dteday"])
+    # Resolusi tanggal disamakan lintas versi pandas
+    df["dteday"] = df["dteday"].astype("datetime64[ns]")
+    return df
+
+
+def file_signature(path):
+    stat = path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def data_version(names=("day", "hour")):
+    """Token versi data; berubah setiap kali CSV sumber berubah (mis. setelah append)."""
+    version = []
+    for name in names:
+        path = source_path(name)
+        if path.exists():
+            stat = path.stat()
+            version.append((name, stat.st_size, stat.st_mtime_ns))
+    return tuple(version)
+
+
+def _cache_path(name):
+    return CACHE_DIR / name
+
+
+def read_meta(name):
+    try:
+        with open(_cache_path(name) / "meta.json") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get("version") != CACHE_VERSION:
+        return None
+    return meta
+
+
+def write_meta(name, meta, directory=None):
+    directory = Path(directory or _cache_path(name))
+    tmp = directory / "meta.json.tmp"
+    with open(tmp, "w") as f:
+        json.dump(meta, f)
+    os.replace(tmp, directory / "meta.json")
+
+
+def write_columns(name, df, source):
+    """Menulis DataFrame ke cache kolumnar secara atomik."""
+    final = _cache_path(name)
+    final.parent.mkdir(parents=True, exist_ok=True)
+    tmp = final.parent / f".{final.name}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+
+    columns = []
+    for col in df.columns:
+        values = np.ascontiguousarray(df[col].to_numpy())
+        values.tofile(tmp / f"{col}.bin")
+        columns.append([col, values.dtype.str])
+
+    meta = {"version": CACHE_VERSION, "rows": len(df), "columns": columns, "source": source}
+    write_meta(name, meta, tmp)
+
+    # File lama yang masih di-mmap proses lain tetap valid setelah di-unlink
+    shutil.rmtree(final, ignore_errors=True)
+    os.rename(tmp, final)
+    return meta
+
+
+def load_columns(name, meta):
+    """Membuka cache kolumnar sebagai DataFrame berbasis memmap (read-only)."""
+    directory = _cache_path(name)
+    rows = meta["rows"]
+    data = {}
+    for col, dtype in meta["columns"]:
+        if rows == 0:
+            data[col] = np.empty(0, dtype=dtype)
+        else:
+            data[col] = np.memmap(directory / f"{col}.bin", dtype=dtype, mode="r", shape=(rows,))
+    return pd.DataFrame(data, copy=False)
+
+
+def cached(cache_name, signature, build):
+    """Memuat hasil ``build()`` dari cache kolumnar selama ``signature`` sama."""
+    meta = read_meta(cache_name)
+    if meta is not None and meta["source"] == signature:
+        return load_columns(cache_name, meta)
+
+    df = build()
+    try:
+        write_columns(cache_name, df, signature)
+    except OSError:
+        pass
+    return df
+
+
+def load_table(name, allow_remote=False):
+    """Memuat ``day``/``hour`` dari cache, CSV lokal, atau (opsional) GitHub.
+
+    Cache dipakai selama CSV lokal tidak berubah (ukuran dan mtime sama),
+    atau jika CSV lokal tidak ada sama sekali.
+    """
+    source = source_path(name)
+    signature = file_signature(source) if source.exists() else None
+
+    meta = read_meta(name)
+    if meta is not None and (signature is None or meta["source"] == signature):
+        return load_columns(name, meta)
+
+    if signature is not None:
+        df = read_csv(source, name)
+    elif allow_remote:
+        df = read_csv(REMOTE_URL.format(name=name), name)
+        signature = "remote"
+    else:
+        raise FileNotFoundError(f"{source} tidak ditemukan dan fetch remote dinonaktifkan")
+
+    try:
+        write_columns(name, df, signature)
+    except OSError:
+        # Filesystem read-only: tetap jalan tanpa cache
+        pass
+    return df
@@ -0,0 +1,269 @@
+"""Uji beban lokal: banyak sesi dashboard bersamaan tanpa browser maupun server.
+
+Setiap sesi simulasi adalah satu ``AppTest`` (``streamlit.testing``) yang
+menjalankan ``dashboard.py`` berulang kali dengan filter tanggal, musim, dan
+cuaca acak, serta tab, mode render tab, dan backend grafik acak, seperti
+pengguna yang mengubah sidebar dan berpindah tab. Semua sesi berjalan
+sebagai thread dalam satu proses, sama seperti server Streamlit melayani
+sesi-sesinya, sehingga cache bersama (kubus, hasil agregasi, figure) ikut
+teruji. Sebelum pengukuran, satu sesi pemanasan membangun cache.
+
+Selama uji, CPU dan RSS proses disampel secara berkala dari ``/proc``
+(hanya Linux). Hasilnya berupa JSON Lines: satu baris per sampel dan satu
+ringkasan berisi persentil latensi rerun, throughput, pemakaian CPU, dan
+pertumbuhan memori. Dengan ``--check`` perintah keluar dengan status 1 jika
+ada batas yang terlampaui, sehingga bisa dipakai sebagai gerbang rilis.
+
+Contoh::
+
+    python -m bikeshare.loadtest --sessions 8 --duration 120 --out loadtest.jsonl --check
+"""
+import argparse
+import datetime
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+from .instrument import rss_bytes
+from .labels import season_mapping, weathersit_mapping
+
+DASHBOARD = Path(__file__).resolve().parent.parent / "dashboard.py"
+PERCENTILES = (50, 90, 95, 99)
+# Radio tab dashboard (hanya ada pada mode "Render hanya tab yang dibuka")
+TAB_KEYS = ("tabs_q1", "tabs_q2")
+
+# Batas default untuk --check (dapat diubah lewat variabel lingkungan atau argumen)
+P95_TARGET = float(os.environ.get("BIKESHARE_LOADTEST_P95", "10.0"))
+MIN_THROUGHPUT = float(os.environ.get("BIKESHARE_LOADTEST_MIN_THROUGHPUT", "0.5"))
+MAX_RSS_GROWTH_MB = float(os.environ.get("BIKESHARE_LOADTEST_MAX_RSS_GROWTH_MB", "256"))
+
+
+def cpu_seconds():
+    """Waktu CPU (user + system) proses ini."""
+    times = os.times()
+    return times.user + times.system
+
+
+def random_filter(rng, data_start, data_end):
+    """Rentang tanggal, musim, dan cuaca acak (masing-masing tidak kosong)."""
+    days = (data_end - data_start).days
+    start = data_start + datetime.timedelta(days=int(rng.integers(0, days + 1)))
+    end = start + datetime.timedelta(days=int(rng.integers(0, (data_end - start).days + 1)))
+    seasons = list(season_mapping.values())
+    weathers = list(weathersit_mapping.values())
+    return (
+        start,
+        end,
+        [seasons[i] for i in sorted(rng.choice(len(seasons), rng.integers(1, len(seasons) + 1), replace=False))],
+        [weathers[i] for i in sorted(rng.choice(len(weathers), rng.integers(1, len(weathers) + 1), replace=False))],
+    )
+
+
+class Session:
+    """Satu sesi simulasi: satu ``AppTest`` yang dijalankan ulang dengan filter acak."""
+
+    def __init__(self, seed, timeout=300):
+        from streamlit.testing.v1 import AppTest
+
+        self.rng = np.random.default_rng(seed)
+        self.app = AppTest.from_file(str(DASHBOARD), default_timeout=timeout)
+        self.bounds = None
+
+    def _widget(self, kind, label):
+        return next(widget for widget in getattr(self.app, kind) if widget.label == label)
+
+    def _choose(self, widget):
+        widget.set_value(widget.options[int(self.rng.integers(len(widget.options)))])
+
+    def run(self, randomize=True):
+        """Satu rerun; mengembalikan ``(detik, pesan error atau None)``.
+
+        Rerun pertama harus tanpa ``randomize``: nilai awal input tanggal
+        adalah rentang data yang dipakai untuk mengacak filter berikutnya.
+        """
+        if randomize:
+            start, end, seasons, weathers = random_filter(self.rng, *self.bounds)
+            self._widget("date_input", "Tanggal Mulai").set_value(start)
+            self._widget("date_input", "Tanggal Akhir").set_value(end)
+            self._widget("multiselect", "Musim").set_value(seasons)
+            self._widget("multiselect", "Kondisi Cuaca").set_value(weathers)
+            self._widget("toggle", "Render hanya tab yang dibuka").set_value(bool(self.rng.integers(2)))
+            self._choose(self._widget("radio", "Backend grafik"))
+            for tabs in self.app.radio:
+                if tabs.key in TAB_KEYS:
+                    self._choose(tabs)
+        begin = time.perf_counter()
+        try:
+            self.app.run()
+        except Exception as exc:  # noqa: BLE001 - timeout/gagal dicatat sebagai error sesi
+            return time.perf_counter() - begin, f"{type(exc).__name__}: {exc}"
+        seconds = time.perf_counter() - begin
+        if self.app.exception:
+            return seconds, self.app.exception[0].message
+        if self.bounds is None:
+            self.bounds = (self._widget("date_input", "Tanggal Mulai").value,
+                           self._widget("date_input", "Tanggal Akhir").value)
+        return seconds, None
+
+
+class Recorder:
+    """Latensi rerun dan sampel CPU/RSS berkala, aman dipakai dari banyak thread."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = []
+        self.errors = []
+        self.samples = []
+        self._start = time.perf_counter()
+        self._last = (self._start, cpu_seconds())
+
+    def add(self, seconds, error=None):
+        with self._lock:
+            self.latencies.append(seconds)
+            if error is not None:
+                self.errors.append(error)
+
+    def sample(self):
+        now, cpu = time.perf_counter(), cpu_seconds()
+        last_time, last_cpu = self._last
+        self._last = (now, cpu)
+        with self._lock:
+            requests = len(self.latencies)
+        sample = {
+            "stage": "loadtest:sample",
+            "elapsed_seconds": now - self._start,
+            "requests": requests,
+            "cpu_percent": 100 * (cpu - last_cpu) / max(now - last_time, 1e-9),
+            "rss_bytes": rss_bytes(),
+            "threads": threading.active_count(),
+        }
+        self.samples.append(sample)
+        return sample
+
+
+def _sampler(recorder, interval, stop, out):
+    while not stop.wait(interval):
+        out.write(json.dumps(recorder.sample()) + "\n")
+        out.flush()
+
+
+def _worker(session, recorder, deadline, iterations):
+    done = 0
+    while time.perf_counter() < deadline and (iterations is None or done < iterations):
+        recorder.add(*session.run())
+        done += 1
+
+
+def summarize(recorder, sessions, duration, baseline_rss):
+    """Ringkasan uji: persentil latensi, throughput, CPU, dan pertumbuhan memori."""
+    latencies = np.array(recorder.latencies)
+    samples = recorder.samples
+    elapsed = np.array([sample["elapsed_seconds"] for sample in samples])
+    rss = np.array([sample["rss_bytes"] for sample in samples], dtype=np.float64)
+    # Kemiringan RSS terhadap waktu: pertumbuhan yang terus naik menandakan kebocoran
+    slope = float(np.polyfit(elapsed, rss, 1)[0]) if len(samples) > 1 else 0.0
+    return {
+        "stage": "loadtest:summary",
+        "sessions": sessions,
+        "duration_seconds": duration,
+        "requests": len(latencies),
+        "errors": len(recorder.errors),
+        "error_examples": recorder.errors[:5],
+        "throughput_rps": len(latencies) / duration if duration else 0.0,
+        **{f"p{p}_seconds": float(np.percentile(latencies, p)) if len(latencies) else None for p in PERCENTILES},
+        "max_seconds": float(latencies.max()) if len(latencies) else None,
+        "cpu_percent_mean": float(np.mean([sample["cpu_percent"] for sample in samples])) if samples else None,
+        "rss_baseline_bytes": baseline_rss,
+        "rss_peak_bytes": int(rss.max()) if len(rss) else baseline_rss,
+        "rss_final_bytes": int(rss[-1]) if len(rss) else baseline_rss,
+        "rss_growth_bytes": int(rss[-1] - baseline_rss) if len(rss) else 0,
+        "rss_slope_bytes_per_minute": slope * 60,
+    }
+
+
+def run(sessions, duration, iterations=None, seed=0, interval=1.0, out=sys.stdout):
+    """Menjalankan ``sessions`` sesi bersamaan selama ``duration`` detik; mengembalikan ringkasannya."""
+    # Pemanasan: cache data, ringkasan, dan model dibangun sebelum pengukuran
+    warmup = Session(seed=seed)
+    warmup.run(randomize=False)
+    warmup.run()
+
+    simulated = [Session(seed=seed + i + 1) for i in range(sessions)]
+    for session in simulated:
+        session.run(randomize=False)
+
+    recorder = Recorder()
+    baseline_rss = rss_bytes()
+    stop = threading.Event()
+    sampler = threading.Thread(target=_sampler, args=(recorder, interval, stop, out), daemon=True)
+    sampler.start()
+
+    start = time.perf_counter()
+    deadline = start + duration
+    workers = [
+        threading.Thread(target=_worker, args=(session, recorder, deadline, iterations), name=f"session-{i}")
+        for i, session in enumerate(simulated)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    sampler.join()
+    out.write(json.dumps(recorder.sample()) + "\n")
+    summary = summarize(recorder, sessions, elapsed, baseline_rss)
+    out.write(json.dumps(summary) + "\n")
+    out.flush()
+    return summary
+
+
+def check(summary, max_p95=P95_TARGET, min_throughput=MIN_THROUGHPUT, max_rss_growth_mb=MAX_RSS_GROWTH_MB):
+    """Daftar pelanggaran batas rilis (kosong jika lolos)."""
+    failures = []
+    if summary["errors"]:
+        failures.append(f"{summary['errors']} rerun gagal, mis. {summary['error_examples'][0]}")
+    if summary["p95_seconds"] is None or summary["p95_seconds"] > max_p95:
+        failures.append(f"latensi p95 {summary['p95_seconds']} s melampaui {max_p95} s")
+    if summary["throughput_rps"] < min_throughput:
+        failures.append(f"throughput {summary['throughput_rps']:.2f} rerun/s di bawah {min_throughput}")
+    if summary["rss_growth_bytes"] > max_rss_growth_mb * 2**20:
+        failures.append(f"RSS tumbuh {summary['rss_growth_bytes'] / 2**20:.1f} MiB, melampaui {max_rss_growth_mb} MiB")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Uji beban headless untuk dashboard.py dengan banyak sesi bersamaan.")
+    parser.add_argument("--sessions", type=int, default=4, help="jumlah sesi simulasi bersamaan")
+    parser.add_argument("--duration", type=float, default=60, help="lama pengukuran (detik)")
+    parser.add_argument("--iterations", type=int, help="batas rerun per sesi (default: sampai --duration habis)")
+    parser.add_argument("--seed", type=int, default=0, help="seed filter acak")
+    parser.add_argument("--interval", type=float, default=1.0, help="jarak sampel CPU/RSS (detik)")
+    parser.add_argument("--out", help="file JSON Lines keluaran (default: stdout)")
+    parser.add_argument("--max-p95", type=float, default=P95_TARGET, help="batas latensi p95 (detik)")
+    parser.add_argument("--min-throughput", type=float, default=MIN_THROUGHPUT, help="batas bawah rerun per detik")
+    parser.add_argument("--max-rss-growth", type=float, default=MAX_RSS_GROWTH_MB,
+                        help="batas pertumbuhan RSS selama uji (MiB)")
+    parser.add_argument("--check", action="store_true", help="keluar dengan status 1 jika ada batas terlampaui")
+    args = parser.parse_args(argv)
+
+    out = open(args.out, "w") if args.out else sys.stdout
+    try:
+        summary = run(args.sessions, args.duration, args.iterations, args.seed, args.interval, out)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    failures = check(summary, args.max_p95, args.min_throughput, args.max_rss_growth)
+    if args.check and failures:
+        sys.exit("uji beban gagal: " + "; ".join(failures))
+
+
+if __name__ == "__main__":
+    main()
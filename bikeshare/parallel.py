@@ -0,0 +1,48 @@
+"""Agregasi multi-grafik secara paralel di atas satu dataset terfilter.
+
+Semua query grafik yang dibutuhkan untuk state filter saat ini direncanakan
+di awal, lalu dijalankan bersamaan pada thread pool. Thread berbagi kubus
+terfilter yang sama (read-only) sehingga tidak ada salinan atau serialisasi
+data per worker; operasi groupby/reduksi numpy dan pandas melepas GIL untuk
+sebagian besar pekerjaannya. Rendering tetap dilakukan setelahnya di thread
+pemanggil.
+
+Jumlah worker diatur dengan ``BIKESHARE_WORKERS`` (``1`` = sekuensial).
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .charts import CHARTS
+
+
+def default_workers():
+    """Jumlah worker dari ``BIKESHARE_WORKERS``, default sesuai jumlah CPU (maks. 8)."""
+    return int(os.environ.get("BIKESHARE_WORKERS", "0")) or min(8, os.cpu_count() or 1)
+
+
+def make_executor(max_workers=None):
+    """Thread pool untuk agregasi, atau ``None`` jika hanya satu worker."""
+    max_workers = max_workers or default_workers()
+    if max_workers <= 1:
+        return None
+    return ThreadPoolExecutor(max_workers, thread_name_prefix="bikeshare-agg")
+
+
+def run_all(tasks, executor=None):
+    """Menjalankan ``tasks`` ({kunci: callable}) dan mengembalikan {kunci: hasil}.
+
+    Tanpa executor (atau hanya satu task) semuanya dijalankan berurutan di
+    thread pemanggil. Exception dari task diteruskan ke pemanggil.
+    """
+    if executor is None or len(tasks) <= 1:
+        return {key: task() for key, task in tasks.items()}
+    futures = {key: executor.submit(task) for key, task in tasks.items()}
+    return {key: future.result() for key, future in futures.items()}
+
+
+def query_charts(chart_ids, day_cube, hour_cube, executor=None):
+    """Hasil query ``chart_ids`` atas kubus terfilter yang sama, dihitung paralel."""
+    return run_all(
+        {chart_id: (lambda chart=CHARTS[chart_id]: chart.query(day_cube, hour_cube)) for chart_id in chart_ids},
+        executor,
+    )
@@ -0,0 +1,197 @@
+"""Dataset terpartisi per kota/stasiun dan per bulan.
+
+Tata letaknya bergaya Hive di bawah ``BIKESHARE_PARTITION_DIR`` (default
+``partitions/`` di direktori data)::
+
+    partitions/city=<kota>/station=<stasiun>/month=<YYYY-MM>/day.csv
+    partitions/city=<kota>/station=<stasiun>/month=<YYYY-MM>/hour.csv
+
+Skema setiap file sama dengan ``day.csv``/``hour.csv`` bawaan. Partisi
+dipangkas dari path-nya saja (kota, stasiun, dan bulan yang beririsan
+dengan rentang tanggal), sehingga hanya file yang relevan yang dibaca.
+Setiap partisi punya kubus ter-cache sendiri; kubus partisi terpilih
+digabung dengan ``merge_cubes``, jadi biayanya sebanding dengan potongan
+yang dipilih, bukan dengan seluruh riwayat armada. Rata-rata pada kubus
+gabungan berarti rata-rata per stasiun per hari (atau per jam).
+
+Membuat partisi dari ``day.csv``/``hour.csv`` satu stasiun::
+
+    python -m bikeshare.partitions --city washington --station pusat
+"""
+import argparse
+import calendar
+import datetime
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+import pandas as pd
+
+from .cube import DAY_DIMENSIONS, HOUR_DIMENSIONS, MEASURES, build_cube, merge_cubes
+from .filters import sort_by_date
+from .ingest import stream_cube
+from .loader import DATA_DIR, DTYPES, cached, file_signature, load_table, read_csv
+from .parallel import run_all
+
+PARTITION_DIR = Path(os.environ.get("BIKESHARE_PARTITION_DIR", DATA_DIR / "partitions"))
+
+
+class Partition(NamedTuple):
+    city: str
+    station: str
+    month: datetime.date
+    path: Path
+
+    @property
+    def last_day(self):
+        return self.month.replace(day=calendar.monthrange(self.month.year, self.month.month)[1])
+
+
+def _key_value(entry, key):
+    prefix = f"{key}="
+    if entry.is_dir() and entry.name.startswith(prefix):
+        return entry.name[len(prefix):]
+    return None
+
+
+def discover(root=None):
+    """Semua partisi di ``root``, terurut menurut kota, stasiun, dan bulan (hanya listing direktori)."""
+    root = Path(root or PARTITION_DIR)
+    if not root.is_dir():
+        return []
+    partitions = []
+    for city_entry in os.scandir(root):
+        city = _key_value(city_entry, "city")
+        if city is None:
+            continue
+        for station_entry in os.scandir(city_entry.path):
+            station = _key_value(station_entry, "station")
+            if station is None:
+                continue
+            for month_entry in os.scandir(station_entry.path):
+                month = _key_value(month_entry, "month")
+                if month is None:
+                    continue
+                try:
+                    month = datetime.datetime.strptime(month, "%Y-%m").date()
+                except ValueError:
+                    continue
+                partitions.append(Partition(city, station, month, Path(month_entry.path)))
+    return sorted(partitions)
+
+
+def normalize_locations(cities=None, stations=None):
+    """Pilihan kota/stasiun sebagai tuple terurut; kosong atau ``None`` berarti semua."""
+    return (
+        tuple(sorted(cities)) if cities else None,
+        tuple(sorted(stations)) if stations else None,
+    )
+
+
+def prune(partitions, cities=None, stations=None, start=None, end=None):
+    """Partisi yang beririsan dengan pilihan kota, stasiun ``(kota, stasiun)``, dan rentang tanggal."""
+    cities = None if cities is None else set(cities)
+    stations = None if stations is None else {tuple(station) for station in stations}
+    selected = []
+    for partition in partitions:
+        if cities is not None and partition.city not in cities:
+            continue
+        if stations is not None and (partition.city, partition.station) not in stations:
+            continue
+        if start is not None and partition.last_day < start:
+            continue
+        if end is not None and partition.month > end:
+            continue
+        selected.append(partition)
+    return selected
+
+
+def date_range(partitions):
+    """Tanggal pertama dan terakhir yang dicakup ``partitions`` (menurut nama bulannya)."""
+    if not partitions:
+        return None, None
+    return min(p.month for p in partitions), max(p.last_day for p in partitions)
+
+
+def partition_version(partitions):
+    """Token versi untuk partisi terpilih; hanya file partisi itu yang di-stat."""
+    version = []
+    for partition in partitions:
+        for name in ("day", "hour"):
+            path = partition.path / f"{name}.csv"
+            if path.exists():
+                stat = path.stat()
+                version.append((str(path), stat.st_size, stat.st_mtime_ns))
+    return tuple(version)
+
+
+def _cache_name(partition, name):
+    return f"partitions/city={partition.city}/station={partition.station}/month={partition.month:%Y-%m}/{name}"
+
+
+def _empty_cube(name, dimensions):
+    columns = list(dimensions) + MEASURES
+    empty = pd.DataFrame({
+        col: pd.Series(dtype="datetime64[ns]" if col == "dteday" else DTYPES[name][col]) for col in columns
+    })
+    return build_cube(empty, dimensions)
+
+
+def load_partition(partition):
+    """Kubus harian dan per jam satu partisi, dari cache kolumnar jika CSV-nya tidak berubah."""
+    cubes = []
+    for name, dimensions in (("day", DAY_DIMENSIONS), ("hour", HOUR_DIMENSIONS)):
+        source = partition.path / f"{name}.csv"
+        if not source.exists():
+            cubes.append(None)
+            continue
+        signature = {"csv": file_signature(source), "dimensions": list(dimensions)}
+        if name == "day":
+            build = lambda source=source: build_cube(read_csv(source, "day"), DAY_DIMENSIONS)
+        else:
+            build = lambda source=source: stream_cube(source, "hour", HOUR_DIMENSIONS)
+        cubes.append(cached(_cache_name(partition, f"{name}_cube"), signature, build))
+    return tuple(cubes)
+
+
+def load_partitions(partitions, executor=None):
+    """Kubus harian dan per jam gabungan dari ``partitions``.
+
+    Partisi dimuat bersamaan jika ``executor`` diberikan (lihat ``parallel``).
+    """
+    loaded = run_all({partition: (lambda p=partition: load_partition(p)) for partition in partitions}, executor)
+    results = []
+    for i, (name, dimensions) in enumerate((("day", DAY_DIMENSIONS), ("hour", HOUR_DIMENSIONS))):
+        cubes = [cubes[i] for cubes in loaded.values() if cubes[i] is not None]
+        results.append(sort_by_date(merge_cubes(cubes, dimensions)) if cubes else _empty_cube(name, dimensions))
+    return tuple(results)
+
+
+def write_partitions(day_df, hour_df, city, station, root=None):
+    """Memecah tabel harian dan per jam satu stasiun menjadi partisi bulanan; mengembalikan partisinya."""
+    root = Path(root or PARTITION_DIR)
+    written = []
+    hour_parts = dict(list(hour_df.groupby(hour_df["dteday"].dt.to_period("M"), sort=False)))
+    for month, day_part in day_df.groupby(day_df["dteday"].dt.to_period("M"), sort=True):
+        path = root / f"city={city}" / f"station={station}" / f"month={month.strftime('%Y-%m')}"
+        path.mkdir(parents=True, exist_ok=True)
+        hour_part = hour_parts.get(month, hour_df.iloc[:0])
+        for name, df in (("day", day_part), ("hour", hour_part)):
+            df.to_csv(path / f"{name}.csv", index=False, date_format="%Y-%m-%d")
+        written.append(Partition(city, station, month.start_time.date(), path))
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Memecah day.csv/hour.csv menjadi partisi kota/stasiun/bulan.")
+    parser.add_argument("--city", required=True, help="nama kota partisi")
+    parser.add_argument("--station", required=True, help="nama stasiun partisi")
+    parser.add_argument("--out", help=f"direktori partisi (default: {PARTITION_DIR})")
+    args = parser.parse_args(argv)
+
+    written = write_partitions(load_table("day"), load_table("hour"), args.city, args.station, args.out)
+    print(f"{len(written)} partisi bulanan ditulis untuk {args.city}/{args.station}")
+
+
+if __name__ == "__main__":
+    main()
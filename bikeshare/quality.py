@@ -0,0 +1,487 @@
+"""Validasi dan deteksi anomali data saat ingest.
+
+Pemeriksaan per tabel (``day``/``hour``), semuanya tervektorisasi:
+
+- ``schema``: kolom yang hilang atau tidak dikenal, nilai kosong, nilai
+  non-numerik, dan tanggal yang tidak bisa di-parse;
+- ``duplicate_instant``: ``instant`` yang tidak lebih besar dari ``instant``
+  sebelumnya (ganda atau mundur);
+- ``duplicate_time``: tanggal (dan jam) yang tidak setelah baris sebelumnya
+  (ganda atau mundur);
+- ``missing``: jam (atau hari) yang tidak ada di grid ``dteday`` × ``hr``
+  antara tanggal pertama dan terakhir, dikelompokkan per rentang berurutan;
+- ``sum``: baris dengan ``casual + registered != cnt``;
+- ``range``: nilai di luar rentang valid, termasuk nilai cuaca ternormalisasi
+  di luar [0, 1];
+- ``outliers``: permintaan dengan rolling z-score ekstrem terhadap
+  ``ZSCORE_WINDOW`` kemunculan sebelumnya dari jam × hari yang sama.
+
+Pemeriksaan per baris dibaca per potongan dari CSV dan hanya membandingkan
+setiap baris dengan state berjalan (``instant`` dan waktu terbesar sejauh
+ini, rentang hilang sebelumnya), tanpa menyimpan semua baris. Outlier dihitung
+dari kubus. Data hanya ditandai, tidak diubah.
+
+Laporan beserta state itu disimpan sebagai JSON di direktori cache dengan
+signature CSV sumbernya. Laporan dibangun dari command line dan diperbarui
+oleh mode append (``update_report``): hanya byte yang ditambahkan ke CSV yang
+diperiksa, dan z-score hanya dihitung ulang untuk minggu-minggu terakhir dari
+kubus. Dashboard hanya membaca laporan yang masih cocok dengan CSV
+(``read_reports``) dan tidak pernah memindai data.
+
+Contoh::
+
+    python -m bikeshare.quality
+"""
+import argparse
+import io
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from .cube import DAY_DIMENSIONS, HOUR_DIMENSIONS, build_cube
+from .filters import sort_by_date
+from .ingest import DEFAULT_CHUNKSIZE, load_cube
+from .loader import CACHE_DIR, DTYPES, file_signature, load_table, source_path
+
+# Naikkan jika pemeriksaan berubah agar laporan lama dihitung ulang
+QUALITY_VERSION = 2
+QUALITY_DIR = CACHE_DIR / "quality"
+MAX_EXAMPLES = 10
+
+ZSCORE_WINDOW = 12
+ZSCORE_MIN_PERIODS = 4
+ZSCORE_THRESHOLD = 5.0
+
+# Label tampilan per pemeriksaan, dalam urutan laporan
+CHECKS = {
+    "schema": "Skema",
+    "duplicate_instant": "Instant ganda",
+    "duplicate_time": "Waktu ganda",
+    "missing": "Jam/hari hilang",
+    "sum": "casual + registered ≠ cnt",
+    "range": "Nilai di luar rentang",
+    "outliers": "Outlier permintaan",
+}
+
+# Rentang valid per kolom (inklusif); None berarti tidak dibatasi
+RANGES = {
+    "season": (1, 4),
+    "yr": (0, None),
+    "mnth": (1, 12),
+    "hr": (0, 23),
+    "holiday": (0, 1),
+    "weekday": (0, 6),
+    "workingday": (0, 1),
+    "weathersit": (1, 4),
+    "temp": (0, 1),
+    "atemp": (0, 1),
+    "hum": (0, 1),
+    "windspeed": (0, 1),
+    "casual": (0, None),
+    "registered": (0, None),
+    "cnt": (0, None),
+}
+
+
+def _time_keys(name):
+    return ["dteday", "hr"] if name == "hour" else ["dteday"]
+
+
+def _plain(value):
+    """Nilai numpy/pandas sebagai tipe JSON biasa."""
+    if isinstance(value, pd.Timestamp):
+        return value.date().isoformat()
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return None if np.isnan(value) else round(float(value), 4)
+    return value
+
+
+def _examples(frame, positions, name, columns=()):
+    """Contoh temuan: identitas baris (``instant``, waktu) dan ``columns`` untuk baris di ``positions``."""
+    keys = [key for key in ["instant", *_time_keys(name), *columns] if key in frame]
+    rows = frame.iloc[positions[:MAX_EXAMPLES]][keys]
+    return [{key: _plain(value) for key, value in zip(keys, row)} for row in rows.itertuples(index=False)]
+
+
+class _Finding:
+    """Jumlah temuan satu pemeriksaan beserta beberapa contoh.
+
+    Tanpa ``key`` contoh yang disimpan adalah yang pertama ditemukan; dengan
+    ``key`` contoh diurutkan menurut ``key`` dan hanya yang teratas disimpan.
+    """
+
+    def __init__(self, result=None, key=None):
+        self.count = result["count"] if result else 0
+        self.examples = list(result["examples"]) if result else []
+        self.key = key
+
+    def add(self, count, examples=()):
+        self.count += int(count)
+        if self.key is not None:
+            self.examples = sorted([*self.examples, *examples], key=self.key)[:MAX_EXAMPLES]
+            return
+        room = MAX_EXAMPLES - len(self.examples)
+        if room > 0:
+            self.examples.extend(list(examples)[:room])
+
+    def result(self):
+        return {"count": self.count, "examples": self.examples}
+
+
+def _longest_first(example):
+    return -example.get("hours", example.get("days", 0))
+
+
+def _strongest_first(example):
+    return -abs(example["z"])
+
+
+def _step(name):
+    return 24 if name == "hour" else 1
+
+
+def _format_stamp(stamp, name):
+    if name == "hour":
+        day, hour = divmod(int(stamp), 24)
+        return f"{np.datetime64(day, 'D')} {hour:02d}:00"
+    return str(np.datetime64(int(stamp), "D"))
+
+
+def _runs(starts, ends, name):
+    """Contoh rentang hilang ``starts``..``ends`` (inklusif), terpanjang dulu."""
+    order = np.argsort(-(ends - starts), kind="stable")[:MAX_EXAMPLES]
+    unit = "hours" if name == "hour" else "days"
+    return [
+        {"start": _format_stamp(starts[i], name), "end": _format_stamp(ends[i], name), unit: int(ends[i] - starts[i] + 1)}
+        for i in order
+    ]
+
+
+def _before(values, initial):
+    """Nilai terbesar sebelum setiap posisi ``values`` (dimulai dari ``initial``)."""
+    return np.maximum.accumulate(np.concatenate([[initial], values]))[:-1]
+
+
+def header_findings(header, name):
+    """Temuan skema untuk kolom header CSV yang hilang atau tidak dikenal."""
+    expected = ["dteday", *DTYPES[name]]
+    return (
+        sum(col not in header for col in expected) + sum(col not in expected for col in header),
+        [{"column": col, "problem": "kolom tidak ada"} for col in expected if col not in header]
+        + [{"column": col, "problem": "kolom tidak dikenal"} for col in header if col not in expected],
+    )
+
+
+class RowScanner:
+    """Pemeriksaan per baris yang bisa dilanjutkan dari laporan dan state sebelumnya.
+
+    ``update`` menerima potongan CSV mentah (semua kolom sebagai string).
+    Setiap baris hanya dibandingkan dengan state berjalan, sehingga memori
+    tidak bergantung pada jumlah baris dan baris hasil append bisa diperiksa
+    tanpa membaca ulang data lama.
+    """
+
+    ROW_CHECKS = ("schema", "duplicate_instant", "duplicate_time", "sum", "range")
+
+    def __init__(self, name, report=None, state=None):
+        self.name = name
+        checks = report["checks"] if report else {}
+        self.rows = report["rows"] if report else 0
+        self.findings = {check: _Finding(checks.get(check)) for check in self.ROW_CHECKS}
+        state = state or {}
+        self.max_instant = state.get("max_instant")
+        self.last_stamp = state.get("last_stamp")
+        # Rentang hilang di antara baris; ekor hari terakhir ditambahkan saat laporan dibuat
+        self.gaps = _Finding(state.get("gaps"), key=_longest_first)
+
+    def update(self, raw):
+        name = self.name
+        chunk = pd.DataFrame(index=raw.index)
+        for col in ["dteday", *DTYPES[name]]:
+            if col not in raw:
+                continue
+            text = raw[col].str.strip()
+            empty = (text == "").to_numpy()
+            if col == "dteday":
+                values = pd.to_datetime(text.where(~empty), format="%Y-%m-%d", errors="coerce")
+            else:
+                values = pd.to_numeric(text.where(~empty), errors="coerce")
+            invalid = values.isna().to_numpy() & ~empty
+            for problem, mask in (("nilai kosong", empty), ("nilai tidak valid", invalid)):
+                if mask.any():
+                    self.findings["schema"].add(mask.sum(), [{"column": col, "problem": problem,
+                                                              "row": int(self.rows + np.flatnonzero(mask)[0]) + 1}])
+            chunk[col] = values
+        self.rows += len(chunk)
+
+        if "instant" in chunk:
+            valid = np.flatnonzero(chunk["instant"].notna().to_numpy())
+            instants = chunk["instant"].to_numpy()[valid]
+            if len(instants):
+                before = _before(instants, -np.inf if self.max_instant is None else self.max_instant)
+                repeated = valid[instants <= before]
+                self.findings["duplicate_instant"].add(len(repeated), _examples(chunk, repeated, name))
+                self.max_instant = int(max(before[-1], instants[-1]))
+
+        keys = _time_keys(name)
+        if set(keys).issubset(chunk.columns):
+            self._update_time(chunk, keys)
+
+        if {"casual", "registered", "cnt"}.issubset(chunk.columns):
+            total = chunk["casual"] + chunk["registered"]
+            bad = np.flatnonzero((total != chunk["cnt"]).to_numpy() & chunk["cnt"].notna().to_numpy()
+                                 & total.notna().to_numpy())
+            self.findings["sum"].add(len(bad), _examples(chunk, bad, name, ["casual", "registered", "cnt"]))
+
+        for col, (lo, hi) in RANGES.items():
+            if col not in chunk:
+                continue
+            values = chunk[col].to_numpy()
+            mask = np.zeros(len(values), dtype=bool)
+            if lo is not None:
+                mask |= values < lo
+            if hi is not None:
+                mask |= values > hi
+            bad = np.flatnonzero(mask)
+            self.findings["range"].add(len(bad), _examples(chunk, bad, name, [col]))
+
+    def _update_time(self, chunk, keys):
+        """Waktu ganda/mundur dan rentang hilang terhadap waktu terbesar sebelumnya."""
+        name, step = self.name, _step(self.name)
+        valid = np.flatnonzero(chunk[keys].notna().all(axis=1).to_numpy())
+        if not len(valid):
+            return
+        times = chunk.iloc[valid]
+        stamps = times["dteday"].to_numpy("datetime64[D]").astype(np.int64) * step
+        if name == "hour":
+            stamps = stamps + times["hr"].to_numpy().astype(np.int64)
+        first = self.last_stamp is None
+        before = _before(stamps, stamps[0] // step * step - 1 if first else self.last_stamp)
+        repeated = stamps <= before
+        self.findings["duplicate_time"].add(repeated.sum(), _examples(chunk, valid[repeated], name))
+
+        # Baris yang maju: celah antara waktu sebelumnya dan waktu baris ini
+        ahead = ~repeated
+        gap = stamps[ahead] - before[ahead] - 1
+        opened = np.flatnonzero(gap > 0)
+        starts, ends = before[ahead][opened] + 1, stamps[ahead][opened] - 1
+        self.gaps.add(gap[opened].sum(), _runs(starts, ends, name))
+        self.last_stamp = int(max(before[-1], stamps[-1]))
+
+    def state(self):
+        return {"max_instant": self.max_instant, "last_stamp": self.last_stamp, "gaps": self.gaps.result()}
+
+    def results(self):
+        """Temuan per baris, termasuk jam/hari hilang sampai akhir hari terakhir."""
+        results = {check: finding.result() for check, finding in self.findings.items()}
+        missing = _Finding(self.gaps.result(), key=_longest_first)
+        if self.last_stamp is not None:
+            step = _step(self.name)
+            end = self.last_stamp // step * step + step - 1
+            if end > self.last_stamp:
+                missing.add(end - self.last_stamp, _runs(np.array([self.last_stamp + 1]), np.array([end]), self.name))
+        results["missing"] = missing.result()
+        return results
+
+
+def _raw_chunks(source, chunksize=DEFAULT_CHUNKSIZE):
+    return pd.read_csv(source, dtype=str, keep_default_na=False, chunksize=chunksize)
+
+
+def _series(cube, name):
+    """Jumlah ``cnt`` dan banyak baris per tanggal (dan jam), terurut menurut waktu."""
+    keys = _time_keys(name)
+    grouped = cube.groupby(keys, sort=True, observed=True)
+    series = grouped[["cnt", "n"]].sum()
+    series["weekday"] = grouped["weekday"].first()
+    return series.reset_index()
+
+
+def rolling_zscores(series, name, window=ZSCORE_WINDOW, min_periods=ZSCORE_MIN_PERIODS):
+    """Rolling z-score ``cnt`` terhadap ``window`` kemunculan sebelumnya dari jam × hari yang sama.
+
+    Simpangan baku minimal 1 peminjaman agar jam sepi yang nyaris konstan
+    tidak menghasilkan z-score ekstrem. Mengembalikan ``(expected, z)``.
+    """
+    keys = ["hr", "weekday"] if name == "hour" else ["weekday"]
+    groups = [series[key] for key in keys]
+    previous = series["cnt"].astype(np.float64).groupby(groups, sort=False).shift(1)
+    rolling = previous.groupby(groups, sort=False).rolling(window, min_periods=min_periods)
+    expected = rolling.mean().reset_index(level=list(range(len(keys))), drop=True).sort_index()
+    spread = rolling.std().reset_index(level=list(range(len(keys))), drop=True).sort_index()
+    z = (series["cnt"] - expected) / np.maximum(spread, 1.0)
+    return expected, z
+
+
+def scan_outliers(series, name, after=None, threshold=ZSCORE_THRESHOLD):
+    """Outlier permintaan dalam ``series``; dengan ``after`` hanya waktu setelah stamp itu yang dinilai."""
+    expected, z = rolling_zscores(series, name)
+    scored = series.assign(expected=expected.to_numpy(), z=z.to_numpy())
+    magnitude = np.abs(scored["z"].to_numpy())
+    candidate = magnitude > threshold
+    if after is not None:
+        stamps = series["dteday"].to_numpy("datetime64[D]").astype(np.int64) * _step(name)
+        if name == "hour":
+            stamps = stamps + series["hr"].to_numpy(np.int64)
+        candidate &= stamps > after
+    flagged = np.flatnonzero(candidate)
+    top = flagged[np.argsort(-magnitude[flagged], kind="stable")]
+    return len(flagged), _examples(scored, top, name, ["cnt", "expected", "z"])
+
+
+def _report(name, scanner, outliers):
+    results = scanner.results()
+    results["outliers"] = outliers.result()
+    return {"table": name, "rows": scanner.rows, "checks": {check: results[check] for check in CHECKS}}
+
+
+def scan(source, name, cube, chunksize=DEFAULT_CHUNKSIZE):
+    """Laporan kualitas lengkap untuk CSV ``source`` dan kubusnya; mengembalikan ``(report, state)``."""
+    scanner = RowScanner(name)
+    scanner.findings["schema"].add(*header_findings(list(pd.read_csv(source, nrows=0).columns), name))
+    with _raw_chunks(source, chunksize) as reader:
+        for raw in reader:
+            scanner.update(raw)
+    outliers = _Finding(key=_strongest_first)
+    outliers.add(*scan_outliers(_series(cube, name), name))
+    return _report(name, scanner, outliers), scanner.state()
+
+
+def _report_path(name):
+    return QUALITY_DIR / f"{name}.json"
+
+
+def _signature(csv_signature):
+    return {
+        "csv": csv_signature,
+        "version": QUALITY_VERSION,
+        "zscore": [ZSCORE_WINDOW, ZSCORE_MIN_PERIODS, ZSCORE_THRESHOLD],
+    }
+
+
+def _read_stored(name):
+    try:
+        with open(_report_path(name)) as f:
+            stored = json.load(f)
+        return stored if {"signature", "report", "state"}.issubset(stored) else None
+    except (OSError, ValueError):
+        return None
+
+
+def _write_stored(name, signature, report, state):
+    path = _report_path(name)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.tmp-{os.getpid()}")
+        with open(tmp, "w") as f:
+            json.dump({"signature": signature, "report": report, "state": state}, f, default=str)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def read_report(name):
+    """Laporan tersimpan yang masih cocok dengan CSV ``name``; ``None`` jika tidak ada atau usang."""
+    source = source_path(name)
+    if not source.exists():
+        return None
+    stored = _read_stored(name)
+    if stored is None or stored["signature"] != _signature(file_signature(source)):
+        return None
+    return stored["report"]
+
+
+def read_reports():
+    """Laporan tersimpan ``day`` dan ``hour`` tanpa memindai data (dipakai dashboard)."""
+    return {"day": read_report("day"), "hour": read_report("hour")}
+
+
+def load_report(name, cube, chunksize=DEFAULT_CHUNKSIZE):
+    """Laporan kualitas ``name``; dipindai ulang jika CSV berubah. ``None`` tanpa CSV lokal."""
+    report = read_report(name)
+    source = source_path(name)
+    if report is not None or not source.exists():
+        return report
+    signature = _signature(file_signature(source))
+    report, state = scan(source, name, cube, chunksize)
+    _write_stored(name, signature, report, state)
+    return report
+
+
+def load_reports(day_cube, hour_cube):
+    """Laporan kualitas ``day`` dan ``hour`` untuk data lokal bawaan."""
+    return {"day": load_report("day", day_cube), "hour": load_report("hour", hour_cube)}
+
+
+def _recent_series(name, since):
+    """Seri waktu dari kubus mulai ``ZSCORE_WINDOW`` × 2 minggu sebelum ``since`` (cukup untuk rolling z-score)."""
+    start = np.datetime64(since, "D") - np.timedelta64(2 * ZSCORE_WINDOW * 7, "D")
+    cube = load_cube("hour", HOUR_DIMENSIONS) if name == "hour" else sort_by_date(load_table("day"))
+    lo = int(np.searchsorted(cube["dteday"].to_numpy(), start.astype("datetime64[ns]"), side="left"))
+    recent = cube.iloc[lo:]
+    if name == "day":
+        recent = build_cube(recent, DAY_DIMENSIONS)
+    return _series(recent, name)
+
+
+def update_report(name, previous, signature, chunksize=DEFAULT_CHUNKSIZE):
+    """Hook append: memeriksa hanya byte yang ditambahkan ke CSV ``name`` sejak signature ``previous``.
+
+    Laporan yang dibuat dari isi CSV lain dihapus; bangun ulang dengan
+    ``python -m bikeshare.quality``. Mengembalikan laporan baru atau ``None``.
+    """
+    stored = _read_stored(name)
+    if stored is None:
+        return None
+    if stored["signature"] != _signature(previous):
+        _report_path(name).unlink(missing_ok=True)
+        return None
+
+    with open(source_path(name), "rb") as f:
+        header = f.readline()
+        f.seek(previous["size"])
+        appended = f.read()
+    scanner = RowScanner(name, stored["report"], stored["state"])
+    after = scanner.last_stamp
+    with _raw_chunks(io.BytesIO(header + appended), chunksize) as reader:
+        for raw in reader:
+            scanner.update(raw)
+
+    outliers = _Finding(stored["report"]["checks"]["outliers"], key=_strongest_first)
+    if scanner.last_stamp is not None and scanner.last_stamp != after:
+        since = np.datetime64(int((after if after is not None else scanner.last_stamp) // _step(name)), "D")
+        outliers.add(*scan_outliers(_recent_series(name, since), name, after))
+    report = _report(name, scanner, outliers)
+    _write_stored(name, _signature(signature), report, scanner.state())
+    return report
+
+
+def issue_count(report):
+    """Jumlah seluruh temuan dalam satu laporan."""
+    return sum(result["count"] for result in report["checks"].values()) if report else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Memeriksa kualitas day.csv/hour.csv dan mencetak laporannya.")
+    parser.add_argument("--out", help="file JSON keluaran (default: ringkasan ke stdout)")
+    args = parser.parse_args(argv)
+
+    reports = load_reports(build_cube(load_table("day"), DAY_DIMENSIONS), load_cube("hour", HOUR_DIMENSIONS))
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(reports, f, indent=2, default=str)
+    for name, report in reports.items():
+        if report is None:
+            print(f"{name}: CSV lokal tidak ada")
+            continue
+        print(f"{name}: {report['rows']:,} baris, {issue_count(report):,} temuan")
+        for check, result in report["checks"].items():
+            print(f"  {CHECKS[check]}: {result['count']:,}")
+
+
+if __name__ == "__main__":
+    main()
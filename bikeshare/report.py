@@ -0,0 +1,220 @@
+"""Ekspor laporan headless untuk banyak konfigurasi filter sekaligus (tanpa Streamlit).
+
+Setiap konfigurasi menghasilkan ``metrics.json``, tabel hasil agregasi
+setiap grafik (CSV/Parquet), dan figure (PNG/SVG) di
+``<out>/<nama>/``; ringkasan metrik semua konfigurasi ditulis ke
+``<out>/index.csv``. Kubus dimuat sekali per lokasi lalu dipakai bersama
+oleh semua konfigurasinya. Agregasi dihitung di proses utama (murah, dari
+kubus yang sama), sedangkan rendering figure yang berat dijalankan paralel
+di process pool dengan hanya mengirim tabel hasil agregasi yang kecil.
+
+Konfigurasi berupa file JSON berisi daftar objek, misalnya::
+
+    [
+        {"name": "musim-panas", "start": "2012-06-01", "end": "2012-08-31"},
+        {"name": "cuaca-buruk", "weathers": ["Light Rain/Snow", "Heavy Rain/Snow"]},
+        {"name": "dago", "city": "bandung", "station": "dago"}
+    ]
+
+``seasons``/``weathers`` boleh berupa kode atau label; ``city``/``station``
+hanya berlaku untuk dataset terpartisi. ``--period`` memecah setiap
+konfigurasi per bulan, kuartal, atau tahun::
+
+    python -m bikeshare.report --out laporan --config konfigurasi.json --period month --figures png svg
+"""
+import argparse
+import datetime
+import json
+import re
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from .analysis import analyze, load_cubes
+from .charts import CHARTS, make_figure, render
+from .filters import normalize_filter
+from .labels import season_mapping, weathersit_mapping
+from .parallel import default_workers
+from .partitions import discover, load_partitions, prune
+
+TABLE_FORMATS = ("csv", "parquet")
+FIGURE_FORMATS = ("png", "svg")
+PERIODS = {"month": "M", "quarter": "Q", "year": "Y"}
+
+
+def _codes(values, mapping):
+    """Kode kategori dari daftar kode atau label."""
+    if values is None:
+        return None
+    codes = {name: code for code, name in mapping.items()}
+    return [codes[value] if value in codes else int(value) for value in values]
+
+
+def _date(value):
+    return None if value is None else datetime.date.fromisoformat(str(value))
+
+
+def _location(config):
+    return config.get("city"), config.get("station")
+
+
+def expand_periods(configs, period, min_date, max_date):
+    """Memecah setiap konfigurasi menjadi satu konfigurasi per periode kalender."""
+    expanded = []
+    for config in configs:
+        start = _date(config.get("start")) or min_date
+        end = _date(config.get("end")) or max_date
+        for p in pd.period_range(start, end, freq=PERIODS[period]):
+            expanded.append(dict(
+                config,
+                name=f"{config['name']}_{p}",
+                start=max(start, p.start_time.date()).isoformat(),
+                end=min(end, p.end_time.date()).isoformat(),
+            ))
+    return expanded
+
+
+def _load(location, partitions):
+    city, station = location
+    if city is None and station is None:
+        return load_cubes()
+    if not partitions:
+        raise ValueError("city/station hanya berlaku untuk dataset terpartisi")
+    stations = None if station is None else [(city, station)]
+    selection = prune(partitions, None if city is None else [city], stations)
+    if not selection:
+        raise ValueError(f"tidak ada partisi untuk lokasi {city}/{station}")
+    return load_partitions(selection)
+
+
+def _flat(table):
+    """Tabel dengan indeks sebagai kolom dan nama kolom string (syarat Parquet)."""
+    if not isinstance(table.index, pd.RangeIndex):
+        table = table.reset_index()
+    table = table.copy()
+    table.columns = [str(col) for col in table.columns]
+    return table
+
+
+def write_table(table, path, fmt):
+    table = _flat(table)
+    if fmt == "parquet":
+        table.to_parquet(path, index=False)
+    else:
+        table.to_csv(path, index=False)
+
+
+def render_file(chart_id, data, path, fmt, dpi=100):
+    """Merender satu figure ke file (dijalankan di worker process)."""
+    Path(path).write_bytes(render(make_figure(chart_id, data), fmt=fmt, dpi=dpi))
+    return str(path)
+
+
+def write_report(name, metrics, tables, out_dir, table_formats, figure_formats, submit, config=None):
+    """Menulis metrik dan tabel satu konfigurasi; figure diserahkan ke ``submit``."""
+    target = Path(out_dir) / name
+    (target / "tables").mkdir(parents=True, exist_ok=True)
+    (target / "figures").mkdir(parents=True, exist_ok=True)
+    with open(target / "metrics.json", "w") as f:
+        json.dump({"name": name, "config": config or {}, "metrics": metrics}, f, indent=2, default=str)
+
+    pending = []
+    for chart_id, table in tables.items():
+        for fmt in table_formats:
+            write_table(table, target / "tables" / f"{chart_id}.{fmt}", fmt)
+        # Potongan kosong tidak punya figure
+        if len(table):
+            for fmt in figure_formats:
+                pending.append(submit(render_file, chart_id, table, target / "figures" / f"{chart_id}.{fmt}", fmt))
+    return pending
+
+
+def run(configs, out_dir, table_formats=("csv",), figure_formats=("png",), period=None, chart_ids=None,
+        workers=None):
+    """Menghasilkan laporan untuk semua ``configs``; mengembalikan DataFrame ringkasan metrik."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    partitions = discover()
+    workers = workers or default_workers()
+
+    # Konfigurasi dikelompokkan per lokasi: kubus dimuat sekali per lokasi
+    configs = sorted(configs, key=lambda config: tuple(value or "" for value in _location(config)))
+    pool = ProcessPoolExecutor(workers) if workers > 1 else None
+    submit = pool.submit if pool is not None else _run_now
+    index, pending = [], []
+    try:
+        location, cubes = None, None
+        for config in configs:
+            if cubes is None or _location(config) != location:
+                location = _location(config)
+                cubes = _load(location, partitions)
+            day_cube, hour_cube = cubes
+            min_date, max_date = day_cube["dteday"].min().date(), day_cube["dteday"].max().date()
+
+            for item in expand_periods([config], period, min_date, max_date) if period else [config]:
+                state = normalize_filter(
+                    _date(item.get("start")), _date(item.get("end")),
+                    _codes(item.get("seasons"), season_mapping), _codes(item.get("weathers"), weathersit_mapping),
+                    min_date=min_date, max_date=max_date,
+                )
+                metrics, tables = analyze(day_cube, hour_cube, state, chart_ids)
+                pending += write_report(item["name"], metrics, tables, out_dir, table_formats, figure_formats,
+                                        submit, config=item)
+                index.append({"name": item["name"], **metrics})
+        for future in pending:
+            future.result()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    summary = pd.DataFrame(index)
+    summary.to_csv(out_dir / "index.csv", index=False)
+    return summary
+
+
+def _run_now(fn, *args):
+    future = Future()
+    future.set_result(fn(*args))
+    return future
+
+
+def _safe_name(name):
+    return re.sub(r"[^\w.-]+", "-", str(name)).strip("-") or "laporan"
+
+
+def load_configs(path=None):
+    """Daftar konfigurasi dari file JSON, atau satu konfigurasi tanpa filter."""
+    if path is None:
+        return [{"name": "semua"}]
+    with open(path) as f:
+        configs = json.load(f)
+    for i, config in enumerate(configs):
+        config["name"] = _safe_name(config.get("name", f"laporan-{i + 1}"))
+    return configs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ekspor laporan Bike Sharing untuk banyak konfigurasi filter.")
+    parser.add_argument("--out", required=True, help="direktori keluaran")
+    parser.add_argument("--config", help="file JSON berisi daftar konfigurasi filter (default: satu laporan penuh)")
+    parser.add_argument("--period", choices=sorted(PERIODS), help="pecah setiap konfigurasi per periode")
+    parser.add_argument("--tables", nargs="*", default=["csv"], choices=TABLE_FORMATS, help="format tabel")
+    parser.add_argument("--figures", nargs="*", default=["png"], choices=FIGURE_FORMATS, help="format figure")
+    parser.add_argument("--charts", nargs="+", choices=list(CHARTS), help="grafik yang diekspor (default: semua)")
+    parser.add_argument("--workers", type=int, help="jumlah proses rendering (default: BIKESHARE_WORKERS/CPU)")
+    args = parser.parse_args(argv)
+
+    if "parquet" in args.tables:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            parser.error("format parquet membutuhkan paket pyarrow")
+
+    summary = run(load_configs(args.config), args.out, args.tables, args.figures, args.period, args.charts,
+                  args.workers)
+    print(f"{len(summary)} laporan ditulis ke {args.out}")
+
+
+if __name__ == "__main__":
+    main()
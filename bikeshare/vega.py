@@ -0,0 +1,169 @@
+"""Backend grafik interaktif: spesifikasi Vega-Lite dari hasil query yang ringkas.
+
+Hanya seri teragregasi yang dikirim ke browser (mis. 24×7 sel untuk heatmap,
+12×4 titik untuk tren bulanan). Grafik digambar di sisi klien sehingga
+hover, zoom, dan toggle legend tidak memerlukan rerun ke server.
+"""
+import json
+
+from .labels import month_names, season_order, weekday_mapping, weekday_order
+
+Y_MEAN = {"field": "cnt", "type": "quantitative", "title": "Rata-rata Jumlah Peminjaman"}
+Y_USERS = {"field": "Rata-rata Peminjaman", "type": "quantitative", "title": "Rata-rata Jumlah Peminjaman"}
+MONTH_AXIS = {"labelExpr": f"{json.dumps(month_names)}[datum.value - 1]"}
+
+
+def _records(df):
+    return json.loads(df.to_json(orient="records"))
+
+
+def _spec(title, data, mark, encoding, params=None):
+    spec = {
+        "$schema": "https://vega.github.io/schema/vega-lite/v5.json",
+        "title": title,
+        "data": {"values": _records(data)},
+        "mark": mark,
+        "encoding": encoding,
+    }
+    if params:
+        spec["params"] = params
+    return spec
+
+
+def _legend_toggle(field):
+    """Klik legend untuk menyorot/menyembunyikan seri, sepenuhnya di browser."""
+    params = [{"name": "seri", "select": {"type": "point", "fields": [field]}, "bind": "legend"}]
+    opacity = {"condition": {"param": "seri", "value": 1}, "value": 0.15}
+    return params, opacity
+
+
+def _grouped_bars(title, data, x, x_title, series, y=Y_USERS, sort=None):
+    params, opacity = _legend_toggle(series)
+    return _spec(title, data, {"type": "bar", "tooltip": True}, {
+        "x": {"field": x, "type": "nominal", "title": x_title, "sort": sort},
+        "xOffset": {"field": series},
+        "y": y,
+        "color": {"field": series, "type": "nominal", "title": series},
+        "opacity": opacity,
+    }, params)
+
+
+def _lines(title, data, x, x_title, y, series=None, x_axis=None):
+    encoding = {
+        "x": {"field": x, "type": "ordinal", "title": x_title, **({"axis": x_axis} if x_axis else {})},
+        "y": y,
+    }
+    params = None
+    if series is not None:
+        params, opacity = _legend_toggle(series)
+        encoding["color"] = {"field": series, "type": "nominal", "title": series}
+        encoding["opacity"] = opacity
+    return _spec(title, data, {"type": "line", "point": True, "tooltip": True}, encoding, params)
+
+
+def spec_season(data):
+    return _spec("Rata-rata Peminjaman Sepeda per Musim", data, {"type": "bar", "tooltip": True}, {
+        "x": {"field": "season_name", "type": "nominal", "title": "Musim", "sort": season_order},
+        "y": Y_MEAN,
+    })
+
+
+def spec_weather(data):
+    return _spec("Rata-rata Peminjaman Sepeda per Kondisi Cuaca", data, {"type": "bar", "tooltip": True}, {
+        "x": {"field": "weathersit_name", "type": "nominal", "title": "Kondisi Cuaca", "sort": None},
+        "y": Y_MEAN,
+    })
+
+
+def spec_season_weather(data):
+    return _grouped_bars("Interaksi Musim dan Kondisi Cuaca terhadap Peminjaman Sepeda", data,
+                         "season_name", "Musim", "weathersit_name", y=Y_MEAN, sort=season_order)
+
+
+def spec_monthly_season(data):
+    return _lines("Tren Peminjaman Sepeda Bulanan berdasarkan Musim", data, "month", "Bulan", Y_MEAN,
+                  series="season_name", x_axis=MONTH_AXIS)
+
+
+def spec_monthly_weather(data):
+    return _lines("Tren Peminjaman Sepeda Bulanan berdasarkan Kondisi Cuaca", data, "month", "Bulan", Y_MEAN,
+                  series="weathersit_name", x_axis=MONTH_AXIS)
+
+
+def spec_hourly(data):
+    return _lines("Pola Peminjaman Sepeda Berdasarkan Jam", data, "hr", "Jam", Y_MEAN)
+
+
+def spec_hour_weekday(data):
+    cells = data.stack().rename("cnt").reset_index()
+    cells["weekday_name"] = cells["weekday"].map(weekday_mapping)
+    return _spec("Heatmap Peminjaman Sepeda berdasarkan Jam dan Hari", cells[["hr", "weekday_name", "cnt"]],
+                 {"type": "rect", "tooltip": True}, {
+                     "x": {"field": "weekday_name", "type": "ordinal", "title": "Hari",
+                           "sort": [weekday_mapping[i] for i in range(7)]},
+                     "y": {"field": "hr", "type": "ordinal", "title": "Jam"},
+                     "color": {"field": "cnt", "type": "quantitative", "title": "Jumlah Peminjaman",
+                               "scale": {"scheme": "viridis"}},
+                 })
+
+
+def spec_user_share(data):
+    params, opacity = _legend_toggle("Tipe Pengguna")
+    return _spec("Perbandingan Total Peminjaman Berdasarkan Tipe Pengguna", data, {"type": "arc", "tooltip": True}, {
+        "theta": {"field": "Jumlah Peminjaman", "type": "quantitative", "stack": "normalize"},
+        "color": {"field": "Tipe Pengguna", "type": "nominal",
+                  "scale": {"range": ['#1f77b4', '#ff7f0e']}},
+        "opacity": opacity,
+    }, params)
+
+
+def spec_season_user(data):
+    return _grouped_bars("Perbandingan Peminjaman berdasarkan Musim dan Tipe Pengguna", data,
+                         "season_name", "Musim", "Tipe Pengguna", sort=season_order)
+
+
+def spec_weekday_user(data):
+    return _grouped_bars("Pola Peminjaman Berdasarkan Hari dalam Seminggu", data,
+                         "weekday_name", "Hari", "Tipe Pengguna", sort=weekday_order)
+
+
+def spec_hourly_user(data):
+    return _lines("Pola Peminjaman Berdasarkan Jam dan Tipe Pengguna", data, "hr", "Jam", Y_USERS,
+                  series="Tipe Pengguna")
+
+
+def spec_workingday_user(data):
+    return _grouped_bars("Peminjaman Berdasarkan Tipe Hari dan Tipe Pengguna", data,
+                         "workingday", "Tipe Hari", "Tipe Pengguna")
+
+
+def spec_weather_user(data):
+    return _grouped_bars("Pengaruh Kondisi Cuaca terhadap Tipe Pengguna", data,
+                         "weathersit_name", "Kondisi Cuaca", "Tipe Pengguna")
+
+
+SPECS = {
+    "season": spec_season,
+    "weather": spec_weather,
+    "season_weather": spec_season_weather,
+    "monthly_season": spec_monthly_season,
+    "monthly_weather": spec_monthly_weather,
+    "hourly": spec_hourly,
+    "hour_weekday": spec_hour_weekday,
+    "user_share": spec_user_share,
+    "season_user": spec_season_user,
+    "weekday_user": spec_weekday_user,
+    "hourly_user": spec_hourly_user,
+    "workingday_user": spec_workingday_user,
+    "weather_user": spec_weather_user,
+}
+
+
+def make_spec(chart_id, data):
+    """Spesifikasi Vega-Lite untuk ``chart_id`` dari hasil query-nya."""
+    return SPECS[chart_id](data)
+
+
+def encode(spec):
+    """Spesifikasi sebagai bytes JSON ringkas (untuk cache dan ukuran payload)."""
+    return json.dumps(spec, separators=(",", ":")).encode()
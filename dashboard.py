@@ -1,521 +1,623 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import streamlit as st
-
-# Set page configuration
-st.set_page_config(
-    page_title="Bike Sharing Dashboard",
-    page_icon="🚲",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# Custom CSS untuk tampilan yang lebih minimalis dengan perbaikan warna insight
-st.markdown("""
-<style>
-    .main .block-container {
-        padding-top: 2rem;
-        padding-bottom: 2rem;
-    }
-    .st-emotion-cache-16txtl3 h1 {
-        font-weight: 700;
-        margin-bottom: 1rem;
-    }
-    .st-emotion-cache-10trblm {
-        margin-bottom: 1rem;
-    }
-    .insight-box {
-        background-color: #f8f9fa;
-        border-left: 4px solid #4e78a8;
-        padding: 1rem;
-        border-radius: 0.3rem;
-        margin: 1rem 0;
-        color: #333333;  /* Warna teks gelap untuk memastikan terlihat */
-    }
-    .conclusion-box {
-        background-color: #f0f7ff;
-        border-left: 4px solid #3366cc;
-        padding: 1rem;
-        border-radius: 0.3rem;
-        margin: 1rem 0;
-        color: #333333;  /* Warna teks gelap */
-    }
-    .recommendation-box {
-        background-color: #f0fff7;
-        border-left: 4px solid #33cc99;
-        padding: 1rem;
-        border-radius: 0.3rem;
-        margin: 1rem 0;
-        color: #333333;  /* Warna teks gelap */
-    }
-    /* Tambahan style untuk insight header */
-    .insight-header {
-        background-color: #4e78a8;
-        color: white;
-        padding: 0.5rem 1rem;
-        border-radius: 0.3rem 0.3rem 0 0;
-        margin-bottom: 0;
-        font-weight: bold;
-    }
-    /* Style tambahan untuk text di dalam insight */
-    .insight-content {
-        background-color: #f8f9fa;
-        padding: 1rem;
-        border-radius: 0 0 0.3rem 0.3rem;
-        color: #333333;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# Definisikan mapping
-season_mapping = {1: "Spring", 2: "Summer", 3: "Fall", 4: "Winter"}
-weathersit_mapping = {1: "Clear", 2: "Misty", 3: "Light Rain/Snow", 4: "Heavy Rain/Snow"}
-weekday_mapping = {0: 'Minggu', 1: 'Senin', 2: 'Selasa', 3: 'Rabu', 4: 'Kamis', 5: 'Jumat', 6: 'Sabtu'}
-
-# Load data
-@st.cache_data
-def load_data():
-    day_df = pd.read_csv("https://raw.githubusercontent.com/fenia-k/Bike-Sharing-Dataset/refs/heads/main/day.csv")
-    hour_df = pd.read_csv("https://raw.githubusercontent.com/fenia-k/Bike-Sharing-Dataset/refs/heads/main/hour.csv")
-    
-    # Mengubah tipe data
-    day_df['dteday'] = pd.to_datetime(day_df['dteday'])
-    hour_df['dteday'] = pd.to_datetime(hour_df['dteday'])
-    
-    # Mengubah nilai kategorik
-    day_df["season_name"] = day_df["season"].map(season_mapping)
-    day_df["weathersit_name"] = day_df["weathersit"].map(weathersit_mapping)
-    day_df["weekday_name"] = day_df["weekday"].map(weekday_mapping)
-    
-    hour_df["season_name"] = hour_df["season"].map(season_mapping)
-    hour_df["weathersit_name"] = hour_df["weathersit"].map(weathersit_mapping)
-    
-    # Menambahkan kolom bulan untuk analisis
-    day_df['month'] = day_df['dteday'].dt.month
-    day_df['month_name'] = day_df['dteday'].dt.strftime('%b')
-    
-    return day_df, hour_df
-
-day_df, hour_df = load_data()
-
-# Sidebar
-with st.sidebar:
-    st.title("Bike Sharing Analysis")
-    
-    st.subheader("Filter Data")
-    
-    # Date filter
-    col1, col2 = st.columns(2)
-    with col1:
-        start_date = st.date_input("Tanggal Mulai", day_df['dteday'].min().date())
-    with col2:
-        end_date = st.date_input("Tanggal Akhir", day_df['dteday'].max().date())
-    
-    # Season filter
-    season_options = list(season_mapping.values())
-    selected_seasons = st.multiselect("Musim", 
-                                     options=season_options,
-                                     default=season_options)
-    
-    # Weather filter
-    weather_options = list(weathersit_mapping.values())
-    selected_weather = st.multiselect("Kondisi Cuaca", 
-                                     options=weather_options,
-                                     default=weather_options)
-    
-    # About section
-    st.markdown("---")
-    st.caption("Dibuat oleh: Fenia Kerenina br Surbakti")
-    st.caption("ID Dicoding: MC185D5X0359")
-
-# Filter data berdasarkan input
-filtered_day_df = day_df[
-    (day_df['dteday'].dt.date >= start_date) & 
-    (day_df['dteday'].dt.date <= end_date) &
-    (day_df['season_name'].isin(selected_seasons)) &
-    (day_df['weathersit_name'].isin(selected_weather))
-]
-
-filtered_hour_df = hour_df[
-    (hour_df['dteday'].dt.date >= start_date) & 
-    (hour_df['dteday'].dt.date <= end_date) &
-    (hour_df['season_name'].isin(selected_seasons)) &
-    (hour_df['weathersit_name'].isin(selected_weather))
-]
-
-# Main content
-st.title("🚲 Bike Sharing Analysis Dashboard")
-st.markdown("Dashboard untuk menganalisis pola peminjaman sepeda berdasarkan musim, cuaca, dan jenis pengguna.")
-
-# Metrics overview
-st.subheader("Overview")
-col1, col2, col3, col4 = st.columns(4)
-with col1:
-    st.metric("Total Peminjaman", f"{filtered_day_df['cnt'].sum():,}")
-with col2:
-    st.metric("Rata-rata Harian", f"{filtered_day_df['cnt'].mean():.1f}")
-with col3:
-    st.metric("Pengguna Casual", f"{filtered_day_df['casual'].sum():,}")
-with col4:
-    st.metric("Pengguna Registered", f"{filtered_day_df['registered'].sum():,}")
-
-# Pertanyaan 1
-st.markdown("---")
-st.header("Pertanyaan 1: Bagaimana pola peminjaman sepeda berubah berdasarkan musim dan kondisi cuaca?")
-
-# Tab untuk berbagai visualisasi pertanyaan 1
-tab1, tab2, tab3 = st.tabs(["Peminjaman per Musim & Cuaca", "Tren Bulanan", "Pola Peminjaman Harian"])
-
-with tab1:
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Visualisasi musim dengan Matplotlib
-        st.subheader("Rata-rata Peminjaman per Musim")
-        season_data = filtered_day_df.groupby("season_name")["cnt"].mean().reset_index()
-        fig1, ax1 = plt.subplots(figsize=(10, 6))
-        sns.barplot(x="season_name", y="cnt", data=season_data, ax=ax1, order=["Spring", "Summer", "Fall", "Winter"])
-        ax1.set_title("Rata-rata Peminjaman Sepeda per Musim")
-        ax1.set_xlabel("Musim")
-        ax1.set_ylabel("Rata-rata Jumlah Peminjaman")
-        st.pyplot(fig1)
-
-    with col2:
-        # Visualisasi kondisi cuaca dengan Matplotlib
-        st.subheader("Rata-rata Peminjaman per Kondisi Cuaca")
-        weather_data = filtered_day_df.groupby("weathersit_name")["cnt"].mean().reset_index()
-        fig2, ax2 = plt.subplots(figsize=(10, 6))
-        sns.barplot(x="weathersit_name", y="cnt", data=weather_data, ax=ax2)
-        ax2.set_title("Rata-rata Peminjaman Sepeda per Kondisi Cuaca")
-        ax2.set_xlabel("Kondisi Cuaca")
-        ax2.set_ylabel("Rata-rata Jumlah Peminjaman")
-        st.pyplot(fig2)
-    
-    # Visualisasi interaksi musim dan cuaca
-    st.subheader("Interaksi Musim dan Kondisi Cuaca")
-    season_weather_data = filtered_day_df.groupby(["season_name", "weathersit_name"])["cnt"].mean().reset_index()
-    fig3, ax3 = plt.subplots(figsize=(12, 6))
-    sns.barplot(x="season_name", y="cnt", hue="weathersit_name", data=season_weather_data, ax=ax3, order=["Spring", "Summer", "Fall", "Winter"])
-    ax3.set_title("Interaksi Musim dan Kondisi Cuaca terhadap Peminjaman Sepeda")
-    ax3.set_xlabel("Musim")
-    ax3.set_ylabel("Rata-rata Jumlah Peminjaman")
-    st.pyplot(fig3)
-
-with tab2:
-    # Tren peminjaman bulanan berdasarkan musim
-    st.subheader("Tren Peminjaman Sepeda Bulanan berdasarkan Musim")
-    monthly_season_data = filtered_day_df.groupby(['month', 'month_name', 'season_name'])['cnt'].mean().reset_index()
-    
-    fig4, ax4 = plt.subplots(figsize=(12, 6))
-    
-    for season in season_mapping.values():
-        season_data = monthly_season_data[monthly_season_data['season_name'] == season]
-        ax4.plot(season_data['month'], season_data['cnt'], marker='o', label=season)
-    
-    # Custom x-axis labels
-    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    ax4.set_xticks(range(1, 13))
-    ax4.set_xticklabels(month_names)
-    ax4.set_xlabel('Bulan')
-    ax4.set_ylabel('Rata-rata Jumlah Peminjaman')
-    ax4.set_title('Tren Peminjaman Sepeda Bulanan berdasarkan Musim')
-    ax4.legend()
-    ax4.grid(True, alpha=0.3)
-    
-    st.pyplot(fig4)
-    
-    # Tren peminjaman bulanan berdasarkan kondisi cuaca
-    st.subheader("Tren Peminjaman Sepeda Bulanan berdasarkan Kondisi Cuaca")
-    monthly_weather_data = filtered_day_df.groupby(['month', 'month_name', 'weathersit_name'])['cnt'].mean().reset_index()
-    
-    fig5, ax5 = plt.subplots(figsize=(12, 6))
-    
-    for weather in weather_options:
-        weather_data = monthly_weather_data[monthly_weather_data['weathersit_name'] == weather]
-        ax5.plot(weather_data['month'], weather_data['cnt'], marker='o', label=weather)
-    
-    ax5.set_xticks(range(1, 13))
-    ax5.set_xticklabels(month_names)
-    ax5.set_xlabel('Bulan')
-    ax5.set_ylabel('Rata-rata Jumlah Peminjaman')
-    ax5.set_title('Tren Peminjaman Sepeda Bulanan berdasarkan Kondisi Cuaca')
-    ax5.legend()
-    ax5.grid(True, alpha=0.3)
-    
-    st.pyplot(fig5)
-
-with tab3:
-    # Analisis pola harian
-    st.subheader("Pola Peminjaman Sepeda Berdasarkan Jam")
-    hourly_data = filtered_hour_df.groupby('hr')['cnt'].mean().reset_index()
-    
-    fig6, ax6 = plt.subplots(figsize=(12, 6))
-    sns.lineplot(x='hr', y='cnt', data=hourly_data, marker='o', ax=ax6)
-    ax6.set_title("Pola Peminjaman Sepeda Berdasarkan Jam")
-    ax6.set_xlabel("Jam")
-    ax6.set_ylabel("Rata-rata Jumlah Peminjaman")
-    ax6.grid(True, alpha=0.3)
-    
-    st.pyplot(fig6)
-    
-    # Heatmap jam dan hari
-    st.subheader("Heatmap Peminjaman Sepeda berdasarkan Jam dan Hari")
-    hour_weekday_data = filtered_hour_df.groupby(['hr', 'weekday'])['cnt'].mean().reset_index()
-    hour_weekday_pivot = hour_weekday_data.pivot(index='hr', columns='weekday', values='cnt')
-    
-    fig7, ax7 = plt.subplots(figsize=(12, 8))
-    sns.heatmap(
-        hour_weekday_pivot, 
-        cmap="viridis", 
-        ax=ax7,
-        cbar_kws={'label': 'Jumlah Peminjaman'}
-    )
-    ax7.set_title("Heatmap Peminjaman Sepeda berdasarkan Jam dan Hari")
-    ax7.set_xlabel("Hari")
-    ax7.set_ylabel("Jam")
-    ax7.set_xticklabels([weekday_mapping[i] for i in range(7)])
-    
-    st.pyplot(fig7)
-
-# Insight untuk pertanyaan 1
-st.markdown("""
-<div class="insight-header">Insight:</div>
-<div class="insight-content">
-<ul>
-    <li>Musim Gugur (Fall) menunjukkan jumlah peminjaman sepeda tertinggi, diikuti oleh Musim Panas (Summer).</li>
-    <li>Musim Semi (Spring) dan Musim Dingin (Winter) memiliki peminjaman lebih rendah.</li>
-    <li>Cuaca Cerah (Clear) konsisten menghasilkan peminjaman tertinggi, sementara peminjaman menurun signifikan pada cuaca buruk/hujan.</li>
-    <li>Bulan Mei hingga September (musim panas dan gugur) menunjukkan aktivitas tertinggi, sedangkan Januari-Februari terendah.</li>
-    <li>Terdapat dua puncak peminjaman harian: pagi hari (7-9) dan sore hari (17-19), menunjukkan pola komuter.</li>
-</ul>
-</div>
-""", unsafe_allow_html=True)
-
-# Pertanyaan 2
-st.markdown("---")
-st.header("Pertanyaan 2: Bagaimana perbedaan perilaku antara pengguna biasa (casual) dan pengguna terdaftar (registered) dalam peminjaman sepeda?")
-
-# Tab untuk berbagai visualisasi pertanyaan 2
-tab1, tab2, tab3 = st.tabs(["Perbandingan Total", "Pola Mingguan", "Analisis Segmen"])
-
-with tab1:
-    # Perbandingan total casual vs registered
-    st.subheader("Perbandingan Total Peminjaman Berdasarkan Tipe Pengguna")
-    total_casual = filtered_day_df['casual'].sum()
-    total_registered = filtered_day_df['registered'].sum()
-    
-    comparison_data = pd.DataFrame({
-        'Tipe Pengguna': ['Casual', 'Registered'],
-        'Jumlah Peminjaman': [total_casual, total_registered]
-    })
-    
-    fig8, ax8 = plt.subplots(figsize=(10, 6))
-    ax8.pie(
-        comparison_data['Jumlah Peminjaman'],
-        labels=comparison_data['Tipe Pengguna'],
-        autopct='%1.1f%%',
-        startangle=90,
-        colors=['#1f77b4', '#ff7f0e']
-    )
-    ax8.axis('equal')
-    ax8.set_title('Perbandingan Total Peminjaman Berdasarkan Tipe Pengguna')
-    
-    st.pyplot(fig8)
-    
-    # Tren peminjaman per musim
-    st.subheader("Perbandingan Peminjaman berdasarkan Musim dan Tipe Pengguna")
-    seasonal_user_data = filtered_day_df.groupby('season_name')[['casual', 'registered']].mean().reset_index()
-    seasonal_user_data_melted = seasonal_user_data.melt(
-        id_vars='season_name',
-        value_vars=['casual', 'registered'],
-        var_name='Tipe Pengguna',
-        value_name='Rata-rata Peminjaman'
-    )
-    
-    fig9, ax9 = plt.subplots(figsize=(12, 6))
-    sns.barplot(
-        x='season_name',
-        y='Rata-rata Peminjaman',
-        hue='Tipe Pengguna',
-        data=seasonal_user_data_melted,
-        ax=ax9,
-        order=["Spring", "Summer", "Fall", "Winter"]
-    )
-    ax9.set_title('Perbandingan Peminjaman berdasarkan Musim dan Tipe Pengguna')
-    ax9.set_xlabel('Musim')
-    ax9.set_ylabel('Rata-rata Jumlah Peminjaman')
-    
-    st.pyplot(fig9)
-
-with tab2:
-    # Pola peminjaman berdasarkan hari dalam seminggu
-    st.subheader("Pola Peminjaman Berdasarkan Hari dalam Seminggu")
-    weekday_data = filtered_day_df.groupby('weekday_name')[['casual', 'registered']].mean().reset_index()
-    weekday_data_melted = weekday_data.melt(
-        id_vars='weekday_name',
-        value_vars=['casual', 'registered'],
-        var_name='Tipe Pengguna',
-        value_name='Rata-rata Peminjaman'
-    )
-    
-    # Custom weekday order
-    weekday_order = ['Senin', 'Selasa', 'Rabu', 'Kamis', 'Jumat', 'Sabtu', 'Minggu']
-    weekday_data_melted['weekday_name'] = pd.Categorical(
-        weekday_data_melted['weekday_name'], 
-        categories=weekday_order, 
-        ordered=True
-    )
-    weekday_data_melted = weekday_data_melted.sort_values('weekday_name')
-    
-    fig10, ax10 = plt.subplots(figsize=(12, 6))
-    sns.barplot(
-        x='weekday_name',
-        y='Rata-rata Peminjaman',
-        hue='Tipe Pengguna',
-        data=weekday_data_melted,
-        ax=ax10
-    )
-    ax10.set_title('Pola Peminjaman Berdasarkan Hari dalam Seminggu')
-    ax10.set_xlabel('Hari')
-    ax10.set_ylabel('Rata-rata Jumlah Peminjaman')
-    
-    st.pyplot(fig10)
-    
-    # Pola peminjaman berdasarkan jam
-    st.subheader("Pola Peminjaman Berdasarkan Jam dan Tipe Pengguna")
-    hourly_user_data = filtered_hour_df.groupby('hr')[['casual', 'registered']].mean().reset_index()
-    hourly_user_data_melted = hourly_user_data.melt(
-        id_vars='hr',
-        value_vars=['casual', 'registered'],
-        var_name='Tipe Pengguna',
-        value_name='Rata-rata Peminjaman'
-    )
-    
-    fig11, ax11 = plt.subplots(figsize=(12, 6))
-    sns.lineplot(
-        x='hr',
-        y='Rata-rata Peminjaman',
-        hue='Tipe Pengguna',
-        data=hourly_user_data_melted,
-        marker='o',
-        ax=ax11
-    )
-    ax11.set_title('Pola Peminjaman Berdasarkan Jam dan Tipe Pengguna')
-    ax11.set_xlabel('Jam')
-    ax11.set_ylabel('Rata-rata Jumlah Peminjaman')
-    ax11.grid(True, alpha=0.3)
-    
-    st.pyplot(fig11)
-
-with tab3:
-    # Analisis segmentasi pengguna
-    st.subheader("Visualisasi segmentasi pengguna")
-    
-    # Analisis workingday vs holiday untuk casual/registered
-    st.subheader("Peminjaman Berdasarkan Tipe Hari dan Tipe Pengguna")
-    workingday_data = filtered_day_df.groupby(['workingday'])[['casual', 'registered']].mean().reset_index()
-    workingday_data['workingday'] = workingday_data['workingday'].map({0: 'Libur/Akhir Pekan', 1: 'Hari Kerja'})
-    workingday_data_melted = workingday_data.melt(
-        id_vars='workingday',
-        value_vars=['casual', 'registered'],
-        var_name='Tipe Pengguna',
-        value_name='Rata-rata Peminjaman'
-    )
-    
-    fig12, ax12 = plt.subplots(figsize=(10, 6))
-    sns.barplot(
-        x='workingday',
-        y='Rata-rata Peminjaman',
-        hue='Tipe Pengguna',
-        data=workingday_data_melted,
-        ax=ax12
-    )
-    ax12.set_title('Peminjaman Berdasarkan Tipe Hari dan Tipe Pengguna')
-    ax12.set_xlabel('Tipe Hari')
-    ax12.set_ylabel('Rata-rata Jumlah Peminjaman')
-    
-    st.pyplot(fig12)
-    
-    # Proporsi casual vs registered berdasarkan kondisi cuaca
-    st.subheader("Pengaruh Kondisi Cuaca terhadap Tipe Pengguna")
-    weather_user_data = filtered_day_df.groupby('weathersit_name')[['casual', 'registered']].mean().reset_index()
-    weather_user_data_melted = weather_user_data.melt(
-        id_vars='weathersit_name',
-        value_vars=['casual', 'registered'],
-        var_name='Tipe Pengguna',
-        value_name='Rata-rata Peminjaman'
-    )
-    
-    fig13, ax13 = plt.subplots(figsize=(12, 6))
-    sns.barplot(
-        x='weathersit_name',
-        y='Rata-rata Peminjaman',
-        hue='Tipe Pengguna',
-        data=weather_user_data_melted,
-        ax=ax13
-    )
-    ax13.set_title('Pengaruh Kondisi Cuaca terhadap Tipe Pengguna')
-    ax13.set_xlabel('Kondisi Cuaca')
-    ax13.set_ylabel('Rata-rata Jumlah Peminjaman')
-    
-    st.pyplot(fig13)
-
-# Insight untuk pertanyaan 2
-st.markdown("""
-<div class="insight-header">Insight:</div>
-<div class="insight-content">
-<ul>
-    <li>Pengguna registered mendominasi total peminjaman dengan pola penggunaan yang lebih konsisten sepanjang tahun.</li>
-    <li>Pengguna casual menunjukkan peningkatan signifikan pada akhir pekan, sementara registered lebih stabil pada hari kerja.</li>
-    <li>Pola harian registered menunjukkan dua puncak (pagi dan sore) yang mencerminkan pola komuter, sementara casual memiliki puncak tunggal di siang hingga sore hari.</li>
-    <li>Cuaca memiliki dampak lebih besar pada pengguna casual dibandingkan registered, dengan penurunan lebih tajam saat cuaca buruk.</li>
-    <li>Hari libur dan akhir pekan menunjukkan peningkatan peminjaman casual sebesar 2x lipat, sementara registered cenderung menurun.</li>
-</ul>
-</div>
-""", unsafe_allow_html=True)
-
-# Kesimpulan dan rekomendasi
-st.markdown("---")
-st.header("Kesimpulan dan Rekomendasi")
-
-# Kesimpulan
-st.markdown("""
-<div class="conclusion-box">
-<h3>Kesimpulan:</h3>
-<p>Peminjaman sepeda mencapai puncak pada musim gugur (211.53) dan musim panas (189.46), dengan penurunan signifikan pada musim semi (108.41) dan musim dingin (180.87). Cuaca cerah konsisten menghasilkan peminjaman tertinggi (185.31), sementara cuaca mendung (162.06) dan hujan (106.05) mengurangi jumlah peminjaman secara bertahap. Bulan Mei-September menunjukkan aktivitas tertinggi, sedangkan Januari-Februari terendah. Faktor cuaca memiliki dampak lebih besar pada musim dingin, dengan penurunan ekstrem saat hujan.</p>
-
-<p>Pengguna registered mendominasi total peminjaman dengan pola penggunaan yang lebih konsisten sepanjang tahun dan lebih stabil pada hari kerja, menunjukkan penggunaan untuk komuter rutin. Pengguna casual menunjukkan fluktuasi lebih ekstrem berdasarkan musim, meningkat pada akhir pekan dan menurun drastis saat musim dingin atau cuaca buruk, mengindikasikan penggunaan rekreasional. Analisis pola menunjukkan sebagian besar pengguna termasuk kategori aktif, dengan perbedaan waktu penggunaan yang jelas antara kedua segmen.</p>
-</div>
-""", unsafe_allow_html=True)
-
-# Rekomendasi
-st.markdown("""
-<div class="recommendation-box">
-<h3>Rekomendasi:</h3>
-<h4>1. Strategi Marketing:</h4>
-<ul>
-    <li>Meningkatkan promosi untuk mengkonversi pengguna casual menjadi registered dengan penawaran khusus pada akhir musim semi.</li>
-    <li>Membuat "Weekend Pass" dengan insentif khusus untuk pengguna casual yang sering bersepeda pada akhir pekan.</li>
-    <li>Program loyalitas musiman dengan diskon untuk pengguna registered selama musim dingin dan cuaca buruk.</li>
-</ul>
-
-<h4>2. Manajemen Operasional:</h4>
-<ul>
-    <li>Distribusi sepeda berbasis lokasi dan waktu - fokus pada area perkantoran pagi/sore hari dan area rekreasi siang/akhir pekan.</li>
-    <li>Mengurangi armada beroperasi saat cuaca buruk dan mengalokasikan untuk pemeliharaan.</li>
-    <li>Meningkatkan ketersediaan sepeda di area transit pada jam puncak pengguna registered (7-9 pagi, 17-19 sore).</li>
-</ul>
-
-<h4>3. Pengembangan Produk:</h4>
-<ul>
-    <li>Penambahan fitur perlindungan cuaca sederhana pada sepeda untuk meminimalkan dampak cuaca mendung/hujan ringan.</li>
-    <li>Pengembangan paket langganan fleksibel untuk casual users dengan opsi penggunaan akhir pekan.</li>
-    <li>Implementasi teknologi untuk memudahkan transisi dari pengguna casual ke registered, seperti upgrade membership langsung dari aplikasi.</li>
-</ul>
-</div>
-""", unsafe_allow_html=True)
-
-# Footer
-st.markdown("---")
-st.caption("© 2025 Bike Sharing Analysis Project | MC185D5X0359")
\ No newline at end of file
+import time
+
+# Titik awal pengukuran waktu sampai metrik pertama tampil (mark "first_metric")
+SCRIPT_START = time.perf_counter()
+
+import datetime
+import json
+import os
+
+import streamlit as st
+
+from bikeshare.analysis import filter_cubes, load_cubes, overview, read_summary, summarize, write_summary
+from bikeshare.approx import DAY_STRATA, HOUR_STRATA, MAX_ERROR, max_relative_error, stratified_sample, use_sample
+from bikeshare.cache import ResultCache, freeze
+from bikeshare.charts import CHARTS, make_figure, render
+from bikeshare.filters import FilterState, normalize_filter, select
+from bikeshare.forecast import artifact_version, climatology, forecast, last_date, load
+from bikeshare.ingest import load_sample
+from bikeshare.instrument import MetricsStore, make_profiler, serve_metrics
+from bikeshare.labels import season_mapping, weathersit_mapping
+from bikeshare.loader import data_version, source_path
+from bikeshare.parallel import make_executor, run_all
+from bikeshare.partitions import date_range, discover, load_partitions, normalize_locations, partition_version, prune
+from bikeshare.quality import CHECKS, issue_count, read_reports
+from bikeshare.vega import encode, make_spec
+
+# Set page configuration
+st.set_page_config(
+    page_title="Bike Sharing Dashboard",
+    page_icon="🚲",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Custom CSS untuk tampilan yang lebih minimalis dengan perbaikan warna insight
+st.markdown("""
+<style>
+    .main .block-container {
+        padding-top: 2rem;
+        padding-bottom: 2rem;
+    }
+    .st-emotion-cache-16txtl3 h1 {
+        font-weight: 700;
+        margin-bottom: 1rem;
+    }
+    .st-emotion-cache-10trblm {
+        margin-bottom: 1rem;
+    }
+    .insight-box {
+        background-color: #f8f9fa;
+        border-left: 4px solid #4e78a8;
+        padding: 1rem;
+        border-radius: 0.3rem;
+        margin: 1rem 0;
+        color: #333333;  /* Warna teks gelap untuk memastikan terlihat */
+    }
+    .conclusion-box {
+        background-color: #f0f7ff;
+        border-left: 4px solid #3366cc;
+        padding: 1rem;
+        border-radius: 0.3rem;
+        margin: 1rem 0;
+        color: #333333;  /* Warna teks gelap */
+    }
+    .recommendation-box {
+        background-color: #f0fff7;
+        border-left: 4px solid #33cc99;
+        padding: 1rem;
+        border-radius: 0.3rem;
+        margin: 1rem 0;
+        color: #333333;  /* Warna teks gelap */
+    }
+    /* Tambahan style untuk insight header */
+    .insight-header {
+        background-color: #4e78a8;
+        color: white;
+        padding: 0.5rem 1rem;
+        border-radius: 0.3rem 0.3rem 0 0;
+        margin-bottom: 0;
+        font-weight: bold;
+    }
+    /* Style tambahan untuk text di dalam insight */
+    .insight-content {
+        background-color: #f8f9fa;
+        padding: 1rem;
+        border-radius: 0 0 0.3rem 0.3rem;
+        color: #333333;
+    }
+</style>
+""", unsafe_allow_html=True)
+
+# Instrumentasi opsional: aktif dengan BIKESHARE_PROFILE=1/timing atau ?debug=1
+@st.cache_resource
+def get_metrics_store():
+    store = MetricsStore()
+    port = os.environ.get("BIKESHARE_METRICS_PORT")
+    if port:
+        serve_metrics(store, int(port))
+    return store
+
+metrics_store = get_metrics_store()
+# tracemalloc memperlambat semua sesi, jadi hanya boleh diaktifkan operator lewat env;
+# BIKESHARE_PROFILE=timing mencatat waktu dan mark saja (dipakai benchmark startup)
+profile_mode = os.environ.get("BIKESHARE_PROFILE")
+trace_memory = profile_mode == "1"
+profiling = profile_mode in ("1", "timing") or st.query_params.get("debug") == "1"
+# Rerun yang terputus (st.rerun, st.stop, exception) tidak sampai ke finish();
+# profilernya ditutup di sini agar tracemalloc tidak tertinggal aktif
+stale_profiler = st.session_state.pop("profiler", None)
+if stale_profiler is not None:
+    stale_profiler.close()
+profiler = make_profiler(profiling, start=SCRIPT_START, trace_memory=trace_memory)
+st.session_state["profiler"] = profiler
+
+# Thread pool agregasi, dipakai bersama semua sesi (BIKESHARE_WORKERS)
+@st.cache_resource
+def get_executor():
+    return make_executor()
+
+executor = get_executor()
+
+# Dataset terpartisi per kota/stasiun/bulan (jika ada); cukup listing direktori
+@st.cache_data(ttl=60)
+def list_partitions():
+    return discover()
+
+partitions = list_partitions()
+
+# Load data; versi data ikut menjadi kunci cache sehingga record yang
+# baru di-append terbaca tanpa membersihkan cache secara manual.
+# cache_resource: kubus dibagikan read-only ke semua sesi tanpa disalin.
+@st.cache_resource(max_entries=8)
+def load_data(version, selection=None):
+    if selection is not None:
+        # Mode terpartisi: hanya kubus partisi terpilih yang dibaca dan digabung
+        day_cube, hour_cube = load_partitions(selection, executor)
+    else:
+        # Kubus agregasi dari cache kolumnar lokal; GitHub hanya fallback jika CSV tidak ada.
+        # Semua grafik dijawab dengan roll-up atas kubus ini.
+        day_cube, hour_cube = load_cubes(allow_remote=True)
+    
+    # Sampel berstrata untuk mode perkiraan, hanya untuk kubus yang besar. Data lokal
+    # memakai sampel tersimpan (dipelihara mode append); kubus gabungan partisi ditarik di sini
+    if selection is not None:
+        samples = {
+            "day": stratified_sample(day_cube, DAY_STRATA) if use_sample(day_cube) else None,
+            "hour": stratified_sample(hour_cube, HOUR_STRATA) if use_sample(hour_cube) else None,
+        }
+    else:
+        samples = {"day": load_sample("day", day_cube, DAY_STRATA), "hour": load_sample("hour", hour_cube, HOUR_STRATA)}
+    return freeze(day_cube), freeze(hour_cube), {name: freeze(sample) for name, sample in samples.items()}
+
+# Laporan kualitas data dibangun oleh CLI dan mode append; dashboard hanya
+# membaca file kecilnya selama masih cocok dengan CSV
+@st.cache_resource(max_entries=2)
+def load_quality(version):
+    return read_reports()
+
+if not partitions:
+    # Rentang tanggal dan metrik tanpa filter dibaca dari ringkasan kecil,
+    # sehingga sidebar dan metrik pertama tampil sebelum kubus dimuat
+    version = data_version()
+    summary = read_summary(version)
+    if summary is None:
+        with profiler.span("load_data"):
+            summary = write_summary(version, summarize(load_data(version)[0]))
+    data_start, data_end = summary["start"], summary["end"]
+else:
+    summary = None
+
+# Cache hasil agregasi dan grafik ter-render, dipakai bersama semua sesi dalam satu proses
+@st.cache_resource
+def get_result_cache():
+    return ResultCache(max_bytes=int(os.environ.get("BIKESHARE_RESULT_CACHE_MB", "64")) * 1024 * 1024)
+
+@st.cache_resource
+def get_figure_cache():
+    return ResultCache(max_bytes=int(os.environ.get("BIKESHARE_FIGURE_CACHE_MB", "64")) * 1024 * 1024)
+
+result_cache = get_result_cache()
+figure_cache = get_figure_cache()
+
+# Sidebar
+with st.sidebar:
+    st.title("Bike Sharing Analysis")
+    
+    st.subheader("Filter Data")
+    
+    if partitions:
+        # Filter lokasi: partisi kota/stasiun yang tidak dipilih tidak dibaca sama sekali
+        selected_cities = st.multiselect("Kota",
+                                         options=sorted({p.city for p in partitions}),
+                                         placeholder="Semua kota")
+        station_options = sorted({(p.city, p.station) for p in prune(partitions, selected_cities or None)})
+        selected_stations = st.multiselect("Stasiun",
+                                           options=station_options,
+                                           format_func=lambda station: f"{station[1]} ({station[0]})",
+                                           placeholder="Semua stasiun")
+        locations = normalize_locations(selected_cities, selected_stations)
+        data_start, data_end = date_range(prune(partitions, *locations))
+    
+    # Date filter
+    col1, col2 = st.columns(2)
+    with col1:
+        start_date = st.date_input("Tanggal Mulai", data_start)
+    with col2:
+        end_date = st.date_input("Tanggal Akhir", data_end)
+    
+    # Season filter
+    season_options = list(season_mapping.values())
+    selected_seasons = st.multiselect("Musim", 
+                                     options=season_options,
+                                     default=season_options)
+    
+    # Weather filter
+    weather_options = list(weathersit_mapping.values())
+    selected_weather = st.multiselect("Kondisi Cuaca", 
+                                     options=weather_options,
+                                     default=weather_options)
+    
+    # Mode lazy: hanya tab yang sedang dibuka yang dihitung dan di-render
+    lazy_tabs = st.toggle("Render hanya tab yang dibuka", value=True)
+    
+    # Mode perkiraan: rentang besar dijawab dari sampel berstrata
+    approximate = st.toggle("Mode perkiraan untuk rentang besar", value=True)
+    
+    # Backend interaktif: hanya seri teragregasi yang dikirim, digambar di browser
+    interactive_charts = st.radio(
+        "Backend grafik", ["Matplotlib (PNG)", "Interaktif (Vega-Lite)"]
+    ) == "Interaktif (Vega-Lite)"
+    
+    # About section
+    st.markdown("---")
+    st.caption("Dibuat oleh: Fenia Kerenina br Surbakti")
+    st.caption("ID Dicoding: MC185D5X0359")
+
+# Filter data berdasarkan input; state ternormalisasi menjadi kunci cache bersama
+filter_state = normalize_filter(
+    start_date,
+    end_date,
+    [code for code, name in season_mapping.items() if name in selected_seasons],
+    [code for code, name in weathersit_mapping.items() if name in selected_weather],
+    min_date=data_start,
+    max_date=data_end,
+)
+
+# Main content
+st.title("🚲 Bike Sharing Analysis Dashboard")
+st.markdown("Dashboard untuk menganalisis pola peminjaman sepeda berdasarkan musim, cuaca, dan jenis pengguna.")
+
+# Metrics overview
+st.subheader("Overview")
+overview_container = st.container()
+
+def show_overview(metrics):
+    with overview_container:
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Total Peminjaman", f"{metrics['cnt']:,}")
+        with col2:
+            st.metric("Rata-rata Harian", f"{metrics['mean']:.1f}")
+        with col3:
+            st.metric("Pengguna Casual", f"{metrics['casual']:,}")
+        with col4:
+            st.metric("Pengguna Registered", f"{metrics['registered']:,}")
+    profiler.mark("first_metric")
+
+# Tanpa filter, metrik langsung diambil dari ringkasan
+overview_from_summary = summary is not None and filter_state == FilterState()
+if overview_from_summary:
+    show_overview(summary["overview"])
+
+with profiler.span("load_data"):
+    if partitions:
+        # Partisi dipangkas menurut lokasi dan bulan yang beririsan dengan rentang tanggal
+        selection = tuple(prune(partitions, *locations, filter_state.start, filter_state.end))
+        quality = {}
+        version = partition_version(selection)
+        day_cube, hour_cube, samples = load_data(version, selection)
+        profiler.count("partitions.read", len(selection))
+    else:
+        day_cube, hour_cube, samples = load_data(version)
+        # Tanpa CSV lokal (data dari GitHub) tidak ada laporan
+        quality = {name: report for name, report in load_quality(version).items() if report is not None}
+
+with profiler.span("filter"):
+    filtered_day_cube, filtered_hour_cube = filter_cubes(day_cube, hour_cube, filter_state)
+    
+    # Potongan besar dijawab dari sampel selama galatnya dalam target; selain itu dihitung eksak
+    approximated, errors, exact = (), {}, []
+    if approximate:
+        for name, filtered, by in (("day", filtered_day_cube, ["season", "weathersit"]),
+                                   ("hour", filtered_hour_cube, ["hr", "weekday"])):
+            if samples[name] is None or not use_sample(filtered):
+                continue
+            sampled = select(samples[name], *filter_state)
+            # Batas galat 95% terbesar untuk rata-rata per kelompok grafik
+            error = result_cache.get_or_compute(("approx_error", name, version, *filter_state),
+                                                lambda: max_relative_error(sampled, by))
+            if error > MAX_ERROR:
+                exact.append(name)
+                continue
+            errors[name] = error
+            approximated += (name,)
+            if name == "day":
+                filtered_day_cube = sampled
+            else:
+                filtered_hour_cube = sampled
+
+filter_key = (version, approximated, *filter_state)
+
+with profiler.span("overview"):
+    if not overview_from_summary:
+        show_overview(result_cache.get_or_compute(("overview", *filter_key), lambda: overview(filtered_day_cube)))
+    
+    notes = []
+    if "day" in errors:
+        notes.append(f"data harian dari {len(filtered_day_cube):,} baris sampel "
+                     f"(galat rata-rata per musim×cuaca maks ±{errors['day']:.1%})")
+    if "hour" in errors:
+        notes.append(f"data per jam dari {len(filtered_hour_cube):,} baris sampel "
+                     f"(galat rata-rata per jam×hari maks ±{errors['hour']:.1%})")
+    if notes:
+        overview_container.caption("Mode perkiraan: " + "; ".join(notes) + ", interval kepercayaan 95%.")
+    if exact:
+        overview_container.caption(
+            f"Mode perkiraan: galat sampel melampaui target ±{MAX_ERROR:.0%}, data "
+            + " dan ".join("harian" if name == "day" else "per jam" for name in exact) + " dihitung eksak.")
+
+def query_chart(chart_id):
+    return result_cache.get_or_compute(
+        ("query", chart_id, *filter_key),
+        lambda: CHARTS[chart_id].query(filtered_day_cube, filtered_hour_cube),
+    )
+
+def show_chart(chart_id):
+    st.subheader(CHARTS[chart_id].title)
+    backend = "vega" if interactive_charts else "png"
+    key = (chart_id, backend, *filter_key)
+    with profiler.span(f"chart:{chart_id}"):
+        payload = figure_cache.get(key)
+        if payload is None:
+            profiler.count("figure_cache.miss")
+            with profiler.span(f"query:{chart_id}"):
+                data = query_chart(chart_id)
+            with profiler.span(f"render:{chart_id}"):
+                if interactive_charts:
+                    payload = encode(make_spec(chart_id, data))
+                else:
+                    payload = render(make_figure(chart_id, data))
+            figure_cache.put(key, payload)
+        else:
+            profiler.count("figure_cache.hit")
+        profiler.count(f"bytes.{backend}", len(payload))
+        if interactive_charts:
+            st.vega_lite_chart(json.loads(payload), use_container_width=True)
+        else:
+            st.image(payload, use_container_width=True)
+
+# Grafik yang ditampilkan setiap tab, per kelompok tab
+TAB_CHARTS = {
+    "tabs_q1": {
+        "Peminjaman per Musim & Cuaca": ["season", "weather", "season_weather"],
+        "Tren Bulanan": ["monthly_season", "monthly_weather"],
+        "Pola Peminjaman Harian": ["hourly", "hour_weekday"],
+    },
+    "tabs_q2": {
+        "Perbandingan Total": ["user_share", "season_user"],
+        "Pola Mingguan": ["weekday_user", "hourly_user"],
+        "Analisis Segmen": ["workingday_user", "weather_user"],
+    },
+}
+
+def planned_charts():
+    # Grafik yang akan tampil pada rerun ini: tab terpilih (mode lazy) atau semua tab
+    planned = []
+    for key, tabs in TAB_CHARTS.items():
+        labels = [st.session_state.get(key, next(iter(tabs)))] if lazy_tabs else tabs
+        for label in labels:
+            planned.extend(tabs.get(label, []))
+    return planned
+
+def prefetch_charts():
+    # Agregasi yang belum punya figure ter-cache dihitung paralel di awal,
+    # semuanya membaca kubus terfilter yang sama
+    backend = "vega" if interactive_charts else "png"
+    missing = [chart_id for chart_id in planned_charts()
+               if (chart_id, backend, *filter_key) not in figure_cache]
+    profiler.count("prefetch.queries", len(missing))
+    run_all({chart_id: (lambda chart_id=chart_id: query_chart(chart_id)) for chart_id in missing}, executor)
+
+def render_tabs(tabs, key):
+    # st.tabs selalu menjalankan isi semua tab; pada mode lazy tab dipilih
+    # dengan radio sehingga hanya isi tab terpilih yang dijalankan
+    labels = list(TAB_CHARTS[key])
+    if lazy_tabs:
+        selected = st.radio("Tab", labels, horizontal=True, key=key, label_visibility="collapsed")
+        tabs[selected]()
+    else:
+        for container, label in zip(st.tabs(labels), labels):
+            with container:
+                tabs[label]()
+
+with profiler.span("prefetch"):
+    prefetch_charts()
+
+# Kualitas data: temuan validasi saat ingest (data hanya ditandai, tidak diubah)
+if quality:
+    with st.expander(f"Kualitas Data: {sum(issue_count(report) for report in quality.values()):,} temuan"):
+        st.dataframe(
+            [{"Pemeriksaan": label, **{f"{name}.csv": report["checks"][check]["count"]
+                                       for name, report in quality.items()}}
+             for check, label in CHECKS.items()],
+            use_container_width=True,
+            hide_index=True,
+        )
+        st.caption("Jam yang hilang tidak ikut dihitung dalam rata-rata per jam; "
+                   "outlier dibandingkan dengan minggu-minggu sebelumnya pada jam dan hari yang sama.")
+        for name, report in quality.items():
+            for check, result in report["checks"].items():
+                if result["examples"]:
+                    st.caption(f"{name}.csv, {CHECKS[check]} (contoh)")
+                    st.dataframe(result["examples"], use_container_width=True, hide_index=True)
+
+# Pertanyaan 1
+st.markdown("---")
+st.header("Pertanyaan 1: Bagaimana pola peminjaman sepeda berubah berdasarkan musim dan kondisi cuaca?")
+
+# Tab untuk berbagai visualisasi pertanyaan 1
+def q1_season_weather():
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Visualisasi musim
+        show_chart("season")
+
+    with col2:
+        # Visualisasi kondisi cuaca
+        show_chart("weather")
+    
+    # Visualisasi interaksi musim dan cuaca
+    show_chart("season_weather")
+
+def q1_monthly():
+    # Tren peminjaman bulanan berdasarkan musim
+    show_chart("monthly_season")
+    
+    # Tren peminjaman bulanan berdasarkan kondisi cuaca
+    show_chart("monthly_weather")
+
+def q1_hourly():
+    # Analisis pola harian
+    show_chart("hourly")
+    
+    # Heatmap jam dan hari
+    show_chart("hour_weekday")
+
+render_tabs({
+    "Peminjaman per Musim & Cuaca": q1_season_weather,
+    "Tren Bulanan": q1_monthly,
+    "Pola Peminjaman Harian": q1_hourly,
+}, key="tabs_q1")
+
+# Insight untuk pertanyaan 1
+st.markdown("""
+<div class="insight-header">Insight:</div>
+<div class="insight-content">
+<ul>
+    <li>Musim Gugur (Fall) menunjukkan jumlah peminjaman sepeda tertinggi, diikuti oleh Musim Panas (Summer).</li>
+    <li>Musim Semi (Spring) dan Musim Dingin (Winter) memiliki peminjaman lebih rendah.</li>
+    <li>Cuaca Cerah (Clear) konsisten menghasilkan peminjaman tertinggi, sementara peminjaman menurun signifikan pada cuaca buruk/hujan.</li>
+    <li>Bulan Mei hingga September (musim panas dan gugur) menunjukkan aktivitas tertinggi, sedangkan Januari-Februari terendah.</li>
+    <li>Terdapat dua puncak peminjaman harian: pagi hari (7-9) dan sore hari (17-19), menunjukkan pola komuter.</li>
+</ul>
+</div>
+""", unsafe_allow_html=True)
+
+# Pertanyaan 2
+st.markdown("---")
+st.header("Pertanyaan 2: Bagaimana perbedaan perilaku antara pengguna biasa (casual) dan pengguna terdaftar (registered) dalam peminjaman sepeda?")
+
+# Tab untuk berbagai visualisasi pertanyaan 2
+def q2_totals():
+    # Perbandingan total casual vs registered
+    show_chart("user_share")
+    
+    # Tren peminjaman per musim
+    show_chart("season_user")
+
+def q2_weekly():
+    # Pola peminjaman berdasarkan hari dalam seminggu
+    show_chart("weekday_user")
+    
+    # Pola peminjaman berdasarkan jam
+    show_chart("hourly_user")
+
+def q2_segments():
+    # Analisis segmentasi pengguna
+    st.subheader("Visualisasi segmentasi pengguna")
+    
+    # Analisis workingday vs holiday untuk casual/registered
+    show_chart("workingday_user")
+    
+    # Proporsi casual vs registered berdasarkan kondisi cuaca
+    show_chart("weather_user")
+
+render_tabs({
+    "Perbandingan Total": q2_totals,
+    "Pola Mingguan": q2_weekly,
+    "Analisis Segmen": q2_segments,
+}, key="tabs_q2")
+
+# Insight untuk pertanyaan 2
+st.markdown("""
+<div class="insight-header">Insight:</div>
+<div class="insight-content">
+<ul>
+    <li>Pengguna registered mendominasi total peminjaman dengan pola penggunaan yang lebih konsisten sepanjang tahun.</li>
+    <li>Pengguna casual menunjukkan peningkatan signifikan pada akhir pekan, sementara registered lebih stabil pada hari kerja.</li>
+    <li>Pola harian registered menunjukkan dua puncak (pagi dan sore) yang mencerminkan pola komuter, sementara casual memiliki puncak tunggal di siang hingga sore hari.</li>
+    <li>Cuaca memiliki dampak lebih besar pada pengguna casual dibandingkan registered, dengan penurunan lebih tajam saat cuaca buruk.</li>
+    <li>Hari libur dan akhir pekan menunjukkan peningkatan peminjaman casual sebesar 2x lipat, sementara registered cenderung menurun.</li>
+</ul>
+</div>
+""", unsafe_allow_html=True)
+
+# Prakiraan permintaan untuk rebalancing
+# Artefak model hanya dimuat; pelatihan lewat `python -m bikeshare.forecast --train` atau mode append
+@st.cache_resource(max_entries=1)
+def load_forecaster(version):
+    model = load()
+    return (model, climatology(model)) if model is not None else (None, None)
+
+forecast_version = artifact_version()
+model, typical_weather = load_forecaster(forecast_version)
+if model is not None and source_path("hour").exists():
+    st.markdown("---")
+    st.header("Prakiraan Permintaan per Jam")
+
+    with profiler.span("forecast"):
+        horizon = st.radio("Horizon", ["24 jam ke depan", "7 hari ke depan"], horizontal=True)
+        hours = 24 if horizon == "24 jam ke depan" else 24 * 7
+        forecast_start = last_date(model) + datetime.timedelta(days=1)
+        prediction = result_cache.get_or_compute(
+            ("forecast", hours, forecast_start, forecast_version),
+            lambda: forecast(model, forecast_start, hours, typical_weather).set_index("timestamp"),
+        )
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Prakiraan Total", f"{prediction['cnt'].sum():,.0f}")
+        with col2:
+            st.metric("Prakiraan Casual", f"{prediction['casual'].sum():,.0f}")
+        with col3:
+            st.metric("Prakiraan Registered", f"{prediction['registered'].sum():,.0f}")
+        st.line_chart(prediction[["cnt", "casual", "registered"]])
+        st.caption(f"Mulai {forecast_start:%d %B %Y}, sehari setelah data latih terakhir. Cuaca memakai "
+                   "rata-rata historis per bulan dan jam; hari libur tidak diperhitungkan.")
+
+# Kesimpulan dan rekomendasi
+st.markdown("---")
+st.header("Kesimpulan dan Rekomendasi")
+
+# Kesimpulan
+st.markdown("""
+<div class="conclusion-box">
+<h3>Kesimpulan:</h3>
+<p>Peminjaman sepeda mencapai puncak pada musim gugur (211.53) dan musim panas (189.46), dengan penurunan signifikan pada musim semi (108.41) dan musim dingin (180.87). Cuaca cerah konsisten menghasilkan peminjaman tertinggi (185.31), sementara cuaca mendung (162.06) dan hujan (106.05) mengurangi jumlah peminjaman secara bertahap. Bulan Mei-September menunjukkan aktivitas tertinggi, sedangkan Januari-Februari terendah. Faktor cuaca memiliki dampak lebih besar pada musim dingin, dengan penurunan ekstrem saat hujan.</p>
+
+<p>Pengguna registered mendominasi total peminjaman dengan pola penggunaan yang lebih konsisten sepanjang tahun dan lebih stabil pada hari kerja, menunjukkan penggunaan untuk komuter rutin. Pengguna casual menunjukkan fluktuasi lebih ekstrem berdasarkan musim, meningkat pada akhir pekan dan menurun drastis saat musim dingin atau cuaca buruk, mengindikasikan penggunaan rekreasional. Analisis pola menunjukkan sebagian besar pengguna termasuk kategori aktif, dengan perbedaan waktu penggunaan yang jelas antara kedua segmen.</p>
+</div>
+""", unsafe_allow_html=True)
+
+# Rekomendasi
+st.markdown("""
+<div class="recommendation-box">
+<h3>Rekomendasi:</h3>
+<h4>1. Strategi Marketing:</h4>
+<ul>
+    <li>Meningkatkan promosi untuk mengkonversi pengguna casual menjadi registered dengan penawaran khusus pada akhir musim semi.</li>
+    <li>Membuat "Weekend Pass" dengan insentif khusus untuk pengguna casual yang sering bersepeda pada akhir pekan.</li>
+    <li>Program loyalitas musiman dengan diskon untuk pengguna registered selama musim dingin dan cuaca buruk.</li>
+</ul>
+
+<h4>2. Manajemen Operasional:</h4>
+<ul>
+    <li>Distribusi sepeda berbasis lokasi dan waktu - fokus pada area perkantoran pagi/sore hari dan area rekreasi siang/akhir pekan.</li>
+    <li>Mengurangi armada beroperasi saat cuaca buruk dan mengalokasikan untuk pemeliharaan.</li>
+    <li>Meningkatkan ketersediaan sepeda di area transit pada jam puncak pengguna registered (7-9 pagi, 17-19 sore).</li>
+</ul>
+
+<h4>3. Pengembangan Produk:</h4>
+<ul>
+    <li>Penambahan fitur perlindungan cuaca sederhana pada sepeda untuk meminimalkan dampak cuaca mendung/hujan ringan.</li>
+    <li>Pengembangan paket langganan fleksibel untuk casual users dengan opsi penggunaan akhir pekan.</li>
+    <li>Implementasi teknologi untuk memudahkan transisi dari pengguna casual ke registered, seperti upgrade membership langsung dari aplikasi.</li>
+</ul>
+</div>
+""", unsafe_allow_html=True)
+
+# Footer
+st.markdown("---")
+st.caption("© 2025 Bike Sharing Analysis Project | MC185D5X0359")
+
+# Panel debug: metrik rerun ini (hanya saat profiling aktif)
+record = profiler.finish()
+del st.session_state["profiler"]
+if record is not None:
+    metrics_store.add(record)
+    with st.sidebar.expander("Debug: Profiling", expanded=True):
+        peak, rss_delta = record["peak_bytes"], record["rss_delta_bytes"]
+        first_metric = record["marks"].get("first_metric")
+        st.caption(f"Total rerun: {record['total_seconds'] * 1000:.1f} ms"
+                   + (f" | Metrik pertama: {first_metric * 1000:.1f} ms" if first_metric is not None else "")
+                   + (f" | Memori puncak: {peak / 2**20:.1f} MiB" if peak is not None else "")
+                   + (f" | Selisih RSS: {rss_delta / 2**20:+.1f} MiB" if rss_delta is not None else ""))
+        st.dataframe(
+            [{"Tahap": span["name"], "ms": round(span["seconds"] * 1000, 2)} for span in record["spans"]],
+            use_container_width=True,
+            hide_index=True,
+        )
+        st.json(record["counters"])
+        st.json({"result_cache": result_cache.stats(), "figure_cache": figure_cache.stats()})
\ No newline at end of file